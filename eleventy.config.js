@@ -1,3 +1,5 @@
+const crypto = require('crypto');
+const fs = require('fs');
 const path = require('path');
 
 const Image = require('@11ty/eleventy-img');
@@ -13,6 +15,51 @@ const { formatInTimeZone } = require('date-fns-tz');
 const siteConfig = require('./src/_data/site.json');
 const timezone = siteConfig.timezone || 'UTC'; // Default to 'UTC' if not specified
 
+// Written by `python tools/process.py build-images`, which encodes the photos
+// ahead of time. Anything missing or out of date goes through eleventy-img.
+let imageManifest = { images: {} };
+try {
+  imageManifest = require('./src/_data/imageManifest.json');
+} catch (error) {
+  // not built, fine
+}
+
+const fileHashes = new Map();
+
+function fileHash(file) {
+  const { mtimeMs, size } = fs.statSync(file);
+  const key = `${file}:${mtimeMs}:${size}`;
+  if (!fileHashes.has(key)) {
+    fileHashes.set(
+      key,
+      crypto.createHash('sha256').update(fs.readFileSync(file)).digest('hex')
+    );
+  }
+  return fileHashes.get(key);
+}
+
+function prebuiltImage(src, outputDir) {
+  const entry = imageManifest.images[src];
+  if (
+    !entry ||
+    path.resolve(entry.output_dir) !== path.resolve(outputDir) ||
+    !fs.existsSync(src) ||
+    fileHash(src) !== entry.hash ||
+    !entry.variants.every((variant) => fs.existsSync(path.join(outputDir, variant.filename)))
+  ) {
+    return null;
+  }
+  return entry.variants;
+}
+
+function escapeAttribute(value) {
+  return String(value)
+    .replace(/&/g, '&amp;')
+    .replace(/"/g, '&quot;')
+    .replace(/</g, '&lt;')
+    .replace(/>/g, '&gt;');
+}
+
 module.exports = (config) => {
   setupCollections(config);
   setupSessions(config, timezone);
@@ -50,6 +97,28 @@ module.exports = (config) => {
     alt = "",
     sizes,
     classes = "") {
+      const variants = prebuiltImage(src, outputDir);
+      if (variants) {
+        // same markup as Image.generateHTML for a single format
+        const smallest = variants[0];
+        const largest = variants[variants.length - 1];
+        const attributes = {
+          alt,
+          class: classes,
+          decoding: "async",
+          height: largest.height,
+          loading: "lazy",
+          sizes,
+          src: smallest.url,
+          srcset: variants.map((variant) => `${variant.url} ${variant.width}w`).join(", "),
+          width: largest.width,
+        };
+        const html = Object.entries(attributes)
+          .map(([name, value]) => `${name}="${escapeAttribute(value)}"`)
+          .join(" ");
+        return `<img ${html}>`;
+      }
+
       let metadata = await Image(src, {
         widths: [180, 300, 600],
         formats: ["webp"],
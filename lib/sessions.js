@@ -1,8 +1,69 @@
+const crypto = require('crypto');
 const fs = require('fs');
 const yaml = require('yaml');
 const { parseISO, format } = require('date-fns');
 const { TZDate } = require('@date-fns/tz');
 
+// Written by `python tools/process.py compile-schedule`
+const GRID_FILE = 'src/_data/scheduleGrid.json';
+const GRID_VERSION = 1;
+
+const toEpoch = raw => (typeof raw === 'string' ? parseISO(raw) : raw).getTime();
+
+/*
+  Build sessionsByDateAndTime from the precompiled grid: the grouping and
+  sorting were done by the Python tools, so this is a lookup per session.
+  Returns null if the grid is missing or out of date with the content, in
+  which case the collection is computed from scratch.
+*/
+function sessionsFromGrid(sessions, manualContent, timezone) {
+  let grid;
+  try {
+    grid = JSON.parse(fs.readFileSync(GRID_FILE, 'utf8'));
+  } catch (error) {
+    return null;
+  }
+
+  const manualDigest = crypto.createHash('sha256').update(manualContent).digest('hex');
+  if (
+    grid.version !== GRID_VERSION ||
+    grid.timezone !== timezone ||
+    grid.manual_digest !== manualDigest ||
+    grid.file_session_count !== sessions.length
+  ) {
+    return null;
+  }
+
+  const sessionsByPath = new Map(
+    sessions.map(session => [session.inputPath.replace(/^\.\//, ''), session])
+  );
+
+  const result = {};
+  for (const [date, slots] of Object.entries(grid.days)) {
+    result[date] = [];
+    for (const slot of slots) {
+      const slotSessions = [];
+      for (const entry of slot.sessions) {
+        if (entry.data) {
+          slotSessions.push(entry.data);
+          continue;
+        }
+        const session = sessionsByPath.get(entry.path);
+        if (
+          !session ||
+          toEpoch(session.data.start_datetime) !== entry.start ||
+          toEpoch(session.data.end_datetime) !== entry.end
+        ) {
+          return null;
+        }
+        slotSessions.push(session.data);
+      }
+      result[date].push({ start: slot.start, end: slot.end, sessions: slotSessions });
+    }
+  }
+  return result;
+}
+
 module.exports = function(config, timezone = 'UTC') {
   config.addCollection("sessionsByDateAndTime", function(collectionApi) {
     let sessions = collectionApi.getFilteredByGlob("src/_content/schedule/{tutorials,talks,sprints}/*.md");
@@ -10,6 +71,14 @@ module.exports = function(config, timezone = 'UTC') {
     if (sessions.length === 0) return [];
 
     const manualContent = fs.readFileSync('src/_content/schedule/manual.yaml', 'utf8');
+
+    const compiled = sessionsFromGrid(
+      sessions.filter(session => !session.data?.hidden),
+      manualContent,
+      timezone
+    );
+    if (compiled) return compiled;
+
     const manualData = yaml.parse(manualContent);
     sessions = sessions.concat(manualData);
 
@@ -0,0 +1,155 @@
+/*
+  Client-side search over the index built by
+  `python tools/process.py build-search-index` (see tools/search_index.py).
+
+  Only docs.json and the shards for the first letters of the query's words
+  are downloaded, once each. Every word in the query has to match, either
+  exactly or as the prefix of an indexed word:
+
+    siteSearch.search("djan orm").then((results) => ...)
+
+  Pages can also opt in with markup:
+
+    <input type="search" data-site-search>
+    <ul data-site-search-results></ul>
+*/
+(function() {
+  var BASE_URL = "/search/";
+  var STOPWORDS = ["a", "an", "and", "for", "in", "of", "on", "the", "to", "with"];
+  // an exact word counts for more than a word it's the start of
+  var PREFIX_FACTOR = 0.5;
+
+  var cache = {};
+
+  function fetchJSON(name) {
+    if (!cache[name]) {
+      cache[name] = fetch(BASE_URL + name + ".json").then(function(response) {
+        // a missing shard just means no word starts with that character
+        return response.ok ? response.json() : { terms: [], postings: [] };
+      });
+    }
+    return cache[name];
+  }
+
+  // same normalization as matching.words() in the tools
+  function words(text) {
+    return text
+      .normalize("NFKD")
+      .replace(/[^\x00-\x7f]/g, "")
+      .toLowerCase()
+      .split(/[^a-z0-9]+/)
+      .filter(function(word) {
+        return word && STOPWORDS.indexOf(word) === -1;
+      });
+  }
+
+  // index of the first term >= prefix
+  function lowerBound(terms, prefix) {
+    var low = 0;
+    var high = terms.length;
+    while (low < high) {
+      var middle = (low + high) >> 1;
+      if (terms[middle] < prefix) {
+        low = middle + 1;
+      } else {
+        high = middle;
+      }
+    }
+    return low;
+  }
+
+  // doc id -> best score for one query word
+  function scoreWord(shard, word) {
+    var scores = {};
+    for (var i = lowerBound(shard.terms, word); i < shard.terms.length; i++) {
+      var term = shard.terms[i];
+      if (term.lastIndexOf(word, 0) !== 0) {
+        break;
+      }
+      var factor = term === word ? 1 : PREFIX_FACTOR;
+      var postings = shard.postings[i];
+      var doc = 0;
+      for (var j = 0; j < postings.length; j += 2) {
+        doc += postings[j];
+        scores[doc] = Math.max(scores[doc] || 0, postings[j + 1] * factor);
+      }
+    }
+    return scores;
+  }
+
+  function search(query, limit) {
+    var queryWords = words(query || "");
+    if (!queryWords.length) {
+      return Promise.resolve([]);
+    }
+    var shards = queryWords.map(function(word) {
+      return fetchJSON(word[0]);
+    });
+    return Promise.all([fetchJSON("docs")].concat(shards)).then(function(loaded) {
+      var docs = loaded[0].docs;
+      var totals = null;
+      queryWords.forEach(function(word, index) {
+        var scores = scoreWord(loaded[index + 1], word);
+        var next = {};
+        Object.keys(scores).forEach(function(doc) {
+          if (totals === null || doc in totals) {
+            next[doc] = (totals ? totals[doc] : 0) + scores[doc];
+          }
+        });
+        totals = next;
+      });
+      return Object.keys(totals)
+        .sort(function(a, b) {
+          return totals[b] - totals[a];
+        })
+        .slice(0, limit || 10)
+        .map(function(doc) {
+          var entry = docs[doc];
+          return { kind: entry[0], title: entry[1], url: entry[2], subtitle: entry[3], score: totals[doc] };
+        });
+    });
+  }
+
+  function setupSearchBox(input) {
+    var results = document.querySelector("[data-site-search-results]");
+    if (!results) {
+      return;
+    }
+    var latest = 0;
+    input.addEventListener("input", function() {
+      var request = ++latest;
+      search(input.value).then(function(found) {
+        if (request !== latest) {
+          return;
+        }
+        results.innerHTML = "";
+        found.forEach(function(result) {
+          var item = document.createElement("li");
+          var link = document.createElement("a");
+          link.href = result.url;
+          link.textContent = result.title;
+          item.appendChild(link);
+          if (result.subtitle) {
+            item.appendChild(document.createTextNode(" — " + result.subtitle));
+          }
+          results.appendChild(item);
+        });
+      });
+    });
+  }
+
+  window.siteSearch = { search: search };
+
+  function setup() {
+    var input = document.querySelector("[data-site-search]");
+    if (input) {
+      setupSearchBox(input);
+    }
+  }
+
+  if (document.readyState === "loading") {
+    document.addEventListener("DOMContentLoaded", setup);
+  } else {
+    setup();
+  }
+})();
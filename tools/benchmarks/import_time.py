@@ -0,0 +1,93 @@
+"""Check how long each tools CLI takes to import against a budget
+
+Every command pays its import time before doing anything, so this runs
+``python -X importtime -c "import <module>"`` in a fresh interpreter a few
+times per CLI, keeps the fastest run, and fails if it is over budget or if a
+dependency that should only load on first use was imported at startup.
+
+To run: python tools/benchmarks/import_time.py
+"""
+
+import os
+from pathlib import Path
+import subprocess
+import sys
+
+import typer
+
+
+TOOLS_DIR = Path(__file__).parent.parent
+# milliseconds, for the whole import including pydantic and typer
+BUDGETS_MS = {
+    "process": 250,
+    "swap_talks": 250,
+    "generate_speaker_blog_post": 250,
+    "yt_playlist": 250,
+}
+# only some commands need these, so they are imported where they're used
+LAZY_MODULES = [
+    "asyncio",
+    "concurrent.futures.process",
+    "frontmatter",
+    "numpy",
+    "PIL",
+    "pytube",
+    "requests",
+    "slugify",
+    "yaml",
+]
+
+
+def import_time(module: str) -> tuple[float, set[str]]:
+    """Cumulative import time of ``module`` in ms, and every module it loaded"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        check=True,
+        cwd=TOOLS_DIR,
+        env=os.environ | {"PYTHONPATH": str(TOOLS_DIR)},
+        text=True,
+    )
+    total = 0.0
+    loaded = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if not cumulative.strip().isdigit():
+            continue  # the header line
+        loaded.add(name.strip())
+        if name.strip() == module:
+            total = int(cumulative) / 1000
+    return total, loaded
+
+
+def main(
+    runs: int = typer.Option(5, help="Fresh interpreters per CLI; the fastest counts"),
+    scale: float = typer.Option(
+        1.0, help="Multiply every budget, e.g. for a slow machine"
+    ),
+) -> None:
+    failures = []
+    for module, budget in BUDGETS_MS.items():
+        timings = []
+        for _ in range(runs):
+            elapsed, loaded = import_time(module)
+            timings.append(elapsed)
+        best = min(timings)
+        limit = budget * scale
+        eager = sorted(name for name in LAZY_MODULES if name in loaded)
+        status = "✅" if best <= limit and not eager else "❌"
+        print(f"{status} {module}: {best:.0f}ms (budget {limit:.0f}ms)")
+        if best > limit:
+            failures.append(f"{module} took {best:.0f}ms to import")
+        if eager:
+            failures.append(f"{module} imports {', '.join(eager)} at startup")
+    for failure in failures:
+        print(f"❌ {failure}")
+    if failures:
+        raise typer.Exit(code=1)
+
+
+if __name__ == "__main__":
+    typer.run(main)
@@ -0,0 +1,285 @@
+"""Time the tools' hot paths against a synthetic conference
+
+To run: python tools/benchmarks/run.py
+
+A synthetic conference (see synthetic.py) is written to a temporary folder,
+every benchmark runs ``--repeat`` times, and the results are saved as JSON
+(by default in .cache/tools/benchmarks/<commit>.json). Pass ``--compare`` an
+earlier results file to see what got slower.
+"""
+
+from contextlib import redirect_stdout
+import dataclasses
+import io
+import json
+import os
+from pathlib import Path
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Callable
+
+TOOLS_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(TOOLS_DIR))
+
+import typer  # noqa: E402
+
+import bundle  # noqa: E402
+import content  # noqa: E402
+import generate_speaker_blog_post  # noqa: E402
+import models  # noqa: E402
+import moves  # noqa: E402
+import process  # noqa: E402
+import related  # noqa: E402
+from repository import ContentRepository  # noqa: E402
+import solver  # noqa: E402
+import validation  # noqa: E402
+import yt_playlist  # noqa: E402
+
+from synthetic import SyntheticConference, generate  # noqa: E402
+
+
+RESULTS_PATH = content.CACHE_DIR / "benchmarks"
+RESULTS_VERSION = 1
+# slower than this ratio against --compare counts as a regression
+REGRESSION_RATIO = 1.2
+# a fixed step count, so the benchmark doesn't grow with the conference
+SOLVER_ITERATIONS = 100_000
+
+
+@dataclasses.dataclass
+class Benchmark:
+    name: str
+    run: Callable[[], object]
+    # untimed, before every run
+    setup: Callable[[], None] = lambda: None
+
+
+def time_benchmark(benchmark: Benchmark, repeat: int) -> dict:
+    timings = []
+    for _ in range(repeat):
+        benchmark.setup()
+        started = time.perf_counter()
+        with redirect_stdout(io.StringIO()):
+            benchmark.run()
+        timings.append((time.perf_counter() - started) * 1000)
+    return {
+        "min_ms": round(min(timings), 3),
+        "median_ms": round(statistics.median(timings), 3),
+        "runs": len(timings),
+    }
+
+
+def build_benchmarks(content_path: Path, cache_file: Path) -> list[Benchmark]:
+    def cold_cache() -> None:
+        cache_file.unlink(missing_ok=True)
+        content.set_cache(content.ContentCache(cache_file=cache_file))
+
+    def warm_cache() -> None:
+        # read back from disk, like a new tool run
+        content.set_cache(content.ContentCache(cache_file=cache_file))
+
+    def load() -> ContentRepository:
+        repository = ContentRepository(content_path=content_path)
+        repository.sessions
+        repository.presenters
+        return repository
+
+    warm_cache()
+    repository = load()
+    talk_metadata = [
+        dict(entry.metadata)
+        for entry in content.load_entries(
+            session.path for session in repository.talks
+        ).values()
+    ]
+    presenter_metadata = [
+        dict(entry.metadata)
+        for entry in content.load_entries(
+            (content_path / "presenters").glob("*.md")
+        ).values()
+    ]
+
+    rng = random.Random(0)
+    talks = list(repository.talks)
+    rng.shuffle(talks)
+    # swap a quarter of the talks pairwise (every talk is the same length)
+    moved = talks[: len(talks) // 4 * 2]
+    swap_plan = {
+        "swaps": [
+            [str(first.path), str(second.path)]
+            for first, second in zip(moved[::2], moved[1::2])
+        ]
+    }
+
+    videos = []
+    for session in rng.sample(repository.talks, max(1, len(repository.talks) // 10)):
+        names = [presenter.name for presenter in repository.presenters_for(session)]
+        # a YouTube-style title: a word dropped, presenters appended
+        title_words = session.schedule.title.split()
+        title_words.pop(rng.randrange(len(title_words)))
+        videos.append((" ".join(title_words), names))
+
+    def match_videos() -> None:
+        index = yt_playlist.build_index(repository)
+        for title, names in videos:
+            index.search(title, names)
+
+    problem = solver.build_problem(repository, solver.Constraints())
+
+    manual_output = content_path / "manual-benchmark.yaml"
+    return [
+        Benchmark("load_content_cold", load, setup=cold_cache),
+        Benchmark("load_content_warm", load, setup=warm_cache),
+        Benchmark(
+            "validate_schedule_batch",
+            lambda: validation.list_adapter(models.Schedule).validate_python(
+                talk_metadata
+            ),
+        ),
+        Benchmark(
+            "validate_presenter_batch",
+            lambda: validation.list_adapter(models.Presenter).validate_python(
+                presenter_metadata
+            ),
+        ),
+        Benchmark(
+            "validate_schedule_each",
+            lambda: [models.Schedule(**metadata) for metadata in talk_metadata],
+        ),
+        Benchmark(
+            "parse_talks",
+            lambda: generate_speaker_blog_post.parse_talks(repository.talks, repository),
+        ),
+        Benchmark(
+            "plan_swaps",
+            lambda: moves.check_conflicts(
+                moves.build_moves(swap_plan, repository), repository
+            ),
+        ),
+        Benchmark(
+            "generate_manual_schedule_data",
+            lambda: process.generate_manual_schedule_data(
+                output_path=str(manual_output), dry_run=False
+            ),
+            setup=models.manual_schedule_entries.cache_clear,
+        ),
+        Benchmark("yt_playlist_matching", match_videos),
+        Benchmark(
+            "related_sessions",
+            lambda: related.nearest(
+                related.tfidf_matrix(
+                    [counts for _, counts in related.collect_sessions(repository)]
+                ),
+                related.TOP_K,
+            ),
+        ),
+        Benchmark(
+            "compile_bundle",
+            lambda: bundle.render_json(bundle.compile_bundle(repository)),
+        ),
+        Benchmark(
+            "solve_schedule",
+            lambda: solver.solve(problem, iterations=SOLVER_ITERATIONS),
+        ),
+    ]
+
+
+def current_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            check=True,
+            cwd=TOOLS_DIR,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def compare(results: dict, baseline: dict) -> list[str]:
+    """Print a table against ``baseline``; returns the regressed benchmarks"""
+    regressions = []
+    for name, result in results["benchmarks"].items():
+        before = baseline["benchmarks"].get(name)
+        if before is None:
+            print(f"  {name}: {result['min_ms']:.1f}ms (new)")
+            continue
+        ratio = result["min_ms"] / before["min_ms"] if before["min_ms"] else 1.0
+        status = "❌" if ratio > REGRESSION_RATIO else "✅"
+        print(
+            f"{status} {name}: {before['min_ms']:.1f}ms → {result['min_ms']:.1f}ms "
+            f"({ratio:.2f}x)"
+        )
+        if ratio > REGRESSION_RATIO:
+            regressions.append(name)
+    return regressions
+
+
+def main(
+    presenters: int = typer.Option(3000, help="Synthetic presenters"),
+    days: int = typer.Option(10, help="Conference days"),
+    rooms: int = typer.Option(20, help="Rooms (one track each)"),
+    slots: int = typer.Option(12, help="Sessions per room per day"),
+    abstract_words: int = typer.Option(400, help="Words per abstract"),
+    repeat: int = typer.Option(5, help="Runs per benchmark; the fastest counts"),
+    only: list[str] = typer.Option([], help="Only run these benchmarks"),
+    output: Path | None = typer.Option(None, help="Where to save the results"),
+    compare_to: Path | None = typer.Option(
+        None, "--compare", help="Earlier results to compare against"
+    ),
+) -> None:
+    conference = SyntheticConference(
+        presenters=presenters,
+        days=days,
+        rooms=rooms,
+        slots_per_day=slots,
+        abstract_words=abstract_words,
+    )
+    with tempfile.TemporaryDirectory(prefix="djangocon-benchmark-") as temp_dir:
+        content_path = Path(temp_dir) / "content"
+        started = time.perf_counter()
+        generate(conference, content_path)
+        print(
+            f"Generated {conference.presenters} presenters and {conference.sessions} "
+            f"sessions in {time.perf_counter() - started:.1f}s"
+        )
+        benchmarks = build_benchmarks(content_path, Path(temp_dir) / "cache.pickle")
+        results = {}
+        for benchmark in benchmarks:
+            if only and benchmark.name not in only:
+                continue
+            results[benchmark.name] = time_benchmark(benchmark, repeat)
+            print(f"{benchmark.name}: {results[benchmark.name]['min_ms']:.1f}ms")
+        content.set_cache(None)
+
+    commit = current_commit()
+    report = {
+        "version": RESULTS_VERSION,
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "conference": dataclasses.asdict(conference),
+        "benchmarks": results,
+    }
+    output = output or RESULTS_PATH / f"{commit}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2) + "\n")
+    print(f"Saved {output}")
+
+    if compare_to:
+        baseline = json.loads(compare_to.read_text())
+        if baseline.get("conference") != report["conference"]:
+            print("⚠️ the baseline used a different synthetic conference")
+        if compare(report, baseline):
+            raise typer.Exit(code=1)
+
+
+if __name__ == "__main__":
+    typer.run(main)
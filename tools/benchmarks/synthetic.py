@@ -0,0 +1,124 @@
+"""Generate a synthetic conference with the same layout as src/_content
+
+The size knobs go well past any real DjangoCon so the benchmarks show how the
+tools scale: thousands of presenters and sessions over many days and rooms,
+talks with up to three presenters, and abstracts of a few hundred words.
+Everything comes from a seeded ``random.Random``, so a given set of
+parameters always produces the same files.
+"""
+
+import dataclasses
+import datetime
+from pathlib import Path
+import random
+
+import yaml
+
+import constants
+
+
+VOCABULARY = """
+django python orm query database postgres migration model view template form
+admin async task queue cache redis celery deploy docker kubernetes test pytest
+factory fixture signal middleware session auth permission api rest graphql
+htmx websocket channel search index vector embedding machine learning data
+pipeline performance profile memory scale shard replica monitoring logging
+security csrf password token accessibility design system component frontend
+community mentor contributor open source maintainer release package typing
+refactor legacy architecture domain event stream batch job schedule report
+""".split()
+FIRST_NAMES = "Ada Grace Linus Guido Jacob Adrian Simon Carlton Kojo Velda Paolo Lilian".split()
+LAST_NAMES = "Lovelace Hopper Torvalds Rossum Kaplan Holovaty Willison Gibson Idrissa Kiara Melchiorre Tran".split()
+
+
+@dataclasses.dataclass
+class SyntheticConference:
+    presenters: int = 3000
+    days: int = 10
+    rooms: int = 20
+    slots_per_day: int = 12
+    abstract_words: int = 400
+    seed: int = 2025
+
+    @property
+    def sessions(self) -> int:
+        return self.days * self.rooms * self.slots_per_day
+
+
+def sentence(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(VOCABULARY) for _ in range(words)).capitalize()
+
+
+def write_markdown(path: Path, metadata: dict, body: str) -> None:
+    header = yaml.safe_dump(metadata, sort_keys=False, allow_unicode=True)
+    path.write_text(f"---\n{header}---\n\n{body}\n")
+
+
+def generate(conference: SyntheticConference, content_path: Path) -> None:
+    """Write the conference into ``content_path`` (which should be empty)"""
+    rng = random.Random(conference.seed)
+    presenter_path = content_path / "presenters"
+    talk_path = content_path / "schedule" / "talks"
+    for folder in (presenter_path, content_path / "organizers", talk_path):
+        folder.mkdir(parents=True, exist_ok=True)
+
+    slugs = []
+    for number in range(conference.presenters):
+        name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)} {number}"
+        slug = name.lower().replace(" ", "-")
+        slugs.append(slug)
+        write_markdown(
+            presenter_path / f"{slug}.md",
+            {
+                "company": f"{sentence(rng, 2)} Inc.",
+                "hidden": False,
+                "name": name,
+                "permalink": f"/presenters/{slug}/",
+                "social": {"github": slug, "website": f"https://{slug}.example.com"},
+            },
+            sentence(rng, conference.abstract_words // 4),
+        )
+
+    start_day = datetime.date(constants.CONFERENCE_YEAR, 9, 1)
+    manual = []
+    for day in range(conference.days):
+        date = start_day + datetime.timedelta(days=day)
+        for slot in range(conference.slots_per_day):
+            start = datetime.datetime.combine(
+                date, datetime.time(8), tzinfo=constants.CONFERENCE_TZ
+            ) + datetime.timedelta(minutes=45 * slot)
+            end = start + datetime.timedelta(minutes=40)
+            for room in range(conference.rooms):
+                title = sentence(rng, rng.randint(3, 9))
+                slug = f"{date:%m%d}-{slot:02d}-{room:02d}-" + "-".join(
+                    title.lower().split()[:5]
+                )
+                write_markdown(
+                    talk_path / f"{start:%Y-%m-%d-%H-%M}-t{room}-{slug}.md",
+                    {
+                        "category": "talks",
+                        "start_datetime": start,
+                        "end_datetime": end,
+                        "permalink": f"/talks/{slug}/",
+                        "presenter_slugs": rng.sample(slugs, rng.choice((1, 1, 1, 2, 3))),
+                        "room": f"Room {room}",
+                        "tags": rng.sample(VOCABULARY, 2),
+                        "title": title,
+                        "track": f"t{room}",
+                    },
+                    "\n\n".join(
+                        sentence(rng, conference.abstract_words // 4) for _ in range(4)
+                    ),
+                )
+            if slot == conference.slots_per_day // 2:
+                manual.append(
+                    {
+                        "end_datetime": end,
+                        "permalink": None,
+                        "room": "Hall",
+                        "start_datetime": start,
+                        "title": "Lunch",
+                        "track": "t0",
+                    }
+                )
+    (content_path / "schedule" / "manual.yaml").write_text(yaml.safe_dump(manual))
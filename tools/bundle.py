@@ -0,0 +1,140 @@
+"""Write all the validated content as one file for 11ty and other scripts
+
+``src/_data/contentBundle.json`` holds every visible presenter, organizer,
+post and session (manual entries included) as plain data: datetimes in the
+conference timezone, like the schedule grid, and each session's presenters
+resolved from their slugs, so readers don't need a lookup per reference.
+11ty loads it as the ``contentBundle`` global, where a presenter is one
+``contentBundle.presenters[slug]`` away instead of a ``find`` over the
+collection. Markdown bodies aren't included; 11ty renders those itself.
+
+``--msgpack`` also writes the same data as ``contentBundle.msgpack``, a
+smaller binary form for scripts that have msgpack installed. 11ty ignores it.
+"""
+
+import datetime
+import json
+from pathlib import Path
+
+import constants
+import content
+import models
+from repository import ContentRepository, Session
+from schedule_grid import local_isoformat
+from writer import Writer
+
+
+BUNDLE_FILE = constants.REPO_ROOT / "src" / "_data" / "contentBundle.json"
+MSGPACK_FILE = BUNDLE_FILE.with_suffix(".msgpack")
+# bump this when the layout changes
+BUNDLE_VERSION = 1
+
+
+def plain(value: object) -> object:
+    """``value`` with datetimes as conference-time ISO strings"""
+    if isinstance(value, datetime.datetime):
+        return local_isoformat(value)
+    if isinstance(value, datetime.date):
+        return value.isoformat()
+    if isinstance(value, dict):
+        return {key: plain(item) for key, item in value.items() if item is not None}
+    if isinstance(value, list):
+        return [plain(item) for item in value]
+    return value
+
+
+def is_visible(session: Session) -> bool:
+    return not getattr(session.schedule, "hidden", False)
+
+
+def session_entry(
+    session: Session, repository: ContentRepository, presenters: dict[str, dict]
+) -> dict:
+    entry = plain(session.schedule.model_dump())
+    if session.is_manual:
+        entry["manual"] = True
+    else:
+        # under src/_content, e.g. schedule/talks/...
+        entry["path"] = session.path.relative_to(repository.content_path).as_posix()
+    # the presenter without their own list of sessions
+    entry["presenters"] = [
+        {key: value for key, value in presenters[slug].items() if key != "sessions"}
+        for slug in session.presenter_slugs
+        if slug in presenters
+    ]
+    return entry
+
+
+def compile_bundle(repository: ContentRepository) -> dict:
+    # what the 11ty collections show: hidden items are left out
+    presenters = {
+        slug: {"slug": slug, **plain(presenter.model_dump())}
+        for slug, presenter in sorted(repository.presenters.items())
+        if not presenter.hidden
+    }
+    organizers = {
+        slug: {"slug": slug, **plain(organizer.model_dump())}
+        for slug, organizer in sorted(repository.organizers.items())
+        if not organizer.hidden
+    }
+    post_path = repository.content_path / "posts"
+    posts = {
+        path.stem: {"slug": path.stem, **plain(post.model_dump())}
+        for path, post in (
+            content.load_models(post_path, models.Post, jobs=repository.jobs).items()
+            if post_path.is_dir()
+            else ()
+        )
+        if not post.hidden
+    }
+    sessions = [
+        session_entry(session, repository, presenters)
+        for session in repository.sessions
+        if is_visible(session)
+    ]
+    for slug, presenter in presenters.items():
+        presenter["sessions"] = [
+            session.schedule.permalink
+            for session in repository.sessions_for(slug)
+            if session.schedule.permalink and is_visible(session)
+        ]
+    return {
+        "version": BUNDLE_VERSION,
+        "timezone": constants.SITE_JSON["timezone"],
+        "presenters": presenters,
+        "organizers": organizers,
+        "posts": posts,
+        "sessions": sessions,
+    }
+
+
+def render_json(bundle: dict) -> str:
+    return json.dumps(bundle, separators=(",", ":"), ensure_ascii=False) + "\n"
+
+
+def render_msgpack(bundle: dict) -> bytes:
+    import msgpack
+
+    return msgpack.packb(bundle)
+
+
+def build(repository: ContentRepository, writer: Writer, msgpack: bool = False) -> dict:
+    """Write the bundle (and its msgpack form if asked) and return it"""
+    bundle = compile_bundle(repository)
+    writer.write_text(BUNDLE_FILE, render_json(bundle))
+    if msgpack:
+        writer.write_bytes(MSGPACK_FILE, render_msgpack(bundle))
+    return bundle
+
+
+def load(path: Path = BUNDLE_FILE) -> dict | None:
+    """The bundle in ``path`` (JSON or msgpack), or None if it's missing or outdated"""
+    if not path.exists():
+        return None
+    if path.suffix == ".msgpack":
+        import msgpack
+
+        bundle = msgpack.unpackb(path.read_bytes())
+    else:
+        bundle = json.loads(path.read_text())
+    return bundle if bundle.get("version") == BUNDLE_VERSION else None
@@ -0,0 +1,97 @@
+"""Find sessions that overlap in the same room, track or presenter's calendar"""
+
+from collections import defaultdict
+import dataclasses
+import heapq
+from typing import Callable, Iterable
+
+import constants
+from repository import Session
+
+
+# rooms that haven't been assigned yet, or that host several things at once
+SHARED_ROOMS = {"TBD"}
+
+
+@dataclasses.dataclass
+class Conflict:
+    kind: str  # "room", "track" or "presenter"
+    key: str
+    first: Session
+    second: Session
+
+    def __str__(self) -> str:
+        return (
+            f"{self.kind} {self.key!r}: "
+            f"{describe(self.first)} overlaps {describe(self.second)}"
+        )
+
+
+def describe(session: Session) -> str:
+    schedule = session.schedule
+    start = schedule.start_datetime.strftime("%a %H:%M")
+    end = schedule.end_datetime.strftime("%H:%M")
+    path = session.path
+    if path.is_relative_to(constants.REPO_ROOT):
+        path = path.relative_to(constants.REPO_ROOT)
+    return f"{schedule.title!r} ({start}-{end}, {path})"
+
+
+def find_overlaps(
+    sessions: Iterable[Session],
+    kind: str,
+    keys: Callable[[Session], Iterable[str]],
+) -> list[Conflict]:
+    """Sweep through ``sessions`` by start time and report every overlap
+
+    ``keys`` returns the rooms/tracks/presenters a session occupies. Each key
+    keeps a heap of its active sessions ordered by end time, so the sweep is
+    O(n log n) plus the number of conflicts reported.
+    """
+    active: dict[str, list[tuple]] = defaultdict(list)
+    conflicts = []
+    ordered = sorted(
+        (session for session in sessions if session.is_scheduled),
+        key=lambda session: (
+            session.schedule.start_datetime,
+            session.schedule.end_datetime,
+        ),
+    )
+    for index, session in enumerate(ordered):
+        start = session.schedule.start_datetime
+        for key in keys(session):
+            heap = active[key]
+            # sessions that finished by the time this one starts are done
+            while heap and heap[0][0] <= start:
+                heapq.heappop(heap)
+            for _, _, other in sorted(heap, key=lambda item: item[1]):
+                conflicts.append(
+                    Conflict(kind=kind, key=key, first=other, second=session)
+                )
+            heapq.heappush(heap, (session.schedule.end_datetime, index, session))
+    return conflicts
+
+
+def room_keys(session: Session) -> list[str]:
+    room = session.schedule.room
+    return [room] if room and room not in SHARED_ROOMS else []
+
+
+def track_keys(session: Session) -> list[str]:
+    # manual entries are all on t0 and run alongside the talks by design
+    if session.is_manual or not session.schedule.track:
+        return []
+    return [session.schedule.track]
+
+
+def presenter_keys(session: Session) -> list[str]:
+    return list(dict.fromkeys(session.presenter_slugs))
+
+
+def find_conflicts(sessions: list[Session]) -> list[Conflict]:
+    """Room, track and presenter double-bookings across ``sessions``"""
+    return (
+        find_overlaps(sessions, "room", room_keys)
+        + find_overlaps(sessions, "track", track_keys)
+        + find_overlaps(sessions, "presenter", presenter_keys)
+    )
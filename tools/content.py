@@ -0,0 +1,320 @@
+"""Load markdown content from src/_content with an on-disk parse cache
+
+Parsing YAML frontmatter and validating it with pydantic is most of the cost
+of every tool run, so the parsed metadata (and any validated models built from
+it) is cached under ``.cache/tools`` and only recomputed for files that changed.
+Files that do need parsing are spread over a process pool.
+
+Only the frontmatter is read when a file is parsed: the reader stops at the
+closing ``---``, and the markdown body is read from disk when something asks
+for ``ContentFile.content``. Most tools never do.
+"""
+
+import dataclasses
+from functools import cached_property
+import hashlib
+import os
+import pickle
+from pathlib import Path
+import re
+from typing import Iterable, TypeVar
+
+from pydantic import BaseModel
+
+import constants
+import timings
+
+
+CACHE_DIR = constants.REPO_ROOT / ".cache" / "tools"
+CACHE_FILE = CACHE_DIR / "content.pickle"
+# bump this when the shape of CacheEntry changes
+CACHE_VERSION = 2
+# cached models are only valid for the model definitions that built them
+MODELS_FINGERPRINT = hashlib.sha256(
+    (Path(__file__).parent / "models.py").read_bytes()
+).hexdigest()
+# below this many uncached files, starting a process pool costs more than it saves
+PARALLEL_MIN_FILES = 64
+default_jobs = os.cpu_count() or 1
+# same delimiter as python-frontmatter's YAML handler
+FM_BOUNDARY = re.compile(rb"-{3,}\s*$")
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+@dataclasses.dataclass
+class ContentFile:
+    path: Path
+    metadata: dict
+    body_offset: int = 0
+
+    @cached_property
+    def content(self) -> str:
+        """The markdown body, read the first time it's needed"""
+        return read_body(self.path, self.body_offset)
+
+
+@dataclasses.dataclass
+class CacheEntry:
+    mtime_ns: int
+    size: int
+    digest: str  # of the frontmatter block, which is all that's cached
+    metadata: dict
+    body_offset: int
+    models: dict[str, BaseModel] = dataclasses.field(default_factory=dict)
+
+
+class ContentCache:
+    """Parsed frontmatter keyed by path, invalidated by mtime/size and content hash"""
+
+    def __init__(self, cache_file: Path | None = CACHE_FILE):
+        self.cache_file = cache_file
+        self.entries: dict[str, CacheEntry] = {}
+        self.dirty = False
+        self.hits = 0
+        self.misses = 0
+        self._read()
+
+    def _read(self) -> None:
+        if self.cache_file is None or not self.cache_file.exists():
+            return
+        try:
+            with timings.span("cache.read"), self.cache_file.open("rb") as cache_file_obj:
+                data = pickle.load(cache_file_obj)
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError):
+            # a corrupt or outdated cache is just a cold cache
+            return
+        if data.get("version") != (CACHE_VERSION, MODELS_FINGERPRINT):
+            return
+        self.entries = data["entries"]
+
+    def save(self) -> None:
+        """Write the cache back to disk, dropping entries for deleted files"""
+        if self.cache_file is None or not self.dirty:
+            return
+        with timings.span("cache.save"):
+            self._write()
+
+    def _write(self) -> None:
+        self.entries = {
+            key: entry for key, entry in self.entries.items() if Path(key).exists()
+        }
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        temp_file = self.cache_file.with_suffix(".tmp")
+        with temp_file.open("wb") as cache_file_obj:
+            pickle.dump(
+                {
+                    "version": (CACHE_VERSION, MODELS_FINGERPRINT),
+                    "entries": self.entries,
+                },
+                cache_file_obj,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        temp_file.replace(self.cache_file)
+        self.dirty = False
+
+    def lookup(self, path: Path) -> CacheEntry | None:
+        """Return the cached entry for ``path`` if the file hasn't changed"""
+        key = str(path.resolve())
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        stat = path.stat()
+        if entry.mtime_ns == stat.st_mtime_ns and entry.size == stat.st_size:
+            self.hits += 1
+            return entry
+        if entry.digest == hashlib.sha256(read_header(path)[0]).hexdigest():
+            # touched (e.g. a git checkout) or only the body changed, keep the parse
+            self.hits += 1
+            entry.mtime_ns = stat.st_mtime_ns
+            entry.size = stat.st_size
+            self.dirty = True
+            return entry
+        return None
+
+    def store(self, path: Path, entry: CacheEntry) -> CacheEntry:
+        self.misses += 1
+        self.entries[str(path.resolve())] = entry
+        self.dirty = True
+        return entry
+
+    def entry(self, path: Path) -> CacheEntry:
+        """Return the cache entry for ``path``, reparsing it only if it changed"""
+        if (entry := self.lookup(path)) is not None:
+            return entry
+        with timings.span("parse"):
+            return self.store(path, parse_file(path))
+
+    def load(self, path: Path) -> ContentFile:
+        return to_content_file(path, self.entry(path))
+
+    def load_model(self, path: Path, model: type[ModelT]) -> ModelT:
+        """Return ``path``'s frontmatter validated as ``model``"""
+        return self.validate(self.entry(path), model)
+
+    def validate(self, entry: CacheEntry, model: type[ModelT]) -> ModelT:
+        if (instance := entry.models.get(model.__name__)) is None:
+            with timings.span(f"validate.{model.__name__}"):
+                instance = model(**entry.metadata)
+            entry.models[model.__name__] = instance
+            self.dirty = True
+        # callers may reassign fields on what they get back
+        return instance.model_copy()
+
+
+def to_content_file(path: Path, entry: CacheEntry) -> ContentFile:
+    return ContentFile(
+        path=path, metadata=dict(entry.metadata), body_offset=entry.body_offset
+    )
+
+
+def read_header(path: Path) -> tuple[bytes, bytes]:
+    """Read ``path`` only up to the closing ``---`` of its frontmatter
+
+    Returns everything read (the body starts right after it) and the YAML
+    between the delimiters, or two empty strings if there's no frontmatter.
+    """
+    with path.open("rb") as file:
+        read = []
+        line = file.readline()
+        while line and not line.strip():
+            read.append(line)
+            line = file.readline()
+        if not FM_BOUNDARY.match(line):
+            return b"", b""
+        read.append(line)
+        header = []
+        for line in iter(file.readline, b""):
+            read.append(line)
+            if FM_BOUNDARY.match(line):
+                return b"".join(read), b"".join(header)
+            header.append(line)
+    # no closing delimiter: python-frontmatter treats the whole file as the body
+    return b"", b""
+
+
+def parse_header(header: bytes) -> dict:
+    import yaml
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    metadata = yaml.load(header.decode("utf-8"), Loader=loader) if header else None
+    return metadata if isinstance(metadata, dict) else {}
+
+
+def read_body(path: Path, offset: int) -> str:
+    with path.open("rb") as file:
+        file.seek(offset)
+        return file.read().decode("utf-8").strip()
+
+
+def parse_file(path: Path) -> CacheEntry:
+    """Read and parse one file's frontmatter (runs in worker processes)"""
+    stat = path.stat()
+    read, header = read_header(path)
+    return CacheEntry(
+        mtime_ns=stat.st_mtime_ns,
+        size=stat.st_size,
+        digest=hashlib.sha256(read).hexdigest(),
+        metadata=parse_header(header),
+        body_offset=len(read),
+    )
+
+
+def parse_files(paths: list[Path], jobs: int | None = None) -> list[CacheEntry]:
+    """Parse ``paths`` across a process pool, in the same order as ``paths``
+
+    Small batches, ``jobs=1`` and platforms where a pool can't be started are
+    parsed serially in this process instead.
+    """
+    if not paths:
+        return []
+    with timings.span("parse"):
+        return _parse_files(paths, jobs or default_jobs)
+
+
+def _parse_files(paths: list[Path], jobs: int) -> list[CacheEntry]:
+    if jobs == 1 or len(paths) < PARALLEL_MIN_FILES:
+        return [parse_file(path) for path in paths]
+    from concurrent.futures import ProcessPoolExecutor
+    from concurrent.futures.process import BrokenProcessPool
+
+    try:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            chunksize = max(1, len(paths) // (jobs * 4))
+            return list(pool.map(parse_file, paths, chunksize=chunksize))
+    except (OSError, NotImplementedError, BrokenProcessPool):
+        return [parse_file(path) for path in paths]
+
+
+def set_jobs(jobs: int | None) -> None:
+    """Set the worker count used by the loaders (``None`` means one per CPU)"""
+    global default_jobs
+    default_jobs = jobs if jobs and jobs > 0 else os.cpu_count() or 1
+
+
+_default_cache: ContentCache | None = None
+
+
+def get_cache() -> ContentCache:
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = ContentCache()
+    return _default_cache
+
+
+def set_cache(cache: ContentCache | None) -> None:
+    """Use ``cache`` for the loaders (``None`` goes back to the default file)"""
+    global _default_cache
+    _default_cache = cache
+
+
+def load_file(path: Path) -> ContentFile:
+    cache = get_cache()
+    result = cache.load(path)
+    cache.save()
+    return result
+
+
+def load_entries(
+    paths: Iterable[Path], jobs: int | None = None
+) -> dict[Path, CacheEntry]:
+    """Cache entries for ``paths`` in sorted order, parsing misses in parallel"""
+    cache = get_cache()
+    entries: dict[Path, CacheEntry | None] = {
+        path: cache.lookup(path) for path in sorted(paths)
+    }
+    stale = [path for path, entry in entries.items() if entry is None]
+    for path, entry in zip(stale, parse_files(stale, jobs=jobs)):
+        entries[path] = cache.store(path, entry)
+    cache.save()
+    return entries
+
+
+def load_many(paths: Iterable[Path], jobs: int | None = None) -> list[ContentFile]:
+    """Load ``paths`` in sorted order, parsing any uncached files in parallel"""
+    return [
+        to_content_file(path, entry)
+        for path, entry in load_entries(paths, jobs=jobs).items()
+    ]
+
+
+def load_directory(
+    path: Path, pattern: str = "*.md", jobs: int | None = None
+) -> list[ContentFile]:
+    """Load every matching file in ``path``, sorted by filename"""
+    assert path.is_dir(), f"{path} is not a directory"
+    return load_many(path.glob(pattern), jobs=jobs)
+
+
+def load_models(
+    path: Path, model: type[ModelT], pattern: str = "*.md", jobs: int | None = None
+) -> dict[Path, ModelT]:
+    """Load every matching file in ``path`` and validate it as ``model``"""
+    assert path.is_dir(), f"{path} is not a directory"
+    cache = get_cache()
+    result = {
+        content_path: cache.validate(entry, model)
+        for content_path, entry in load_entries(path.glob(pattern), jobs=jobs).items()
+    }
+    cache.save()
+    return result
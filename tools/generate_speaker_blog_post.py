@@ -1,10 +1,11 @@
-import pathlib
-from typing import Any, Iterable
+from pathlib import Path
+from typing import Iterable
 
-import frontmatter
-import yaml
+import typer
 
 from models import Presenter, Schedule
+from repository import ContentRepository, Session
+import timings
 
 
 HEADER = """---
@@ -44,18 +45,9 @@ _All talks will be available live for those with online-only tickets. They will
 """
 
 
-def load_path(path: pathlib.Path) -> list[dict]:
-    """Load the talks and return a list of dicts"""
-    assert path.is_dir()
-    return_data = []
-    for yaml_file in sorted(path.glob("*.md")):
-        with open(yaml_file, "r") as yaml_file_obj:
-            yaml_data = yaml_file_obj.read()
-        return_data.append(yaml.safe_load(yaml_data.split("---")[1]))
-    return return_data
-
-
 def generate_urls(presenter: Presenter) -> str:
+    if not presenter.social:
+        return ""
     urls = []
     if presenter.social.github:
         urls.append(f"[github](https://github.com/{presenter.social.github})")
@@ -70,63 +62,52 @@ def generate_urls(presenter: Presenter) -> str:
     return f'({", ".join(urls)})'
 
 
-def format_talk(talk: dict[str, Any], presenters: Iterable[Presenter]) -> str:
+def format_talk(talk: Schedule, presenters: Iterable[Presenter]) -> str:
+    """Format a talk line, with ``presenters`` already in the talk's order"""
     presenter_details = [
         f"{presenter.name} {generate_urls(presenter=presenter)}"
-        for presenter in sorted(
-            (p for p in presenters if p.slug in talk["presenter_slugs"]),
-            key=lambda p: talk["presenter_slugs"].index(p.slug),
-        )
+        for presenter in presenters
     ]
-    return f'{" and ".join(presenter_details)} - {talk["title"]}'
+    return f'{" and ".join(presenter_details)} - {talk.title}'
+
 
+def parse_talks(talks: list[Session], repository: ContentRepository) -> list[str]:
+    def first_presenter_name(talk: Session) -> str:
+        presenters = repository.presenters_for(talk)
+        return presenters[0].name if presenters else "none"
 
-def parse_talks(talks: list[dict], presenters: dict[str, Presenter]) -> list[str]:
     return [
-        f'- {format_talk(talk, presenters=(presenter for slug, presenter in presenters.items() if slug in talk.get("presenter_slugs", {})))}'
-        for talk in sorted(
-            talks,
-            key=lambda t: (
-                presenters[t["presenter_slugs"][0]].name
-                if "presenter_slugs" in t and t["presenter_slugs"]
-                else "none"
-            ),
-        )
-        if "Lightning Talks" not in talk["title"]
-        and talk["category"] in {"talks", "tutorials"}
-        and talk.get("presenter_slugs")
+        f"- {format_talk(talk.schedule, presenters=repository.presenters_for(talk))}"
+        for talk in sorted(talks, key=first_presenter_name)
+        if "Lightning Talks" not in talk.schedule.title
+        and talk.category in {"talks", "tutorials"}
+        and talk.presenter_slugs
     ]
 
 
-def load_presenters() -> dict[str, Presenter]:
-    presenters = pathlib.Path("../src/_content/presenters").glob("*.md")
-    result = (
-        Presenter(**frontmatter.loads(presenter.read_text()).metadata)
-        for presenter in presenters
-    )
-
-    output = {p.slug: p for p in result}
-    print(output)
-    return output
-
-
 def generate_template(talk_lines: list[str], tutorial_lines: list[str]) -> str:
     talks = "\n".join(talk_lines)
     tutorials = "\n".join(tutorial_lines)
     return f"{HEADER}\n\n{TUTORIAL_HEADER}\n\n{tutorials}\n\n{TALK_HEADER}\n\n{talks}\n\n{FOOTER}"
 
 
-def main():
-    path = pathlib.Path("../src/_content/schedule/talks")
-    tutorial_path = pathlib.Path("../src/_content/schedule/tutorials")
-    talks = load_path(path)
-    tutorials = load_path(tutorial_path)
-    presenters = load_presenters()
-    talk_lines = parse_talks(talks, presenters=presenters)
-    tutorial_lines = parse_talks(tutorials, presenters=presenters)
+def main(
+    ctx: typer.Context,
+    jobs: int = typer.Option(
+        0, "--jobs", "-j", help="Processes used to parse content (0: one per CPU)"
+    ),
+    print_timings: bool = timings.TIMINGS_OPTION,
+    timings_file: Path | None = timings.TIMINGS_FILE_OPTION,
+    profile: bool = timings.PROFILE_OPTION,
+    profile_top: int = timings.PROFILE_TOP_OPTION,
+):
+    timings.start(ctx, print_timings, timings_file, profile, profile_top)
+    repository = ContentRepository(jobs=jobs)
+    talk_lines = parse_talks(repository.talks, repository=repository)
+    tutorial_lines = parse_talks(repository.tutorials, repository=repository)
     blog_post = generate_template(talk_lines, tutorial_lines)
     print(blog_post)
 
 
 if __name__ == "__main__":
-    main()
+    typer.run(main)
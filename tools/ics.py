@@ -0,0 +1,239 @@
+"""Export the schedule as iCalendar (RFC 5545) feeds
+
+Every session is rendered once into a VEVENT and then added to each feed it
+belongs to: the full schedule plus one feed per day, room, track and
+presenter. Times are written in UTC, so no VTIMEZONE is needed, and talk and
+tutorial UIDs come from permalinks, so calendar apps recognise a session after
+it moves.
+
+Each event is stamped (DTSTAMP, LAST-MODIFIED) with the last commit that
+touched its session's file, or the file's mtime while it has uncommitted
+changes, and its SEQUENCE counts minutes up to then, so a moved session is a
+newer revision to calendar apps. Nothing depends on when the feeds were
+generated, which lets the writer skip any feed whose sessions haven't changed.
+"""
+
+from collections import defaultdict
+import datetime
+import hashlib
+from pathlib import Path
+from typing import Iterable, Iterator
+from urllib.parse import urlparse
+
+import constants
+import models
+from repository import ContentRepository, Session
+from writer import Writer
+
+
+OUTPUT_PATH = constants.REPO_ROOT / "dist" / "calendar"
+SITE_URL = constants.SITE_JSON["domain"].rstrip("/")
+CALENDAR_NAME = f"DjangoCon US {constants.CONFERENCE_YEAR}"
+PRODID = f"-//DjangoCon US//Schedule {constants.CONFERENCE_YEAR}//EN"
+# lines longer than this many octets are folded (RFC 5545 3.1)
+MAX_LINE_OCTETS = 75
+# SEQUENCE is the minutes from this to an event's last change
+SEQUENCE_EPOCH = datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+def escape(text: str) -> str:
+    """Escape a TEXT value (RFC 5545 3.3.11)"""
+    return (
+        text.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+    )
+
+
+def fold(line: str) -> str:
+    """Fold a content line into CRLF-separated chunks of at most 75 octets"""
+    if len(line.encode("utf-8")) <= MAX_LINE_OCTETS:
+        return line + "\r\n"
+    chunks = []
+    current = ""
+    limit = MAX_LINE_OCTETS
+    for character in line:
+        if len((current + character).encode("utf-8")) > limit:
+            chunks.append(current)
+            current = ""
+            # continuation lines start with a space, which counts
+            limit = MAX_LINE_OCTETS - 1
+        current += character
+    chunks.append(current)
+    return "\r\n ".join(chunks) + "\r\n"
+
+
+def format_datetime(value: datetime.datetime) -> str:
+    return value.astimezone(datetime.timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+
+def uid(session: Session) -> str:
+    """Stable across reschedules for talks and tutorials with a permalink"""
+    schedule = session.schedule
+    if session.is_manual:
+        # a manual entry's permalink is a shared link (the lunch menu...), not
+        # its own page; its time, room and title are who it is
+        source = f"{schedule.start_datetime.isoformat()}|{schedule.room}|{schedule.title}"
+        key = f"manual-{hashlib.sha256(source.encode()).hexdigest()[:16]}"
+    elif schedule.permalink:
+        key = schedule.permalink.strip("/").replace("/", "-")
+    else:
+        key = session.path.stem
+    return f"{key}@{urlparse(SITE_URL).netloc}"
+
+
+def last_modified(paths: Iterable[Path]) -> dict[Path, datetime.datetime]:
+    """When each file last changed, keyed by resolved path
+
+    That's the last commit touching it, from one ``git log`` over their
+    folders, unless it has uncommitted changes (or there's no git history),
+    in which case it's the file's mtime.
+    """
+    import subprocess
+
+    paths = {path.resolve() for path in paths}
+    folders = sorted({str(path.parent) for path in paths})
+    committed: dict[Path, int] = {}
+    try:
+        log = subprocess.run(
+            [
+                "git",
+                "-c",
+                "core.quotePath=false",
+                "log",
+                "--format=%x00%ct",
+                "--name-only",
+                "--",
+                *folders,
+            ],
+            cwd=constants.REPO_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        status = subprocess.run(
+            ["git", "status", "--porcelain", "-z", "--no-renames", "--", *folders],
+            cwd=constants.REPO_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+    except (OSError, subprocess.CalledProcessError):
+        log = status = ""
+    for commit in log.split("\0")[1:]:
+        timestamp, *names = commit.split("\n")
+        for name in filter(None, names):
+            # newest commits come first
+            committed.setdefault((constants.REPO_ROOT / name).resolve(), int(timestamp))
+    for entry in filter(None, status.split("\0")):
+        committed.pop((constants.REPO_ROOT / entry[3:]).resolve(), None)
+    return {
+        path: datetime.datetime.fromtimestamp(
+            committed[path] if path in committed else path.stat().st_mtime,
+            datetime.timezone.utc,
+        )
+        for path in paths
+    }
+
+
+def render_event(
+    session: Session, repository: ContentRepository, modified: datetime.datetime
+) -> str:
+    schedule = session.schedule
+    sequence = max(0, int((modified - SEQUENCE_EPOCH).total_seconds()) // 60)
+    lines = [
+        "BEGIN:VEVENT",
+        f"UID:{uid(session)}",
+        f"DTSTAMP:{format_datetime(modified)}",
+        f"LAST-MODIFIED:{format_datetime(modified)}",
+        f"SEQUENCE:{sequence}",
+        f"DTSTART:{format_datetime(schedule.start_datetime)}",
+        f"DTEND:{format_datetime(schedule.end_datetime)}",
+        f"SUMMARY:{escape(schedule.title)}",
+    ]
+    if schedule.room:
+        lines.append(f"LOCATION:{escape(schedule.room)}")
+    presenters = [presenter.name for presenter in repository.presenters_for(session)]
+    if presenters:
+        lines.append(f"DESCRIPTION:{escape(', '.join(presenters))}")
+    if session.category:
+        lines.append(f"CATEGORIES:{escape(session.category)}")
+    if schedule.permalink and schedule.permalink.startswith("/"):
+        lines.append(f"URL:{SITE_URL}{schedule.permalink}")
+    lines.append("END:VEVENT")
+    return "".join(fold(line) for line in lines)
+
+
+def render_calendar(name: str, events: Iterable[str]) -> Iterator[str]:
+    yield from (
+        fold(line)
+        for line in (
+            "BEGIN:VCALENDAR",
+            "VERSION:2.0",
+            f"PRODID:{PRODID}",
+            "CALSCALE:GREGORIAN",
+            "METHOD:PUBLISH",
+            f"X-WR-CALNAME:{escape(name)}",
+            f"X-WR-TIMEZONE:{constants.CONFERENCE_TZ.key}",
+        )
+    )
+    yield from events
+    yield fold("END:VCALENDAR")
+
+
+def feed_key(kind: str, value: str) -> str:
+    return f"{kind}-{models.slugify(value)}"
+
+
+def collect_feeds(
+    repository: ContentRepository,
+) -> dict[str, tuple[str, list[str]]]:
+    """Feed filename stem → (calendar name, rendered events), in one pass"""
+    names: dict[str, str] = {"all": CALENDAR_NAME}
+    events: dict[str, list[str]] = defaultdict(list)
+    modified = last_modified(session.path for session in repository.sessions)
+    for session in repository.sessions:
+        schedule = session.schedule
+        if getattr(schedule, "hidden", False) or not session.is_scheduled:
+            continue
+        keys = ["all"]
+        day_key = f"day-{session.day.isoformat()}"
+        names[day_key] = f"{CALENDAR_NAME}: {session.day:%A, %B} {session.day.day}"
+        keys.append(day_key)
+        if schedule.room:
+            room_key = feed_key("room", schedule.room)
+            names[room_key] = f"{CALENDAR_NAME}: {schedule.room}"
+            keys.append(room_key)
+        if schedule.track:
+            track_key = feed_key("track", schedule.track)
+            names[track_key] = f"{CALENDAR_NAME}: track {schedule.track}"
+            keys.append(track_key)
+        for slug in session.presenter_slugs:
+            if (presenter := repository.presenters.get(slug)) is not None:
+                names[f"presenter-{slug}"] = f"{CALENDAR_NAME}: {presenter.name}"
+                keys.append(f"presenter-{slug}")
+
+        event = render_event(session, repository, modified[session.path.resolve()])
+        for key in dict.fromkeys(keys):
+            events[key].append(event)
+    return {key: (names[key], found) for key, found in events.items()}
+
+
+def export(repository: ContentRepository, writer: Writer) -> list[str]:
+    """Write every feed into ``OUTPUT_PATH``, removing feeds that no longer exist"""
+    feeds = collect_feeds(repository)
+    if not writer.dry_run:
+        OUTPUT_PATH.mkdir(parents=True, exist_ok=True)
+    for key, (name, events) in sorted(feeds.items()):
+        text = "".join(render_calendar(name, events))
+        # written as bytes: CRLF line endings are part of the format
+        writer.write_bytes(OUTPUT_PATH / f"{key}.ics", text.encode("utf-8"))
+    if OUTPUT_PATH.exists():
+        for stale in OUTPUT_PATH.glob("*.ics"):
+            if stale.stem not in feeds:
+                print(f"🗑️ {stale.name} has no sessions anymore")
+                if not writer.dry_run:
+                    stale.unlink()
+    return sorted(feeds)
@@ -0,0 +1,160 @@
+"""Pre-build the responsive webp variants of presenter and organizer photos
+
+This does the same job as the ``image`` shortcode in eleventy.config.js
+(widths 180/300/600, webp, ``{name}-{width}.webp``), ahead of the 11ty build
+and across a process pool. Encoded variants are cached under
+``.cache/tools/images/<content hash>/`` so a photo is only encoded again when
+its bytes change. The manifest tells the shortcode which photos are ready.
+"""
+
+import dataclasses
+import hashlib
+import json
+from pathlib import Path
+
+import constants
+import content
+from repository import ContentRepository
+from writer import Writer
+
+
+WIDTHS = [180, 300, 600]
+FORMAT = "webp"
+QUALITY = 80
+CACHE_DIR = content.CACHE_DIR / "images"
+DIST_PATH = constants.REPO_ROOT / "dist"
+MANIFEST_FILE = constants.REPO_ROOT / "src" / "_data" / "imageManifest.json"
+MANIFEST_VERSION = 1
+
+
+@dataclasses.dataclass
+class Source:
+    path: Path
+    collection: str  # "presenters" or "organizers", also the output folder
+    digest: str = ""
+
+    @property
+    def cache_dir(self) -> Path:
+        return CACHE_DIR / self.digest
+
+    @property
+    def output_dir(self) -> Path:
+        return DIST_PATH / self.collection
+
+
+def find_sources(repository: ContentRepository) -> list[Source]:
+    """Every photo referenced by a presenter or organizer"""
+    sources = {}
+    for collection, people in (
+        ("presenters", repository.presenters),
+        ("organizers", repository.organizers),
+    ):
+        for person in people.values():
+            if not person.photo:
+                continue
+            path = repository.content_path / collection / person.photo
+            if path.exists():
+                sources[path] = Source(path=path, collection=collection)
+    return sorted(sources.values(), key=lambda source: source.path)
+
+
+def output_widths(original_width: int) -> list[int]:
+    """Match eleventy-img: never upscale, use the original width instead"""
+    widths = [width for width in WIDTHS if width <= original_width]
+    if len(widths) < len(WIDTHS):
+        widths.append(original_width)
+    return widths
+
+
+def encode(source_path: Path, cache_dir: Path) -> dict:
+    """Encode every width of one photo into ``cache_dir`` (runs in workers)"""
+    from PIL import Image, ImageOps
+
+    with Image.open(source_path) as original:
+        image = ImageOps.exif_transpose(original)
+        if image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGBA" if "A" in image.getbands() else "RGB")
+        variants = []
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        for width in output_widths(image.width):
+            height = round(image.height * width / image.width)
+            resized = image.resize((width, height), Image.Resampling.LANCZOS)
+            resized.save(cache_dir / f"{width}.{FORMAT}", FORMAT, quality=QUALITY)
+            variants.append({"width": width, "height": height})
+    meta = {"variants": variants}
+    (cache_dir / "meta.json").write_text(json.dumps(meta))
+    return meta
+
+
+def cached_meta(source: Source) -> dict | None:
+    meta_file = source.cache_dir / "meta.json"
+    if not meta_file.exists():
+        return None
+    meta = json.loads(meta_file.read_text())
+    if all(
+        (source.cache_dir / f"{variant['width']}.{FORMAT}").exists()
+        for variant in meta["variants"]
+    ):
+        return meta
+    return None
+
+
+def encode_all(sources: list[Source], jobs: int | None = None) -> dict[Path, dict]:
+    """Encode the photos that aren't cached yet, in parallel"""
+    metas = {}
+    missing = []
+    for source in sources:
+        if (meta := cached_meta(source)) is None:
+            missing.append(source)
+        else:
+            metas[source.path] = meta
+    jobs = jobs or content.default_jobs
+    paths = [source.path for source in missing]
+    cache_dirs = [source.cache_dir for source in missing]
+    if jobs == 1 or len(missing) < 2:
+        results = map(encode, paths, cache_dirs)
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+        from concurrent.futures.process import BrokenProcessPool
+
+        try:
+            with ProcessPoolExecutor(max_workers=jobs) as pool:
+                results = list(pool.map(encode, paths, cache_dirs))
+        except (OSError, NotImplementedError, BrokenProcessPool):
+            results = map(encode, paths, cache_dirs)
+    metas.update(zip(paths, results))
+    return metas
+
+
+def variant_filename(source: Source, width: int) -> str:
+    return f"{source.path.stem}-{width}.{FORMAT}"
+
+
+def build(
+    repository: ContentRepository, writer: Writer, jobs: int | None = None
+) -> dict:
+    """Encode, copy into dist/ and return the manifest"""
+    sources = find_sources(repository)
+    for source in sources:
+        source.digest = hashlib.sha256(source.path.read_bytes()).hexdigest()
+    metas = encode_all(sources, jobs=jobs)
+
+    images = {}
+    for source in sources:
+        variants = []
+        for variant in metas[source.path]["variants"]:
+            filename = variant_filename(source, variant["width"])
+            cached_file = source.cache_dir / f"{variant['width']}.{FORMAT}"
+            if not writer.dry_run:
+                source.output_dir.mkdir(parents=True, exist_ok=True)
+            writer.write_bytes(source.output_dir / filename, cached_file.read_bytes())
+            variants.append(
+                variant | {"filename": filename, "url": f"/{source.collection}/{filename}"}
+            )
+        key = source.path.relative_to(constants.REPO_ROOT).as_posix()
+        images[key] = {
+            "hash": source.digest,
+            "output_dir": f"dist/{source.collection}",
+            "variants": variants,
+        }
+    return {"version": MANIFEST_VERSION, "format": FORMAT, "images": images}
@@ -0,0 +1,262 @@
+"""Find external links in the content that no longer work
+
+Links come from every content file: any ``http(s)://`` value in the
+frontmatter, presenter and organizer ``social`` handles (as the templates
+link them, with Mastodon handles migrated to URLs) and links in markdown
+bodies.
+
+They're checked concurrently with asyncio. Each host gets one
+``requests.Session``, whose connection pool keeps connections alive between
+requests, plus a limit on parallel requests and a minimum gap between them so
+no site sees a burst. A HEAD request comes first, with a GET when the server
+refuses it, and a 429 is retried once after its ``Retry-After``.
+
+Results are cached in ``.cache/tools/links.json``, so a rerun only checks
+links that are new or whose result has expired: working links after
+``--max-age`` days, broken ones after a day.
+"""
+
+from collections import defaultdict
+import dataclasses
+import json
+from pathlib import Path
+import re
+import time
+from typing import Iterable
+from urllib.parse import urlsplit
+
+import constants
+import content
+import models
+
+
+CACHE_FILE = content.CACHE_DIR / "links.json"
+CACHE_VERSION = 1
+URL_PATTERN = re.compile(r"https?://[^\s<>()\[\]\"'`]+")
+# punctuation that ends a sentence rather than a URL
+TRAILING_PUNCTUATION = ".,;:!?*_"
+SOCIAL_URLS = {
+    "bluesky": "https://bsky.app/profile/{}",
+    "github": "https://github.com/{}",
+    "instagram": "https://instagram.com/{}",
+    "twitter": "https://twitter.com/{}",
+}
+USER_AGENT = f"DjangoCon US link checker (+{constants.SITE_JSON['domain']})"
+TIMEOUT_SECONDS = 15
+# per host: requests at once, and the gap between starting two of them
+HOST_CONNECTIONS = 2
+HOST_INTERVAL_SECONDS = 0.25
+# longest Retry-After worth waiting for
+MAX_RETRY_AFTER_SECONDS = 30
+OK_MAX_AGE_DAYS = 7
+BROKEN_MAX_AGE_DAYS = 1
+
+
+@dataclasses.dataclass
+class LinkResult:
+    url: str
+    status: int | None  # the final status, after redirects
+    error: str | None  # why there's no status (timeout, DNS...)
+    checked_at: float
+
+    @property
+    def ok(self) -> bool:
+        return self.status is not None and self.status < 400
+
+    def describe(self) -> str:
+        return str(self.status) if self.status is not None else self.error or "?"
+
+
+def frontmatter_urls(metadata: dict) -> Iterable[str]:
+    for key, value in metadata.items():
+        if key == "social" and isinstance(value, dict):
+            yield from social_urls(value)
+        elif isinstance(value, str) and URL_PATTERN.fullmatch(value.strip()):
+            yield value.strip()
+        elif isinstance(value, list):
+            yield from (
+                item.strip()
+                for item in value
+                if isinstance(item, str) and URL_PATTERN.fullmatch(item.strip())
+            )
+
+
+def social_urls(social: dict) -> Iterable[str]:
+    for network, handle in social.items():
+        if not isinstance(handle, str) or not handle.strip():
+            continue
+        handle = handle.strip()
+        if network == "mastodon" and handle.startswith("@") and handle.count("@") == 2:
+            handle = models.migrate_mastodon_handle(handle=handle)
+        if URL_PATTERN.match(handle):
+            yield handle
+        elif template := SOCIAL_URLS.get(network):
+            yield template.format(handle.lstrip("@"))
+
+
+def body_urls(text: str) -> Iterable[str]:
+    for match in URL_PATTERN.finditer(text):
+        yield match.group(0).rstrip(TRAILING_PUNCTUATION)
+
+
+def collect_links(paths: Iterable[Path]) -> dict[str, set[Path]]:
+    """Every external URL in ``paths`` → the files it appears in"""
+    found: dict[str, set[Path]] = defaultdict(set)
+    for loaded in content.load_many(paths):
+        for url in frontmatter_urls(loaded.metadata):
+            found[url].add(loaded.path)
+        for url in body_urls(loaded.content):
+            found[url].add(loaded.path)
+    return dict(found)
+
+
+class LinkCache:
+    def __init__(self, cache_file: Path = CACHE_FILE):
+        self.cache_file = cache_file
+        self.results: dict[str, LinkResult] = {}
+        if cache_file.exists():
+            try:
+                data = json.loads(cache_file.read_text())
+            except ValueError:
+                return  # a corrupt cache is an empty one
+            if data.get("version") == CACHE_VERSION:
+                self.results = {
+                    url: LinkResult(url=url, **result)
+                    for url, result in data["results"].items()
+                }
+
+    def fresh(self, url: str, max_age_days: float, now: float) -> LinkResult | None:
+        result = self.results.get(url)
+        if result is None:
+            return None
+        max_age = max_age_days if result.ok else min(max_age_days, BROKEN_MAX_AGE_DAYS)
+        return result if now - result.checked_at < max_age * 86400 else None
+
+    def save(self) -> None:
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        results = {
+            url: {
+                key: value
+                for key, value in dataclasses.asdict(result).items()
+                if key != "url"
+            }
+            for url, result in sorted(self.results.items())
+        }
+        self.cache_file.write_text(
+            json.dumps({"version": CACHE_VERSION, "results": results}, indent=1) + "\n"
+        )
+
+
+class Host:
+    """One site's session (and its connection pool), concurrency and pacing"""
+
+    def __init__(self):
+        import asyncio
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        self.session = requests.Session()
+        self.session.headers["User-Agent"] = USER_AGENT
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=HOST_CONNECTIONS)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.slots = asyncio.Semaphore(HOST_CONNECTIONS)
+        self.pacing = asyncio.Lock()
+        self.next_start = 0.0
+
+    async def wait_turn(self) -> None:
+        import asyncio
+
+        async with self.pacing:
+            now = time.monotonic()
+            if self.next_start > now:
+                await asyncio.sleep(self.next_start - now)
+            self.next_start = max(now, self.next_start) + HOST_INTERVAL_SECONDS
+
+    def fetch(self, url: str) -> tuple[int | None, str | None, float | None]:
+        """(status, error, seconds to wait before retrying) for one URL"""
+        import requests
+
+        try:
+            response = self.session.head(
+                url, allow_redirects=True, timeout=TIMEOUT_SECONDS
+            )
+            if response.status_code >= 400 and response.status_code != 429:
+                # plenty of servers answer HEAD with 403/404/405 but GET just fine
+                response = self.session.get(
+                    url, allow_redirects=True, timeout=TIMEOUT_SECONDS, stream=True
+                )
+                response.close()
+        except requests.RequestException as error:
+            return None, type(error).__name__, None
+        retry_after = None
+        if response.status_code == 429:
+            try:
+                retry_after = float(response.headers.get("Retry-After", 1))
+            except ValueError:
+                retry_after = 1.0
+        return response.status_code, None, retry_after
+
+    async def check(self, url: str) -> LinkResult:
+        import asyncio
+
+        async with self.slots:
+            await self.wait_turn()
+            status, error, retry_after = await asyncio.to_thread(self.fetch, url)
+            if retry_after is not None and retry_after <= MAX_RETRY_AFTER_SECONDS:
+                await asyncio.sleep(retry_after)
+                await self.wait_turn()
+                status, error, _ = await asyncio.to_thread(self.fetch, url)
+        return LinkResult(url=url, status=status, error=error, checked_at=time.time())
+
+    def close(self) -> None:
+        self.session.close()
+
+
+async def check_urls(urls: list[str], jobs: int) -> list[LinkResult]:
+    """Check ``urls`` with at most ``jobs`` requests in flight overall"""
+    import asyncio
+    from concurrent.futures import ThreadPoolExecutor
+
+    loop = asyncio.get_running_loop()
+    executor = ThreadPoolExecutor(max_workers=jobs)
+    # asyncio.to_thread runs on the default executor
+    loop.set_default_executor(executor)
+    hosts: dict[str, Host] = {}
+    try:
+        return await asyncio.gather(
+            *(
+                hosts.setdefault(urlsplit(url).netloc.lower(), Host()).check(url)
+                for url in urls
+            )
+        )
+    finally:
+        for host in hosts.values():
+            host.close()
+        executor.shutdown(wait=False)
+
+
+def check_links(
+    urls: Iterable[str],
+    cache: LinkCache,
+    max_age_days: float = OK_MAX_AGE_DAYS,
+    refresh: bool = False,
+    jobs: int = 16,
+) -> tuple[dict[str, LinkResult], int]:
+    """Results for ``urls`` and how many had to be checked; updates the cache"""
+    import asyncio
+
+    now = time.time()
+    results = {}
+    stale = []
+    for url in sorted(set(urls)):
+        cached = None if refresh else cache.fresh(url, max_age_days, now)
+        if cached is not None:
+            results[url] = cached
+        else:
+            stale.append(url)
+    if stale:
+        for result in asyncio.run(check_urls(stale, jobs)):
+            results[result.url] = cache.results[result.url] = result
+        cache.save()
+    return results, len(stale)
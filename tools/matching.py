@@ -0,0 +1,122 @@
+"""Fuzzy-match free text (like a video title) to talks
+
+Talk titles and presenter names are broken into words and character trigrams
+and put into one inverted index, weighted by how rare each feature is. A query
+only scores the talks that share a feature with it, so matching a whole
+playlist is roughly linear in its size rather than videos × talks.
+"""
+
+from collections import defaultdict
+import dataclasses
+import math
+import re
+import unicodedata
+from typing import Generic, Hashable, Iterable, TypeVar
+
+
+KeyT = TypeVar("KeyT", bound=Hashable)
+
+STOPWORDS = {"a", "an", "and", "for", "in", "of", "on", "the", "to", "with"}
+# presenter matches count for more than a shared title word
+PRESENTER_WEIGHT = 2.0
+# an automatic match needs this score, and this lead over the runner-up
+CONFIDENT_SCORE = 0.5
+CONFIDENT_MARGIN = 0.15
+
+
+def normalize(text: str) -> str:
+    text = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode()
+    return re.sub(r"[^a-z0-9]+", " ", text.lower()).strip()
+
+
+def words(text: str) -> list[str]:
+    return [word for word in normalize(text).split() if word not in STOPWORDS]
+
+
+def trigrams(text: str) -> set[str]:
+    grams = set()
+    for word in words(text):
+        padded = f" {word} "
+        grams.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+def features(title: str, presenters: Iterable[str]) -> dict[str, float]:
+    result = {f"w:{word}": 1.0 for word in words(title)}
+    result.update({f"g:{gram}": 0.5 for gram in trigrams(title)})
+    for name in presenters:
+        result.update({f"p:{word}": PRESENTER_WEIGHT for word in words(name)})
+    return result
+
+
+@dataclasses.dataclass
+class Match(Generic[KeyT]):
+    key: KeyT
+    title: str
+    score: float
+
+
+class TalkIndex(Generic[KeyT]):
+    def __init__(self, talks: Iterable[tuple[KeyT, str, list[str]]]):
+        """Index ``(key, title, presenter names)`` for each talk"""
+        self.keys: list[KeyT] = []
+        self.titles: list[str] = []
+        talk_features: list[dict[str, float]] = []
+        document_frequency: dict[str, int] = defaultdict(int)
+        for key, title, presenters in talks:
+            self.keys.append(key)
+            self.titles.append(title)
+            talk_features.append(found := features(title, presenters))
+            for feature in found:
+                document_frequency[feature] += 1
+
+        total = len(self.keys)
+        self.idf = {
+            feature: math.log((1 + total) / (1 + count)) + 1
+            for feature, count in document_frequency.items()
+        }
+        self.postings: dict[str, list[tuple[int, float]]] = defaultdict(list)
+        self.norms: list[float] = []
+        for talk_id, found in enumerate(talk_features):
+            weights = {
+                feature: weight * self.idf[feature] for feature, weight in found.items()
+            }
+            for feature, weight in weights.items():
+                self.postings[feature].append((talk_id, weight))
+            self.norms.append(math.sqrt(sum(w * w for w in weights.values())) or 1.0)
+
+    def search(
+        self, title: str, presenters: Iterable[str] = (), limit: int = 5
+    ) -> list[Match[KeyT]]:
+        """The best ``limit`` talks for the query, by cosine similarity"""
+        query = {
+            feature: weight * self.idf[feature]
+            for feature, weight in features(title, presenters).items()
+            if feature in self.idf
+        }
+        query_norm = math.sqrt(sum(w * w for w in query.values())) or 1.0
+        scores: dict[int, float] = defaultdict(float)
+        for feature, query_weight in query.items():
+            for talk_id, weight in self.postings[feature]:
+                scores[talk_id] += query_weight * weight
+        ranked = sorted(
+            (
+                Match(
+                    key=self.keys[talk_id],
+                    title=self.titles[talk_id],
+                    score=score / (query_norm * self.norms[talk_id]),
+                )
+                for talk_id, score in scores.items()
+            ),
+            key=lambda match: -match.score,
+        )
+        return ranked[:limit]
+
+
+def confident(matches: list[Match]) -> Match | None:
+    """The top match, if it's good enough to apply without a human"""
+    if not matches or matches[0].score < CONFIDENT_SCORE:
+        return None
+    if len(matches) > 1 and matches[0].score - matches[1].score < CONFIDENT_MARGIN:
+        return None
+    return matches[0]
@@ -1,24 +1,36 @@
 import datetime as pydatetime  # rename is needed because of yaml conflict
+import functools
 from typing import Literal
 
-from pydantic import BaseModel
-from slugify import slugify
+from pydantic import BaseModel, ConfigDict
 
 import constants
 
 
-class FrontmatterModel(BaseModel):
+def slugify(text: str) -> str:
+    # python-slugify is only needed for a few permalinks, so load it on first use
+    from slugify import slugify
+
+    return slugify(text)
+
+
+class LazyModel(BaseModel):
+    # build validators on first use, not at import: most tools only need a few
+    model_config = ConfigDict(defer_build=True)
+
+
+class FrontmatterModel(LazyModel):
     """
     Our base class for our default "Frontmatter" fields.
     """
 
     permalink: str | None = None
-    redirect_from: list[str] | None = None
+    redirect_from: list[str] | str | None = None  # one URL or a list
     redirect_to: str | None = None  # via the jekyll-redirect-from plugin
     title: str | None = None
 
 
-class Social(BaseModel):
+class Social(LazyModel):
     github: str | None = None
     website: str | None = None
     mastodon: str | None = None
@@ -29,8 +41,8 @@ class Social(BaseModel):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         if self.mastodon and self.mastodon.startswith("@"):
+            # `process.py normalize` saves this to the file
             self.mastodon = migrate_mastodon_handle(handle=self.mastodon)
-            print(f"🚜 converting {self.mastodon=}")
 
 
 class Organizer(FrontmatterModel):
@@ -56,8 +68,9 @@ class Post(FrontmatterModel):
     author: str | None = None
     category: str | None = "General"  # TODO: build a list of these
     categories: list[str] | None = None
-    date: pydatetime.datetime  # YYYY-MM-DD HH:MM:SS +/-TTTT
+    hidden: bool = False
     image: str | None = None
+    published_datetime: pydatetime.datetime  # YYYY-MM-DD HH:MM:SS
     slug: str | None = None
     tags: list[str] | None = []
 
@@ -92,6 +105,7 @@ class Schedule(FrontmatterModel):
     ]
     difficulty: str | None = "All"
     end_datetime: pydatetime.datetime | None = None
+    hidden: bool = False
 
     image: str | None = None
     presenter_slugs: list[str] | None = None
@@ -120,7 +134,7 @@ class Schedule(FrontmatterModel):
         )
 
 
-class ManualScheduleEntry(BaseModel):
+class ManualScheduleEntry(LazyModel):
     start_datetime: pydatetime.datetime
     end_datetime: pydatetime.datetime
     permalink: str | None
@@ -150,587 +164,600 @@ def migrate_mastodon_handle(*, handle: str) -> str:
     return f"https://{domain}/@{username}"
 
 
-MANUAL_SCHEDULE_ENTRIES = [
-    # Sunday breakfast
-    # ManualScheduleEntry(
-    #     start_datetime=pydatetime.datetime.combine(
-    #         constants.TUTORIAL_DAY,
-    #         pydatetime.time(8),
-    #         tzinfo=constants.CONFERENCE_TZ,
-    #     ),
-    #     end_datetime=pydatetime.datetime.combine(
-    #         constants.TUTORIAL_DAY,
-    #         pydatetime.time(9),
-    #         tzinfo=constants.CONFERENCE_TZ,
-    #     ),
-    #     group="lunch",
-    #     permalink=constants.SUNDAY_BREAKFAST_LINK,
-    #     room=constants.LUNCH_ROOM,
-    #     title="Continental Breakfast",
-    #     track="t0",
-    # ),
-    # # TODO decide whether we'll have quiet/lactation rooms on tutorial day
-    # ManualScheduleEntry(
-    #     start_datetime=pydatetime.datetime.combine(
-    #         constants.TUTORIAL_DAY,
-    #         pydatetime.time(8),
-    #         tzinfo=constants.CONFERENCE_TZ,
-    #     ),
-    #     end_datetime=pydatetime.datetime.combine(
-    #         constants.TUTORIAL_DAY,
-    #         pydatetime.time(18),
-    #         tzinfo=constants.CONFERENCE_TZ,
-    #     ),
-    #     group="break",
-    #     permalink=None,
-    #     room=f"In front of {constants.LARGE_TALK_ROOM}",
-    #     title="Registration",
-    #     track="t0",
-    # ),
-    # # sunday lunch
-    # ManualScheduleEntry(
-    #     start_datetime=pydatetime.datetime.combine(
-    #         constants.TUTORIAL_DAY,
-    #         pydatetime.time(12, 30),
-    #         tzinfo=constants.CONFERENCE_TZ,
-    #     ),
-    #     end_datetime=pydatetime.datetime.combine(
-    #         constants.TUTORIAL_DAY,
-    #         pydatetime.time(13, 30),
-    #         tzinfo=constants.CONFERENCE_TZ,
-    #     ),
-    #     group="lunch",
-    #     permalink=constants.SUNDAY_LUNCH_LINK,
-    #     room=constants.LUNCH_ROOM,
-    #     title="Lunch",
-    #     track="t0",
-    # ),
-    # Monday!
-    ManualScheduleEntry(
-        start_datetime=pydatetime.datetime.combine(
-            constants.TALK_DAY_1,
-            pydatetime.time(7, 30),
-            tzinfo=constants.CONFERENCE_TZ,
-        ),
-        end_datetime=pydatetime.datetime.combine(
-            constants.TALK_DAY_1,
-            pydatetime.time(8, 30),
-            tzinfo=constants.CONFERENCE_TZ,
-        ),
-        group="lunch",
-        permalink=constants.MONDAY_BREAKFAST_LINK,
-        room=constants.LUNCH_ROOM,
-        title="Continental Breakfast",
-        track="t0",
-    ),
-    ManualScheduleEntry(
-        start_datetime=pydatetime.datetime.combine(
-            constants.TALK_DAY_1,
-            pydatetime.time(7, 30),
-            tzinfo=constants.CONFERENCE_TZ,
-        ),
-        end_datetime=pydatetime.datetime.combine(
-            constants.TALK_DAY_1,
-            pydatetime.time(17, 30),
-            tzinfo=constants.CONFERENCE_TZ,
-        ),
-        group="break",
-        permalink=None,
-        room=f"In front of {constants.LARGE_TALK_ROOM}",
-        title="Registration",
-        track="t0",
-    ),
-    ManualScheduleEntry(
-        start_datetime=pydatetime.datetime.combine(
-            constants.TALK_DAY_1,
-            pydatetime.time(8),
-            tzinfo=constants.CONFERENCE_TZ,
-        ),
-        end_datetime=pydatetime.datetime.combine(
-            constants.TALK_DAY_1,
-            pydatetime.time(17, 30),
-            tzinfo=constants.CONFERENCE_TZ,
-        ),
-        group="break",
-        permalink=constants.LACTATION_BLOG_POST_LINK,
-        room=constants.LACTATION_ROOM,
-        title="Lactation Room",
-        track="t0",
-    ),
-    ManualScheduleEntry(
-        start_datetime=pydatetime.datetime.combine(
-            constants.TALK_DAY_1,
-            pydatetime.time(8),
-            tzinfo=constants.CONFERENCE_TZ,
-        ),
-        end_datetime=pydatetime.datetime.combine(
-            constants.TALK_DAY_1,
-            pydatetime.time(17, 30),
-            tzinfo=constants.CONFERENCE_TZ,
-        ),
-        group="break",
-        permalink=None,
-        room=constants.QUIET_ROOM,
-        title="Quiet Room",
-        track="t0",
-    ),
-    ManualScheduleEntry(
-        start_datetime=pydatetime.datetime.combine(
-            constants.TALK_DAY_1,
-            pydatetime.time(8),
-            tzinfo=constants.CONFERENCE_TZ,
-        ),
-        end_datetime=pydatetime.datetime.combine(
-            constants.TALK_DAY_1,
-            pydatetime.time(17, 30),
-            tzinfo=constants.CONFERENCE_TZ,
-        ),
-        group="break",
-        permalink=None,
-        room=constants.GREEN_ROOM,
-        title="Speaker Green Room",
-        track="t0",
-    ),
-    ManualScheduleEntry(
-        start_datetime=pydatetime.datetime.combine(
-            constants.TALK_DAY_1,
-            pydatetime.time(10, 10),
-            tzinfo=constants.CONFERENCE_TZ,
-        ),
-        end_datetime=pydatetime.datetime.combine(
-            constants.TALK_DAY_1,
-            pydatetime.time(10, 35),
-            tzinfo=constants.CONFERENCE_TZ,
-        ),
-        group="break",
-        permalink=constants.MONDAY_MORNING_BREAK_LINK,
-        room=constants.LUNCH_ROOM,
-        title="Break",
-        track="t0",
-    ),
-    # monday early lunch
-    ManualScheduleEntry(
-        start_datetime=pydatetime.datetime.combine(
-            constants.TALK_DAY_1,
-            constants.LIGHTNING_TALK_START_TIME,
-            tzinfo=constants.CONFERENCE_TZ,
-        ),
-        end_datetime=pydatetime.datetime.combine(
-            constants.TALK_DAY_1,
-            constants.LIGHTNING_TALK_END_TIME,
-            tzinfo=constants.CONFERENCE_TZ,
-        ),
-        group="lunch",
-        permalink=constants.MONDAY_LUNCH_LINK,
-        room=constants.LUNCH_ROOM,
-        title="Early Lunch",
-        track="t0",
-    ),
-    # monday main lunch
-    ManualScheduleEntry(
-        start_datetime=pydatetime.datetime.combine(
-            constants.TALK_DAY_1,
-            constants.LIGHTNING_TALK_END_TIME,
-            tzinfo=constants.CONFERENCE_TZ,
-        ),
-        end_datetime=pydatetime.datetime.combine(
-            constants.TALK_DAY_1,
-            # NOTE this must match the length of the online talk
-            constants.LUNCH_END_TIME,
-            tzinfo=constants.CONFERENCE_TZ,
-        ),
-        group="lunch",
-        permalink=constants.MONDAY_LUNCH_LINK,
-        room=constants.LUNCH_ROOM,
-        title="Lunch",
-        track="t0",
-    ),
-    # monday PM break
-    ManualScheduleEntry(
-        start_datetime=pydatetime.datetime.combine(
-            constants.TALK_DAY_1,
-            pydatetime.time(15, 30),
-            tzinfo=constants.CONFERENCE_TZ,
-        ),
-        end_datetime=pydatetime.datetime.combine(
-            constants.TALK_DAY_1,
-            pydatetime.time(15, 55),
-            tzinfo=constants.CONFERENCE_TZ,
-        ),
-        group="break",
-        permalink=constants.MONDAY_AFTERNOON_BREAK_LINK,
-        room=constants.LUNCH_ROOM,
-        title="Break",
-        track="t0",
-    ),
-    # board game night
-    ManualScheduleEntry(
-        start_datetime=pydatetime.datetime.combine(
-            constants.TALK_DAY_1,
-            pydatetime.time(19),
-            tzinfo=constants.CONFERENCE_TZ,
-        ),
-        end_datetime=pydatetime.datetime.combine(
-            constants.TALK_DAY_1,
-            pydatetime.time(22),
-            tzinfo=constants.CONFERENCE_TZ,
-        ),
-        group="break",
-        permalink=None,  # TODO add social link here
-        room=constants.LARGE_TALK_ROOM,
-        title="Board Game Night",
-        track="t0",
-    ),
-    # Tuesday!
-    ManualScheduleEntry(
-        start_datetime=pydatetime.datetime.combine(
-            constants.TALK_DAY_2,
-            pydatetime.time(8),
-            tzinfo=constants.CONFERENCE_TZ,
-        ),
-        end_datetime=pydatetime.datetime.combine(
-            constants.TALK_DAY_2,
-            pydatetime.time(9),
-            tzinfo=constants.CONFERENCE_TZ,
-        ),
-        group="lunch",
-        permalink=constants.TUESDAY_BREAKFAST_LINK,
-        room=constants.LUNCH_ROOM,
-        title="Continental Breakfast",
-        track="t0",
-    ),
-    ManualScheduleEntry(
-        start_datetime=pydatetime.datetime.combine(
-            constants.TALK_DAY_2,
-            pydatetime.time(8),
-            tzinfo=constants.CONFERENCE_TZ,
-        ),
-        end_datetime=pydatetime.datetime.combine(
-            constants.TALK_DAY_2,
-            pydatetime.time(17),
-            tzinfo=constants.CONFERENCE_TZ,
-        ),
-        group="break",
-        permalink=None,
-        room=f"In front of {constants.LARGE_TALK_ROOM}",
-        title="Registration",
-        track="t0",
-    ),
-    ManualScheduleEntry(
-        start_datetime=pydatetime.datetime.combine(
-            constants.TALK_DAY_2,
-            pydatetime.time(8),
-            tzinfo=constants.CONFERENCE_TZ,
-        ),
-        end_datetime=pydatetime.datetime.combine(
-            constants.TALK_DAY_2,
-            pydatetime.time(17, 30),
-            tzinfo=constants.CONFERENCE_TZ,
-        ),
-        group="break",
-        permalink=constants.LACTATION_BLOG_POST_LINK,
-        room=constants.LACTATION_ROOM,
-        title="Lactation Room",
-        track="t0",
-    ),
-    ManualScheduleEntry(
-        start_datetime=pydatetime.datetime.combine(
-            constants.TALK_DAY_2,
-            pydatetime.time(8),
-            tzinfo=constants.CONFERENCE_TZ,
-        ),
-        end_datetime=pydatetime.datetime.combine(
-            constants.TALK_DAY_2,
-            pydatetime.time(17, 30),
-            tzinfo=constants.CONFERENCE_TZ,
-        ),
-        group="break",
-        permalink=None,
-        room=constants.QUIET_ROOM,
-        title="Quiet Room",
-        track="t0",
-    ),
-    ManualScheduleEntry(
-        start_datetime=pydatetime.datetime.combine(
-            constants.TALK_DAY_2,
-            pydatetime.time(8),
-            tzinfo=constants.CONFERENCE_TZ,
-        ),
-        end_datetime=pydatetime.datetime.combine(
-            constants.TALK_DAY_2,
-            pydatetime.time(17, 30),
-            tzinfo=constants.CONFERENCE_TZ,
-        ),
-        group="break",
-        permalink=None,
-        room=constants.GREEN_ROOM,
-        title="Speaker Green Room",
-        track="t0",
-    ),
-    ManualScheduleEntry(
-        start_datetime=pydatetime.datetime.combine(
-            constants.TALK_DAY_2,
-            pydatetime.time(10, 10),
-            tzinfo=constants.CONFERENCE_TZ,
-        ),
-        end_datetime=pydatetime.datetime.combine(
-            constants.TALK_DAY_2,
-            pydatetime.time(10, 35),
-            tzinfo=constants.CONFERENCE_TZ,
-        ),
-        group="break",
-        permalink=constants.TUESDAY_MORNING_BREAK_LINK,
-        room=constants.LUNCH_ROOM,
-        title="Break",
-        track="t0",
-    ),
-    # tuesday early lunch
-    ManualScheduleEntry(
-        start_datetime=pydatetime.datetime.combine(
-            constants.TALK_DAY_2,
-            constants.LIGHTNING_TALK_START_TIME,
-            tzinfo=constants.CONFERENCE_TZ,
-        ),
-        end_datetime=pydatetime.datetime.combine(
-            constants.TALK_DAY_2,
-            constants.LIGHTNING_TALK_END_TIME,
-            tzinfo=constants.CONFERENCE_TZ,
-        ),
-        group="lunch",
-        permalink=constants.TUESDAY_LUNCH_LINK,
-        room=constants.LUNCH_ROOM,
-        title="Early Lunch",
-        track="t0",
-    ),
-    # tuesday main lunch
-    ManualScheduleEntry(
-        start_datetime=pydatetime.datetime.combine(
-            constants.TALK_DAY_2,
-            constants.LIGHTNING_TALK_END_TIME,
-            tzinfo=constants.CONFERENCE_TZ,
-        ),
-        end_datetime=pydatetime.datetime.combine(
-            constants.TALK_DAY_2,
-            # NOTE this must match the length of the online talk
-            constants.LUNCH_END_TIME,
-            tzinfo=constants.CONFERENCE_TZ,
-        ),
-        group="lunch",
-        permalink=constants.TUESDAY_LUNCH_LINK,
-        room=constants.LUNCH_ROOM,
-        title="Lunch",
-        track="t0",
-    ),
-    # tuesday PM break
-    ManualScheduleEntry(
-        start_datetime=pydatetime.datetime.combine(
-            constants.TALK_DAY_2,
-            pydatetime.time(15, 0),
-            tzinfo=constants.CONFERENCE_TZ,
-        ),
-        end_datetime=pydatetime.datetime.combine(
-            constants.TALK_DAY_2,
-            pydatetime.time(15, 25),
-            tzinfo=constants.CONFERENCE_TZ,
-        ),
-        group="break",
-        permalink=constants.TUESDAY_AFTERNOON_BREAK_LINK,
-        room=constants.LUNCH_ROOM,
-        title="Break",
-        track="t0",
-    ),
-    # Wednesday!
-    ManualScheduleEntry(
-        start_datetime=pydatetime.datetime.combine(
-            constants.TALK_DAY_3,
-            pydatetime.time(8),
-            tzinfo=constants.CONFERENCE_TZ,
-        ),
-        end_datetime=pydatetime.datetime.combine(
-            constants.TALK_DAY_3,
-            pydatetime.time(9),
-            tzinfo=constants.CONFERENCE_TZ,
-        ),
-        group="lunch",
-        permalink=constants.WEDNESDAY_BREAKFAST_LINK,
-        room=constants.LUNCH_ROOM,
-        title="Continental Breakfast",
-        track="t0",
-    ),
-    ManualScheduleEntry(
-        start_datetime=pydatetime.datetime.combine(
-            constants.TALK_DAY_3,
-            pydatetime.time(8),
-            tzinfo=constants.CONFERENCE_TZ,
-        ),
-        end_datetime=pydatetime.datetime.combine(
-            constants.TALK_DAY_3,
-            pydatetime.time(17),
-            tzinfo=constants.CONFERENCE_TZ,
-        ),
-        group="break",
-        permalink=None,
-        room=f"In front of {constants.LARGE_TALK_ROOM}",
-        title="Registration",
-        track="t0",
-    ),
-    ManualScheduleEntry(
-        start_datetime=pydatetime.datetime.combine(
-            constants.TALK_DAY_3,
-            pydatetime.time(8),
-            tzinfo=constants.CONFERENCE_TZ,
-        ),
-        end_datetime=pydatetime.datetime.combine(
-            constants.TALK_DAY_3,
-            pydatetime.time(17, 30),
-            tzinfo=constants.CONFERENCE_TZ,
-        ),
-        group="break",
-        permalink=constants.LACTATION_BLOG_POST_LINK,
-        room=constants.LACTATION_ROOM,
-        title="Lactation Room",
-        track="t0",
-    ),
-    ManualScheduleEntry(
-        start_datetime=pydatetime.datetime.combine(
-            constants.TALK_DAY_3,
-            pydatetime.time(8),
-            tzinfo=constants.CONFERENCE_TZ,
-        ),
-        end_datetime=pydatetime.datetime.combine(
-            constants.TALK_DAY_3,
-            pydatetime.time(17, 30),
-            tzinfo=constants.CONFERENCE_TZ,
-        ),
-        group="break",
-        permalink=None,
-        room=constants.QUIET_ROOM,
-        title="Quiet Room",
-        track="t0",
-    ),
-    ManualScheduleEntry(
-        start_datetime=pydatetime.datetime.combine(
-            constants.TALK_DAY_3,
-            pydatetime.time(8),
-            tzinfo=constants.CONFERENCE_TZ,
-        ),
-        end_datetime=pydatetime.datetime.combine(
-            constants.TALK_DAY_3,
-            pydatetime.time(17, 30),
-            tzinfo=constants.CONFERENCE_TZ,
-        ),
-        group="break",
-        permalink=None,
-        room=constants.GREEN_ROOM,
-        title="Speaker Green Room",
-        track="t0",
-    ),
-    ManualScheduleEntry(
-        start_datetime=pydatetime.datetime.combine(
-            constants.TALK_DAY_3,
-            pydatetime.time(10, 10),
-            tzinfo=constants.CONFERENCE_TZ,
-        ),
-        end_datetime=pydatetime.datetime.combine(
-            constants.TALK_DAY_3,
-            pydatetime.time(10, 35),
-            tzinfo=constants.CONFERENCE_TZ,
-        ),
-        group="break",
-        permalink=constants.WEDNESDAY_MORNING_BREAK_LINK,
-        room=constants.LUNCH_ROOM,
-        title="Break",
-        track="t0",
-    ),
-    # wed early lunch
-    ManualScheduleEntry(
-        start_datetime=pydatetime.datetime.combine(
-            constants.TALK_DAY_3,
-            constants.LIGHTNING_TALK_START_TIME,
-            tzinfo=constants.CONFERENCE_TZ,
-        ),
-        end_datetime=pydatetime.datetime.combine(
-            constants.TALK_DAY_3,
-            constants.LIGHTNING_TALK_END_TIME,
-            tzinfo=constants.CONFERENCE_TZ,
-        ),
-        group="lunch",
-        permalink=constants.WEDNESDAY_LUNCH_LINK,
-        room=constants.LUNCH_ROOM,
-        title="Early Lunch",
-        track="t0",
-    ),
-    # wed main lunch
-    ManualScheduleEntry(
-        start_datetime=pydatetime.datetime.combine(
-            constants.TALK_DAY_3,
-            constants.LIGHTNING_TALK_END_TIME,
-            tzinfo=constants.CONFERENCE_TZ,
-        ),
-        end_datetime=pydatetime.datetime.combine(
-            constants.TALK_DAY_3,
-            # NOTE this must match the length of the online talk
-            constants.LUNCH_END_TIME,
-            tzinfo=constants.CONFERENCE_TZ,
-        ),
-        group="lunch",
-        permalink=constants.WEDNESDAY_LUNCH_LINK,
-        room=constants.LUNCH_ROOM,
-        title="Lunch",
-        track="t0",
-    ),
-    # wed PM break
-    ManualScheduleEntry(
-        start_datetime=pydatetime.datetime.combine(
-            constants.TALK_DAY_3,
-            pydatetime.time(15, 0),
-            tzinfo=constants.CONFERENCE_TZ,
-        ),
-        end_datetime=pydatetime.datetime.combine(
-            constants.TALK_DAY_3,
-            pydatetime.time(15, 25),
-            tzinfo=constants.CONFERENCE_TZ,
-        ),
-        group="break",
-        permalink=constants.WEDNESDAY_AFTERNOON_BREAK_LINK,
-        room=constants.LUNCH_ROOM,
-        title="Break",
-        track="t0",
-    ),
-    # Thursday!
-    ManualScheduleEntry(
-        start_datetime=pydatetime.datetime.combine(
-            constants.SPRINTS_DAY_1,
-            pydatetime.time(9),
-            tzinfo=constants.CONFERENCE_TZ,
-        ),
-        end_datetime=pydatetime.datetime.combine(
-            constants.SPRINTS_DAY_1,
-            pydatetime.time(17),
-            tzinfo=constants.CONFERENCE_TZ,
-        ),
-        group="talks",
-        permalink=None,
-        room=constants.LARGE_TALK_ROOM,
-        title="Contribution Sprints",
-        track="t0",
-    ),
-    # Friday!
-    ManualScheduleEntry(
-        start_datetime=pydatetime.datetime.combine(
-            constants.SPRINTS_DAY_2,
-            pydatetime.time(9),
-            tzinfo=constants.CONFERENCE_TZ,
-        ),
-        end_datetime=pydatetime.datetime.combine(
-            constants.SPRINTS_DAY_2,
-            pydatetime.time(17),
-            tzinfo=constants.CONFERENCE_TZ,
+@functools.cache
+def manual_schedule_entries() -> list[ManualScheduleEntry]:
+    """The breaks, meals and other entries that don't come from a talk file
+
+    Built on first use rather than at import, since most tools never need them.
+    """
+    return [
+        # Sunday breakfast
+        # ManualScheduleEntry(
+        #     start_datetime=pydatetime.datetime.combine(
+        #         constants.TUTORIAL_DAY,
+        #         pydatetime.time(8),
+        #         tzinfo=constants.CONFERENCE_TZ,
+        #     ),
+        #     end_datetime=pydatetime.datetime.combine(
+        #         constants.TUTORIAL_DAY,
+        #         pydatetime.time(9),
+        #         tzinfo=constants.CONFERENCE_TZ,
+        #     ),
+        #     group="lunch",
+        #     permalink=constants.SUNDAY_BREAKFAST_LINK,
+        #     room=constants.LUNCH_ROOM,
+        #     title="Continental Breakfast",
+        #     track="t0",
+        # ),
+        # # TODO decide whether we'll have quiet/lactation rooms on tutorial day
+        # ManualScheduleEntry(
+        #     start_datetime=pydatetime.datetime.combine(
+        #         constants.TUTORIAL_DAY,
+        #         pydatetime.time(8),
+        #         tzinfo=constants.CONFERENCE_TZ,
+        #     ),
+        #     end_datetime=pydatetime.datetime.combine(
+        #         constants.TUTORIAL_DAY,
+        #         pydatetime.time(18),
+        #         tzinfo=constants.CONFERENCE_TZ,
+        #     ),
+        #     group="break",
+        #     permalink=None,
+        #     room=f"In front of {constants.LARGE_TALK_ROOM}",
+        #     title="Registration",
+        #     track="t0",
+        # ),
+        # # sunday lunch
+        # ManualScheduleEntry(
+        #     start_datetime=pydatetime.datetime.combine(
+        #         constants.TUTORIAL_DAY,
+        #         pydatetime.time(12, 30),
+        #         tzinfo=constants.CONFERENCE_TZ,
+        #     ),
+        #     end_datetime=pydatetime.datetime.combine(
+        #         constants.TUTORIAL_DAY,
+        #         pydatetime.time(13, 30),
+        #         tzinfo=constants.CONFERENCE_TZ,
+        #     ),
+        #     group="lunch",
+        #     permalink=constants.SUNDAY_LUNCH_LINK,
+        #     room=constants.LUNCH_ROOM,
+        #     title="Lunch",
+        #     track="t0",
+        # ),
+        # Monday!
+        ManualScheduleEntry(
+            start_datetime=pydatetime.datetime.combine(
+                constants.TALK_DAY_1,
+                pydatetime.time(7, 30),
+                tzinfo=constants.CONFERENCE_TZ,
+            ),
+            end_datetime=pydatetime.datetime.combine(
+                constants.TALK_DAY_1,
+                pydatetime.time(8, 30),
+                tzinfo=constants.CONFERENCE_TZ,
+            ),
+            group="lunch",
+            permalink=constants.MONDAY_BREAKFAST_LINK,
+            room=constants.LUNCH_ROOM,
+            title="Continental Breakfast",
+            track="t0",
+        ),
+        ManualScheduleEntry(
+            start_datetime=pydatetime.datetime.combine(
+                constants.TALK_DAY_1,
+                pydatetime.time(7, 30),
+                tzinfo=constants.CONFERENCE_TZ,
+            ),
+            end_datetime=pydatetime.datetime.combine(
+                constants.TALK_DAY_1,
+                pydatetime.time(17, 30),
+                tzinfo=constants.CONFERENCE_TZ,
+            ),
+            group="break",
+            permalink=None,
+            room=f"In front of {constants.LARGE_TALK_ROOM}",
+            title="Registration",
+            track="t0",
+        ),
+        ManualScheduleEntry(
+            start_datetime=pydatetime.datetime.combine(
+                constants.TALK_DAY_1,
+                pydatetime.time(8),
+                tzinfo=constants.CONFERENCE_TZ,
+            ),
+            end_datetime=pydatetime.datetime.combine(
+                constants.TALK_DAY_1,
+                pydatetime.time(17, 30),
+                tzinfo=constants.CONFERENCE_TZ,
+            ),
+            group="break",
+            permalink=constants.LACTATION_BLOG_POST_LINK,
+            room=constants.LACTATION_ROOM,
+            title="Lactation Room",
+            track="t0",
+        ),
+        ManualScheduleEntry(
+            start_datetime=pydatetime.datetime.combine(
+                constants.TALK_DAY_1,
+                pydatetime.time(8),
+                tzinfo=constants.CONFERENCE_TZ,
+            ),
+            end_datetime=pydatetime.datetime.combine(
+                constants.TALK_DAY_1,
+                pydatetime.time(17, 30),
+                tzinfo=constants.CONFERENCE_TZ,
+            ),
+            group="break",
+            permalink=None,
+            room=constants.QUIET_ROOM,
+            title="Quiet Room",
+            track="t0",
+        ),
+        ManualScheduleEntry(
+            start_datetime=pydatetime.datetime.combine(
+                constants.TALK_DAY_1,
+                pydatetime.time(8),
+                tzinfo=constants.CONFERENCE_TZ,
+            ),
+            end_datetime=pydatetime.datetime.combine(
+                constants.TALK_DAY_1,
+                pydatetime.time(17, 30),
+                tzinfo=constants.CONFERENCE_TZ,
+            ),
+            group="break",
+            permalink=None,
+            room=constants.GREEN_ROOM,
+            title="Speaker Green Room",
+            track="t0",
+        ),
+        ManualScheduleEntry(
+            start_datetime=pydatetime.datetime.combine(
+                constants.TALK_DAY_1,
+                pydatetime.time(10, 10),
+                tzinfo=constants.CONFERENCE_TZ,
+            ),
+            end_datetime=pydatetime.datetime.combine(
+                constants.TALK_DAY_1,
+                pydatetime.time(10, 35),
+                tzinfo=constants.CONFERENCE_TZ,
+            ),
+            group="break",
+            permalink=constants.MONDAY_MORNING_BREAK_LINK,
+            room=constants.LUNCH_ROOM,
+            title="Break",
+            track="t0",
+        ),
+        # monday early lunch
+        ManualScheduleEntry(
+            start_datetime=pydatetime.datetime.combine(
+                constants.TALK_DAY_1,
+                constants.LIGHTNING_TALK_START_TIME,
+                tzinfo=constants.CONFERENCE_TZ,
+            ),
+            end_datetime=pydatetime.datetime.combine(
+                constants.TALK_DAY_1,
+                constants.LIGHTNING_TALK_END_TIME,
+                tzinfo=constants.CONFERENCE_TZ,
+            ),
+            group="lunch",
+            permalink=constants.MONDAY_LUNCH_LINK,
+            room=constants.LUNCH_ROOM,
+            title="Early Lunch",
+            track="t0",
+        ),
+        # monday main lunch
+        ManualScheduleEntry(
+            start_datetime=pydatetime.datetime.combine(
+                constants.TALK_DAY_1,
+                constants.LIGHTNING_TALK_END_TIME,
+                tzinfo=constants.CONFERENCE_TZ,
+            ),
+            end_datetime=pydatetime.datetime.combine(
+                constants.TALK_DAY_1,
+                # NOTE this must match the length of the online talk
+                constants.LUNCH_END_TIME,
+                tzinfo=constants.CONFERENCE_TZ,
+            ),
+            group="lunch",
+            permalink=constants.MONDAY_LUNCH_LINK,
+            room=constants.LUNCH_ROOM,
+            title="Lunch",
+            track="t0",
+        ),
+        # monday PM break
+        ManualScheduleEntry(
+            start_datetime=pydatetime.datetime.combine(
+                constants.TALK_DAY_1,
+                pydatetime.time(15, 30),
+                tzinfo=constants.CONFERENCE_TZ,
+            ),
+            end_datetime=pydatetime.datetime.combine(
+                constants.TALK_DAY_1,
+                pydatetime.time(15, 55),
+                tzinfo=constants.CONFERENCE_TZ,
+            ),
+            group="break",
+            permalink=constants.MONDAY_AFTERNOON_BREAK_LINK,
+            room=constants.LUNCH_ROOM,
+            title="Break",
+            track="t0",
+        ),
+        # board game night
+        ManualScheduleEntry(
+            start_datetime=pydatetime.datetime.combine(
+                constants.TALK_DAY_1,
+                pydatetime.time(19),
+                tzinfo=constants.CONFERENCE_TZ,
+            ),
+            end_datetime=pydatetime.datetime.combine(
+                constants.TALK_DAY_1,
+                pydatetime.time(22),
+                tzinfo=constants.CONFERENCE_TZ,
+            ),
+            group="break",
+            permalink=None,  # TODO add social link here
+            room=constants.LARGE_TALK_ROOM,
+            title="Board Game Night",
+            track="t0",
+        ),
+        # Tuesday!
+        ManualScheduleEntry(
+            start_datetime=pydatetime.datetime.combine(
+                constants.TALK_DAY_2,
+                pydatetime.time(8),
+                tzinfo=constants.CONFERENCE_TZ,
+            ),
+            end_datetime=pydatetime.datetime.combine(
+                constants.TALK_DAY_2,
+                pydatetime.time(9),
+                tzinfo=constants.CONFERENCE_TZ,
+            ),
+            group="lunch",
+            permalink=constants.TUESDAY_BREAKFAST_LINK,
+            room=constants.LUNCH_ROOM,
+            title="Continental Breakfast",
+            track="t0",
+        ),
+        ManualScheduleEntry(
+            start_datetime=pydatetime.datetime.combine(
+                constants.TALK_DAY_2,
+                pydatetime.time(8),
+                tzinfo=constants.CONFERENCE_TZ,
+            ),
+            end_datetime=pydatetime.datetime.combine(
+                constants.TALK_DAY_2,
+                pydatetime.time(17),
+                tzinfo=constants.CONFERENCE_TZ,
+            ),
+            group="break",
+            permalink=None,
+            room=f"In front of {constants.LARGE_TALK_ROOM}",
+            title="Registration",
+            track="t0",
+        ),
+        ManualScheduleEntry(
+            start_datetime=pydatetime.datetime.combine(
+                constants.TALK_DAY_2,
+                pydatetime.time(8),
+                tzinfo=constants.CONFERENCE_TZ,
+            ),
+            end_datetime=pydatetime.datetime.combine(
+                constants.TALK_DAY_2,
+                pydatetime.time(17, 30),
+                tzinfo=constants.CONFERENCE_TZ,
+            ),
+            group="break",
+            permalink=constants.LACTATION_BLOG_POST_LINK,
+            room=constants.LACTATION_ROOM,
+            title="Lactation Room",
+            track="t0",
+        ),
+        ManualScheduleEntry(
+            start_datetime=pydatetime.datetime.combine(
+                constants.TALK_DAY_2,
+                pydatetime.time(8),
+                tzinfo=constants.CONFERENCE_TZ,
+            ),
+            end_datetime=pydatetime.datetime.combine(
+                constants.TALK_DAY_2,
+                pydatetime.time(17, 30),
+                tzinfo=constants.CONFERENCE_TZ,
+            ),
+            group="break",
+            permalink=None,
+            room=constants.QUIET_ROOM,
+            title="Quiet Room",
+            track="t0",
+        ),
+        ManualScheduleEntry(
+            start_datetime=pydatetime.datetime.combine(
+                constants.TALK_DAY_2,
+                pydatetime.time(8),
+                tzinfo=constants.CONFERENCE_TZ,
+            ),
+            end_datetime=pydatetime.datetime.combine(
+                constants.TALK_DAY_2,
+                pydatetime.time(17, 30),
+                tzinfo=constants.CONFERENCE_TZ,
+            ),
+            group="break",
+            permalink=None,
+            room=constants.GREEN_ROOM,
+            title="Speaker Green Room",
+            track="t0",
+        ),
+        ManualScheduleEntry(
+            start_datetime=pydatetime.datetime.combine(
+                constants.TALK_DAY_2,
+                pydatetime.time(10, 10),
+                tzinfo=constants.CONFERENCE_TZ,
+            ),
+            end_datetime=pydatetime.datetime.combine(
+                constants.TALK_DAY_2,
+                pydatetime.time(10, 35),
+                tzinfo=constants.CONFERENCE_TZ,
+            ),
+            group="break",
+            permalink=constants.TUESDAY_MORNING_BREAK_LINK,
+            room=constants.LUNCH_ROOM,
+            title="Break",
+            track="t0",
+        ),
+        # tuesday early lunch
+        ManualScheduleEntry(
+            start_datetime=pydatetime.datetime.combine(
+                constants.TALK_DAY_2,
+                constants.LIGHTNING_TALK_START_TIME,
+                tzinfo=constants.CONFERENCE_TZ,
+            ),
+            end_datetime=pydatetime.datetime.combine(
+                constants.TALK_DAY_2,
+                constants.LIGHTNING_TALK_END_TIME,
+                tzinfo=constants.CONFERENCE_TZ,
+            ),
+            group="lunch",
+            permalink=constants.TUESDAY_LUNCH_LINK,
+            room=constants.LUNCH_ROOM,
+            title="Early Lunch",
+            track="t0",
+        ),
+        # tuesday main lunch
+        ManualScheduleEntry(
+            start_datetime=pydatetime.datetime.combine(
+                constants.TALK_DAY_2,
+                constants.LIGHTNING_TALK_END_TIME,
+                tzinfo=constants.CONFERENCE_TZ,
+            ),
+            end_datetime=pydatetime.datetime.combine(
+                constants.TALK_DAY_2,
+                # NOTE this must match the length of the online talk
+                constants.LUNCH_END_TIME,
+                tzinfo=constants.CONFERENCE_TZ,
+            ),
+            group="lunch",
+            permalink=constants.TUESDAY_LUNCH_LINK,
+            room=constants.LUNCH_ROOM,
+            title="Lunch",
+            track="t0",
+        ),
+        # tuesday PM break
+        ManualScheduleEntry(
+            start_datetime=pydatetime.datetime.combine(
+                constants.TALK_DAY_2,
+                pydatetime.time(15, 0),
+                tzinfo=constants.CONFERENCE_TZ,
+            ),
+            end_datetime=pydatetime.datetime.combine(
+                constants.TALK_DAY_2,
+                pydatetime.time(15, 25),
+                tzinfo=constants.CONFERENCE_TZ,
+            ),
+            group="break",
+            permalink=constants.TUESDAY_AFTERNOON_BREAK_LINK,
+            room=constants.LUNCH_ROOM,
+            title="Break",
+            track="t0",
+        ),
+        # Wednesday!
+        ManualScheduleEntry(
+            start_datetime=pydatetime.datetime.combine(
+                constants.TALK_DAY_3,
+                pydatetime.time(8),
+                tzinfo=constants.CONFERENCE_TZ,
+            ),
+            end_datetime=pydatetime.datetime.combine(
+                constants.TALK_DAY_3,
+                pydatetime.time(9),
+                tzinfo=constants.CONFERENCE_TZ,
+            ),
+            group="lunch",
+            permalink=constants.WEDNESDAY_BREAKFAST_LINK,
+            room=constants.LUNCH_ROOM,
+            title="Continental Breakfast",
+            track="t0",
+        ),
+        ManualScheduleEntry(
+            start_datetime=pydatetime.datetime.combine(
+                constants.TALK_DAY_3,
+                pydatetime.time(8),
+                tzinfo=constants.CONFERENCE_TZ,
+            ),
+            end_datetime=pydatetime.datetime.combine(
+                constants.TALK_DAY_3,
+                pydatetime.time(17),
+                tzinfo=constants.CONFERENCE_TZ,
+            ),
+            group="break",
+            permalink=None,
+            room=f"In front of {constants.LARGE_TALK_ROOM}",
+            title="Registration",
+            track="t0",
+        ),
+        ManualScheduleEntry(
+            start_datetime=pydatetime.datetime.combine(
+                constants.TALK_DAY_3,
+                pydatetime.time(8),
+                tzinfo=constants.CONFERENCE_TZ,
+            ),
+            end_datetime=pydatetime.datetime.combine(
+                constants.TALK_DAY_3,
+                pydatetime.time(17, 30),
+                tzinfo=constants.CONFERENCE_TZ,
+            ),
+            group="break",
+            permalink=constants.LACTATION_BLOG_POST_LINK,
+            room=constants.LACTATION_ROOM,
+            title="Lactation Room",
+            track="t0",
+        ),
+        ManualScheduleEntry(
+            start_datetime=pydatetime.datetime.combine(
+                constants.TALK_DAY_3,
+                pydatetime.time(8),
+                tzinfo=constants.CONFERENCE_TZ,
+            ),
+            end_datetime=pydatetime.datetime.combine(
+                constants.TALK_DAY_3,
+                pydatetime.time(17, 30),
+                tzinfo=constants.CONFERENCE_TZ,
+            ),
+            group="break",
+            permalink=None,
+            room=constants.QUIET_ROOM,
+            title="Quiet Room",
+            track="t0",
+        ),
+        ManualScheduleEntry(
+            start_datetime=pydatetime.datetime.combine(
+                constants.TALK_DAY_3,
+                pydatetime.time(8),
+                tzinfo=constants.CONFERENCE_TZ,
+            ),
+            end_datetime=pydatetime.datetime.combine(
+                constants.TALK_DAY_3,
+                pydatetime.time(17, 30),
+                tzinfo=constants.CONFERENCE_TZ,
+            ),
+            group="break",
+            permalink=None,
+            room=constants.GREEN_ROOM,
+            title="Speaker Green Room",
+            track="t0",
+        ),
+        ManualScheduleEntry(
+            start_datetime=pydatetime.datetime.combine(
+                constants.TALK_DAY_3,
+                pydatetime.time(10, 10),
+                tzinfo=constants.CONFERENCE_TZ,
+            ),
+            end_datetime=pydatetime.datetime.combine(
+                constants.TALK_DAY_3,
+                pydatetime.time(10, 35),
+                tzinfo=constants.CONFERENCE_TZ,
+            ),
+            group="break",
+            permalink=constants.WEDNESDAY_MORNING_BREAK_LINK,
+            room=constants.LUNCH_ROOM,
+            title="Break",
+            track="t0",
+        ),
+        # wed early lunch
+        ManualScheduleEntry(
+            start_datetime=pydatetime.datetime.combine(
+                constants.TALK_DAY_3,
+                constants.LIGHTNING_TALK_START_TIME,
+                tzinfo=constants.CONFERENCE_TZ,
+            ),
+            end_datetime=pydatetime.datetime.combine(
+                constants.TALK_DAY_3,
+                constants.LIGHTNING_TALK_END_TIME,
+                tzinfo=constants.CONFERENCE_TZ,
+            ),
+            group="lunch",
+            permalink=constants.WEDNESDAY_LUNCH_LINK,
+            room=constants.LUNCH_ROOM,
+            title="Early Lunch",
+            track="t0",
+        ),
+        # wed main lunch
+        ManualScheduleEntry(
+            start_datetime=pydatetime.datetime.combine(
+                constants.TALK_DAY_3,
+                constants.LIGHTNING_TALK_END_TIME,
+                tzinfo=constants.CONFERENCE_TZ,
+            ),
+            end_datetime=pydatetime.datetime.combine(
+                constants.TALK_DAY_3,
+                # NOTE this must match the length of the online talk
+                constants.LUNCH_END_TIME,
+                tzinfo=constants.CONFERENCE_TZ,
+            ),
+            group="lunch",
+            permalink=constants.WEDNESDAY_LUNCH_LINK,
+            room=constants.LUNCH_ROOM,
+            title="Lunch",
+            track="t0",
+        ),
+        # wed PM break
+        ManualScheduleEntry(
+            start_datetime=pydatetime.datetime.combine(
+                constants.TALK_DAY_3,
+                pydatetime.time(15, 0),
+                tzinfo=constants.CONFERENCE_TZ,
+            ),
+            end_datetime=pydatetime.datetime.combine(
+                constants.TALK_DAY_3,
+                pydatetime.time(15, 25),
+                tzinfo=constants.CONFERENCE_TZ,
+            ),
+            group="break",
+            permalink=constants.WEDNESDAY_AFTERNOON_BREAK_LINK,
+            room=constants.LUNCH_ROOM,
+            title="Break",
+            track="t0",
+        ),
+        # Thursday!
+        ManualScheduleEntry(
+            start_datetime=pydatetime.datetime.combine(
+                constants.SPRINTS_DAY_1,
+                pydatetime.time(9),
+                tzinfo=constants.CONFERENCE_TZ,
+            ),
+            end_datetime=pydatetime.datetime.combine(
+                constants.SPRINTS_DAY_1,
+                pydatetime.time(17),
+                tzinfo=constants.CONFERENCE_TZ,
+            ),
+            group="talks",
+            permalink=None,
+            room=constants.LARGE_TALK_ROOM,
+            title="Contribution Sprints",
+            track="t0",
+        ),
+        # Friday!
+        ManualScheduleEntry(
+            start_datetime=pydatetime.datetime.combine(
+                constants.SPRINTS_DAY_2,
+                pydatetime.time(9),
+                tzinfo=constants.CONFERENCE_TZ,
+            ),
+            end_datetime=pydatetime.datetime.combine(
+                constants.SPRINTS_DAY_2,
+                pydatetime.time(17),
+                tzinfo=constants.CONFERENCE_TZ,
+            ),
+            group="talks",
+            permalink=None,
+            room=constants.LARGE_TALK_ROOM,
+            title="Contribution Sprints",
+            track="t0",
         ),
-        group="talks",
-        permalink=None,
-        room=constants.LARGE_TALK_ROOM,
-        title="Contribution Sprints",
-        track="t0",
-    ),
-]
+    ]
+
+
+def __getattr__(name: str):
+    # MANUAL_SCHEDULE_ENTRIES used to be built at import time
+    if name == "MANUAL_SCHEDULE_ENTRIES":
+        return manual_schedule_entries()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,189 @@
+"""Move, swap and rotate sessions between schedule slots in one pass
+
+A plan is a YAML file listing the changes. Every slot in it refers to where
+sessions are *before* the plan runs, so the whole plan is applied at once as a
+permutation::
+
+    swaps:
+      - [/talks/talk-a/, /talks/talk-b/]
+    rotations:
+      # a takes b's slot, b takes c's slot, c takes a's slot
+      - [/talks/a/, /talks/b/, /talks/c/]
+    moves:
+      # take another session's slot (that session must move too)
+      - talk: /talks/talk-c/
+        to: /talks/talk-d/
+      # or name the new slot; the end time keeps the talk's length
+      - talk: src/_content/schedule/talks/2025-09-08-10-50-t1-some-talk.md
+        start: 2025-09-09 13:50:00-05:00
+        room: Room B
+        track: t1
+
+Talks can be referenced by file path or permalink.
+"""
+
+import dataclasses
+import datetime
+from pathlib import Path
+
+import conflicts
+import constants
+import content
+import models
+import patching
+from repository import ContentRepository, Session
+from writer import Writer
+
+
+class PlanError(ValueError):
+    pass
+
+
+@dataclasses.dataclass(frozen=True)
+class Slot:
+    start_datetime: datetime.datetime
+    end_datetime: datetime.datetime
+    room: str | None
+    track: str | None
+
+    @classmethod
+    def of(cls, session: Session) -> "Slot":
+        schedule = session.schedule
+        return cls(
+            start_datetime=schedule.start_datetime,
+            end_datetime=schedule.end_datetime,
+            room=schedule.room,
+            track=schedule.track,
+        )
+
+    @property
+    def duration(self) -> datetime.timedelta:
+        return self.end_datetime - self.start_datetime
+
+
+@dataclasses.dataclass
+class Move:
+    session: Session
+    slot: Slot
+
+
+def localize(value: datetime.datetime | str) -> datetime.datetime:
+    if isinstance(value, str):
+        value = datetime.datetime.fromisoformat(value)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=constants.CONFERENCE_TZ)
+    return value
+
+
+def build_moves(plan: dict, repository: ContentRepository) -> list[Move]:
+    """Turn a plan into one move per affected session, checking durations"""
+    moves: dict[Path, Move] = {}
+    errors = []
+
+    def add(session: Session, slot: Slot) -> None:
+        if session.path in moves:
+            errors.append(f"{session.path} is moved more than once")
+        elif slot.duration != Slot.of(session).duration:
+            errors.append(
+                f"{session.schedule.title!r} is {Slot.of(session).duration} long "
+                f"but its new slot is {slot.duration}"
+            )
+        moves[session.path] = Move(session=session, slot=slot)
+
+    def find(reference: str) -> Session | None:
+        try:
+            return repository.find_session(reference)
+        except KeyError as error:
+            errors.append(str(error.args[0]))
+            return None
+
+    cycles = [list(pair) for pair in plan.get("swaps") or []]
+    cycles += [list(cycle) for cycle in plan.get("rotations") or []]
+    for cycle in cycles:
+        sessions = [find(reference) for reference in cycle]
+        if None in sessions:
+            continue
+        if len(sessions) < 2:
+            errors.append(f"{cycle} needs at least two sessions")
+            continue
+        for session, target in zip(sessions, sessions[1:] + sessions[:1]):
+            add(session, Slot.of(target))
+
+    for move in plan.get("moves") or []:
+        if (session := find(move["talk"])) is None:
+            continue
+        if "to" in move:
+            if (target := find(move["to"])) is not None:
+                add(session, Slot.of(target))
+            continue
+        current = Slot.of(session)
+        start = localize(move.get("start", current.start_datetime))
+        add(
+            session,
+            Slot(
+                start_datetime=start,
+                end_datetime=start + current.duration,
+                room=move.get("room", current.room),
+                track=move.get("track", current.track),
+            ),
+        )
+
+    if errors:
+        raise PlanError(errors)
+    return [move for move in moves.values() if move.slot != Slot.of(move.session)]
+
+
+def moved_schedule(move: Move) -> models.Schedule:
+    return move.session.schedule.model_copy(update=dataclasses.asdict(move.slot))
+
+
+def check_conflicts(
+    moves: list[Move], repository: ContentRepository
+) -> list[conflicts.Conflict]:
+    """Conflicts the moves would cause (existing, unrelated ones are ignored)"""
+    moved = {move.session.path: move for move in moves}
+    sessions = [
+        Session(path=session.path, schedule=moved_schedule(moved[session.path]))
+        if session.path in moved and not session.is_manual
+        else session
+        for session in repository.sessions
+    ]
+    return [
+        conflict
+        for conflict in conflicts.find_conflicts(sessions)
+        if conflict.first.path in moved or conflict.second.path in moved
+    ]
+
+
+def apply_moves(moves: list[Move], writer: Writer) -> dict[Path, Path]:
+    """Rewrite (and rename) the moved files; returns old path → new path"""
+    outputs = {}
+    for move in moves:
+        schedule = moved_schedule(move)
+        _, header = content.read_header(move.session.path)
+        present = content.parse_header(header)
+        # a slot without a room or track doesn't add ``room: null`` to the file
+        updates = {
+            key: value
+            for key, value in dataclasses.asdict(move.slot).items()
+            if value is not None or key in present
+        }
+        text = patching.patch_text(move.session.path.read_text(), updates)
+        new_path = move.session.path.parent / schedule.filename
+        outputs[move.session.path] = (new_path, text)
+
+    # every file is read above, so in a permutation writing a new file over an
+    # old name loses nothing; the renamed originals go once all are written
+    for new_path, text in outputs.values():
+        writer.write_text(new_path, text)
+    new_paths = {new_path for new_path, _ in outputs.values()}
+    for old_path, (new_path, _) in outputs.items():
+        if old_path != new_path and old_path not in new_paths and not writer.dry_run:
+            old_path.unlink()
+    return {old_path: new_path for old_path, (new_path, _) in outputs.items()}
+
+
+def load_plan(plan_file: Path) -> dict:
+    import yaml
+
+    return yaml.safe_load(plan_file.read_text()) or {}
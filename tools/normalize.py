@@ -0,0 +1,195 @@
+"""Rewrite content frontmatter into its canonical form
+
+Each rule in ``RULES`` looks at one file's frontmatter and returns the keys it
+would change (``patching.DELETE`` removes one). The rules run in order on the
+same metadata, so later rules see earlier fixes, and the file is patched once
+at the end, so only the lines of changed keys move. Presenter and organizer
+files then get their keys sorted, like the files the tools write.
+
+Files are normalized across a process pool, like content parsing, and the
+results come back as text for the writer, so ``--dry-run`` shows a diff and
+only files that change are written.
+"""
+
+import dataclasses
+import datetime
+import re
+from pathlib import Path
+from typing import Callable
+from urllib.parse import urlsplit
+
+import constants
+import content
+import models
+import patching
+import timings
+
+
+Fix = Callable[[dict], dict]
+CONTENT_TYPES = frozenset({"presenters", "organizers", "posts", "pages", "schedule"})
+PEOPLE = frozenset({"presenters", "organizers"})
+# people files are kept in key order
+SORTED_TYPES = PEOPLE
+KEY_ORDER = "key-order"
+SOCIAL_KEYS = tuple(models.Social.model_fields)
+# profile URLs the templates build from a bare handle
+PROFILE_URLS = {
+    "bluesky": re.compile(r"^https?://(?:www\.)?bsky\.app/profile/([^/?#]+)/?$"),
+    "github": re.compile(r"^https?://(?:www\.)?github\.com/([^/?#]+)/?$"),
+    "instagram": re.compile(r"^https?://(?:www\.)?instagram\.com/([^/?#]+)/?$"),
+    "twitter": re.compile(r"^https?://(?:www\.)?(?:twitter|x)\.com/([^/?#]+)/?$"),
+}
+MASTODON_HANDLE = re.compile(r"^@?(?P<user>[\w.]+)@(?P<host>[\w.-]+\.[a-z]+)$")
+
+
+@dataclasses.dataclass(frozen=True)
+class Rule:
+    name: str
+    kinds: frozenset[str]
+    fix: Fix  # frontmatter → the keys to change
+
+
+RULES: list[Rule] = []
+
+
+def rule(name: str, kinds: frozenset[str] = CONTENT_TYPES) -> Callable[[Fix], Fix]:
+    def register(fix: Fix) -> Fix:
+        RULES.append(Rule(name, kinds, fix))
+        return fix
+
+    return register
+
+
+@rule("social-nesting", PEOPLE)
+def nest_social(metadata: dict) -> dict:
+    """Top-level ``github:``, ``twitter:``... go under ``social:``"""
+    loose = {key: metadata[key] for key in SOCIAL_KEYS if key in metadata}
+    if not loose:
+        return {}
+    social = dict(metadata.get("social") or {})
+    for key, value in loose.items():
+        # an entry already under social wins
+        if social.get(key) is None:
+            social[key] = value
+    return {"social": social} | {key: patching.DELETE for key in loose}
+
+
+@rule("mastodon-handles", PEOPLE)
+def mastodon_urls(metadata: dict) -> dict:
+    """``@user@host`` (or ``user@host``) → ``https://host/@user``"""
+    social = metadata.get("social") or {}
+    handle = social.get("mastodon")
+    if not isinstance(handle, str) or not (match := MASTODON_HANDLE.match(handle.strip())):
+        return {}
+    return {"social": social | {"mastodon": f"https://{match['host']}/@{match['user']}"}}
+
+
+@rule("social-handles", PEOPLE)
+def social_handles(metadata: dict) -> dict:
+    """Bare handles for the profile links the templates build, full website URLs"""
+    social = metadata.get("social") or {}
+    fixed = dict(social)
+    for network, pattern in PROFILE_URLS.items():
+        value = social.get(network)
+        if not isinstance(value, str):
+            continue
+        value = value.strip()
+        if match := pattern.match(value):
+            value = match.group(1)
+        fixed[network] = value.lstrip("@")
+    website = social.get("website")
+    if isinstance(website, str) and website.strip() and not urlsplit(website).scheme:
+        fixed["website"] = f"https://{website.strip()}"
+    return {"social": fixed} if fixed != social else {}
+
+
+@rule("datetimes")
+def conference_datetimes(metadata: dict) -> dict:
+    """``*_datetime`` values in the conference timezone
+
+    YAML timestamps without an offset are UTC to 11ty, so that's what they're
+    taken to be; the time the site shows doesn't change.
+    """
+    updates = {}
+    for key, value in metadata.items():
+        if not key.endswith("_datetime") or not isinstance(value, datetime.datetime):
+            continue
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=datetime.timezone.utc)
+        updates[key] = value.astimezone(constants.CONFERENCE_TZ)
+    return updates
+
+
+def rule_names() -> list[str]:
+    return [registered.name for registered in RULES] + [KEY_ORDER]
+
+
+@dataclasses.dataclass
+class Result:
+    path: Path
+    text: str | None = None  # None: already canonical
+    rules: list[str] = dataclasses.field(default_factory=list)
+    error: str | None = None
+
+
+def normalize_file(kind: str, path: Path) -> Result:
+    """Apply the rules to one file (runs in worker processes)"""
+    import yaml
+
+    text = path.read_text()
+    _, header = content.read_header(path)
+    try:
+        metadata = content.parse_header(header)
+    except yaml.YAMLError as error:
+        return Result(path, error=f"{type(error).__name__}: {error}")
+    updates: dict = {}
+    fired = []
+    for registered in RULES:
+        if kind not in registered.kinds:
+            continue
+        current = {
+            key: value
+            for key, value in {**metadata, **updates}.items()
+            if value is not patching.DELETE
+        }
+        changes = registered.fix(current)
+        if any(
+            key not in current
+            if value is patching.DELETE
+            else key not in current or not patching.same(current[key], value)
+            for key, value in changes.items()
+        ):
+            fired.append(registered.name)
+            updates |= changes
+    try:
+        normalized = patching.patch_text(text, updates)
+        if kind in SORTED_TYPES:
+            ordered = patching.sort_keys(normalized)
+            if ordered != normalized:
+                fired.append(KEY_ORDER)
+            normalized = ordered
+    except patching.PatchError as error:
+        return Result(path, error=str(error))
+    if normalized == text:
+        return Result(path)
+    return Result(path, normalized, fired)
+
+
+def _normalize(job: tuple[str, Path]) -> Result:
+    return normalize_file(*job)
+
+
+def normalize_files(jobs: list[tuple[str, Path]], workers: int) -> list[Result]:
+    """Normalize (content type, path) pairs across a process pool, in order"""
+    with timings.span("normalize"):
+        if workers == 1 or len(jobs) < content.PARALLEL_MIN_FILES:
+            return [_normalize(job) for job in jobs]
+        from concurrent.futures import ProcessPoolExecutor
+        from concurrent.futures.process import BrokenProcessPool
+
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                chunksize = max(1, len(jobs) // (workers * 4))
+                return list(pool.map(_normalize, jobs, chunksize=chunksize))
+        except (OSError, NotImplementedError, BrokenProcessPool):
+            return [_normalize(job) for job in jobs]
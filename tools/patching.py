@@ -0,0 +1,280 @@
+"""Change frontmatter keys in place, leaving the rest of the file alone
+
+Round-tripping a file through ``frontmatter.dumps`` rewrites every key: the
+order, quoting and line wrapping all change, and comments are lost. Instead,
+``patch_text`` only replaces the lines of the keys whose values change (a key
+line plus its indented or ``- `` continuation lines), and new keys go in
+sorted position if the keys are already sorted, or at the end otherwise::
+
+    patch_file(path, {"video_url": "https://youtu.be/..."}, writer)
+
+Keys set to ``DELETE`` are removed, and ``sort_keys`` reorders the key
+blocks (with the comments just above them) without rewriting any of them.
+
+The patched frontmatter is parsed again to check it means what was asked for,
+so anything the line-based approach can't handle (e.g. a key split across a
+flow mapping) fails loudly instead of corrupting the file.
+"""
+
+import datetime
+from pathlib import Path
+import re
+
+import content
+from writer import Writer
+
+
+# a top-level key: column 0, not a comment or a list item
+KEY_LINE = re.compile(
+    r"""^(?P<key>[^\s#'"\-{}\[\]][^:#]*?|'[^']*'|"[^"]*")[ \t]*:(?:[ \t]|$)"""
+)
+INLINE_COMMENT = re.compile(r"[ \t]+#.*$")
+
+
+class PatchError(ValueError):
+    pass
+
+
+class _Delete:
+    def __repr__(self) -> str:
+        return "DELETE"
+
+
+# an ``updates`` value that removes the key
+DELETE = _Delete()
+
+
+def same(current: object, value: object) -> bool:
+    """Equal and written the same way: 1 isn't True, and an offset counts"""
+    if current != value or type(current) is not type(value):
+        return False
+    if isinstance(value, datetime.datetime):
+        return current.utcoffset() == value.utcoffset()
+    return True
+
+
+def render(key: str, value: object, indent: int = 2) -> list[str]:
+    """``key: value`` as block-style YAML lines, like python-frontmatter writes"""
+    import yaml
+
+    text = yaml.safe_dump(
+        {key: value},
+        default_flow_style=False,
+        allow_unicode=True,
+        sort_keys=False,
+        width=float("inf"),
+        indent=indent,
+    )
+    return text.splitlines()
+
+
+def block_indent(lines: list[str]) -> int:
+    """The indent of a block's nested mapping (2 if it has none)"""
+    for line in lines[1:]:
+        stripped = line.lstrip(" ")
+        if stripped and not stripped.startswith(("-", "#")):
+            return max(2, len(line) - len(stripped))
+    return 2
+
+
+def unquote(key: str) -> str:
+    if len(key) > 1 and key[0] == key[-1] and key[0] in "'\"":
+        return key[1:-1]
+    return key
+
+
+def is_continuation(line: str) -> bool:
+    return line[:1] in (" ", "\t") or line.startswith("- ") or line.rstrip() == "-"
+
+
+def find_blocks(lines: list[str]) -> dict[str, tuple[int, int]]:
+    """Top-level key → (first line, end line) within the frontmatter lines"""
+    blocks: dict[str, tuple[int, int]] = {}
+    index = 0
+    while index < len(lines):
+        match = KEY_LINE.match(lines[index])
+        if match is None:
+            index += 1
+            continue
+        start = index
+        end = index + 1
+        # blank lines only belong to the block if more of it follows them
+        scan = end
+        while scan < len(lines):
+            if is_continuation(lines[scan]):
+                end = scan = scan + 1
+            elif not lines[scan].strip():
+                scan += 1
+            else:
+                break
+        blocks[unquote(match["key"])] = (start, end)
+        index = end
+    return blocks
+
+
+def inline_comment(line: str) -> str:
+    """A trailing ``# comment`` on an unquoted ``key: value`` line"""
+    value = line.split(":", 1)[1]
+    if "'" in value or '"' in value:
+        return ""
+    match = INLINE_COMMENT.search(value)
+    return match.group(0) if match else ""
+
+
+def split_frontmatter(lines: list[str]) -> tuple[int, int] | None:
+    """Indexes of the opening and closing ``---`` lines, if there are both"""
+    opening = 0
+    while opening < len(lines) and not lines[opening].strip():
+        opening += 1
+    if opening == len(lines) or not content.FM_BOUNDARY.match(lines[opening].encode()):
+        return None
+    for closing in range(opening + 1, len(lines)):
+        if content.FM_BOUNDARY.match(lines[closing].encode()):
+            return opening, closing
+    return None
+
+
+def reparse(header: list[str], newline: str) -> dict:
+    """The rewritten frontmatter, or a ``PatchError`` if it's no longer valid YAML"""
+    import yaml
+
+    try:
+        return content.parse_header(newline.join(header).encode("utf-8"))
+    except yaml.YAMLError as error:
+        # e.g. an alias whose anchor was on a line that got replaced
+        first_line = str(error).splitlines()[0]
+        raise PatchError(f"the rewritten frontmatter doesn't parse: {first_line}")
+
+
+def patch_text(text: str, updates: dict) -> str:
+    """Set the frontmatter keys in ``updates``, touching only the lines that change"""
+    newline = "\r\n" if "\r\n" in text else "\n"
+    lines = text.split(newline)
+    bounds = split_frontmatter(lines)
+    if bounds is None:
+        lines[:0] = ["---", "---"]
+        bounds = (0, 1)
+    opening, closing = bounds
+    header = lines[opening + 1 : closing]
+    metadata = content.parse_header(newline.join(header).encode("utf-8"))
+    changed = {
+        key: value
+        for key, value in updates.items()
+        if (
+            key in metadata
+            if value is DELETE
+            else key not in metadata or not same(metadata[key], value)
+        )
+    }
+    if not changed:
+        return text
+
+    blocks = find_blocks(header)
+    keys = list(blocks)
+    keep_sorted = keys == sorted(keys)
+    edits: list[tuple[int, int, list[str]]] = []
+    inserts: dict[int, list[str]] = {}
+    for key, value in sorted(changed.items()) if keep_sorted else changed.items():
+        if value is DELETE:
+            if key not in blocks:
+                raise PatchError(f"couldn't find {key} to remove")
+            edits.append((*blocks[key], []))
+            continue
+        if key in blocks:
+            start, end = blocks[key]
+            rendered = render(key, value, block_indent(header[start:end]))
+            if end - start == 1 and len(rendered) == 1:
+                rendered[0] += inline_comment(header[start])
+            edits.append((start, end, rendered))
+            continue
+        rendered = render(key, value)
+        position = len(header)
+        if keep_sorted:
+            following = [blocks[other][0] for other in keys if other > key]
+            if following:
+                position = min(following)
+                # comments right above a key describe it: insert above them
+                while position > 0 and header[position - 1].startswith("#"):
+                    position -= 1
+        inserts.setdefault(position, []).extend(rendered)
+    edits += [(position, position, rendered) for position, rendered in inserts.items()]
+    # from the bottom up, so earlier line numbers stay valid
+    for start, end, rendered in sorted(edits, reverse=True):
+        header[start:end] = rendered
+
+    patched = reparse(header, newline)
+    expected = {
+        key: value
+        for key, value in {**metadata, **changed}.items()
+        if value is not DELETE
+    }
+    if patched != expected:
+        wrong = sorted(
+            key
+            for key in patched.keys() | expected.keys()
+            if patched.get(key) != expected.get(key)
+        )
+        raise PatchError(f"couldn't patch {', '.join(wrong)} in place")
+
+    lines[opening + 1 : closing] = header
+    return newline.join(lines)
+
+
+def sort_keys(text: str) -> str:
+    """Put the top-level frontmatter keys in alphabetical order"""
+    newline = "\r\n" if "\r\n" in text else "\n"
+    lines = text.split(newline)
+    bounds = split_frontmatter(lines)
+    if bounds is None:
+        return text
+    opening, closing = bounds
+    header = lines[opening + 1 : closing]
+    blocks = find_blocks(header)
+    if list(blocks) == sorted(blocks):
+        return text
+
+    # each key takes the comment lines right above it along
+    starts = {}
+    previous_end = 0
+    for key, (start, end) in blocks.items():
+        while start > previous_end and header[start - 1].startswith("#"):
+            start -= 1
+        starts[key] = start
+        previous_end = end
+    order = list(starts)
+    segments = {
+        key: header[
+            starts[key] : starts[order[number + 1]]
+            if number + 1 < len(order)
+            else len(header)
+        ]
+        for number, key in enumerate(order)
+    }
+    # a key moving off the end leaves the trailing blank lines behind
+    last = segments[order[-1]]
+    trailing = []
+    while last and not last[-1].strip():
+        trailing.insert(0, last.pop())
+    reordered = header[: starts[order[0]]]
+    for key in sorted(order):
+        reordered += segments[key]
+    reordered += trailing
+
+    before = content.parse_header(newline.join(header).encode("utf-8"))
+    after = reparse(reordered, newline)
+    if after != before or list(after) != sorted(after):
+        raise PatchError("couldn't sort the keys in place")
+    lines[opening + 1 : closing] = reordered
+    return newline.join(lines)
+
+
+def patch_file(
+    path: Path, updates: dict, writer: Writer, output: Path | None = None
+) -> bool:
+    """Patch ``path``'s frontmatter and write it (to ``output`` if given)"""
+    text = path.read_text()
+    try:
+        patched = patch_text(text, updates)
+    except PatchError as error:
+        raise PatchError(f"{path}: {error}") from None
+    return writer.write_text(output or path, patched)
@@ -0,0 +1,216 @@
+"""Index every URL the site builds and list its redirects for 11ty
+
+Each content file's URL is worked out the way 11ty does it: the
+``permalink`` frontmatter, else the folder's data file (posts go under
+``/news/``, organizers aren't built), else the file's path under ``src/``.
+Drafts aren't built, and paginated or templated permalinks can't be known
+without 11ty, so they're left out.
+
+Every URL and ``redirect_from`` goes into one dict as it's found, so a URL
+claimed twice (by two pages, or a page and a redirect) is caught on the spot.
+Redirects are then followed once each, remembering where every URL ends up,
+which finds cycles and chains (a redirect to a URL that redirects again)
+without walking any chain twice.
+
+The ``redirect_from`` URLs are written to ``src/_data/redirects.json``, each
+pointing straight at the end of any chain, and ``src/redirect-from.html``
+renders a redirect page for each of them, so every 11ty build has them.
+"""
+
+import dataclasses
+import json
+from pathlib import Path, PurePosixPath
+import re
+from typing import Iterable, Literal
+
+import constants
+import content
+import validation
+from writer import Writer
+
+
+REDIRECTS_FILE = constants.REPO_ROOT / "src" / "_data" / "redirects.json"
+# directory data files (``*.11tydata.js``, ``*.json``) that set permalinks
+DIRECTORY_PERMALINKS = {"posts": "/news/{slug}/", "organizers": None}
+# 11ty drops a leading date from file slugs
+DATE_PREFIX = re.compile(r"^\d{4}-\d{2}-\d{2}-")
+
+
+@dataclasses.dataclass(frozen=True)
+class Route:
+    url: str
+    path: Path
+    origin: Literal["page", "redirect_from", "redirect_to"] = "page"
+    redirect_to: str | None = None
+
+
+@dataclasses.dataclass
+class Problem:
+    path: Path
+    message: str
+    fatal: bool = True
+
+    def __str__(self) -> str:
+        return f"{self.path.relative_to(constants.REPO_ROOT)}: {self.message}"
+
+
+@dataclasses.dataclass
+class PermalinkIndex:
+    routes: dict[str, Route] = dataclasses.field(default_factory=dict)
+    problems: list[Problem] = dataclasses.field(default_factory=list)
+
+    def add(self, route: Route) -> None:
+        existing = self.routes.setdefault(route.url, route)
+        if existing is not route:
+            where = existing.path.relative_to(constants.REPO_ROOT)
+            self.problems.append(
+                Problem(
+                    route.path,
+                    f"{route.url} ({route.origin}) is already taken by "
+                    f"{where} ({existing.origin})",
+                )
+            )
+
+    @property
+    def redirects(self) -> dict[str, Route]:
+        return {url: route for url, route in self.routes.items() if route.redirect_to}
+
+    def resolve(self) -> dict[str, str]:
+        """Where each redirect finally ends up, recording cycles and chains"""
+        final: dict[str, str | None] = {}  # None: in or into a cycle
+        for start in self.redirects:
+            trail: list[str] = []
+            url = start
+            while url not in final and (route := self.routes.get(url)) and route.redirect_to:
+                if url in trail:
+                    cycle = trail[trail.index(url) :] + [url]
+                    self.problems.append(
+                        Problem(route.path, f"redirect cycle: {' → '.join(cycle)}")
+                    )
+                    final[url] = None
+                    break
+                trail.append(url)
+                url = route.redirect_to
+            end = final.get(url, url)
+            for hop in trail:
+                final[hop] = end
+
+        for url, route in self.redirects.items():
+            end = final[url]
+            if end is None:
+                continue
+            if end != route.redirect_to:
+                self.problems.append(
+                    Problem(
+                        route.path,
+                        f"redirect chain: {url} → {route.redirect_to} → … → {end}",
+                        fatal=False,
+                    )
+                )
+            if end.startswith("/") and end not in self.routes:
+                self.problems.append(
+                    Problem(
+                        route.path,
+                        f"{url} redirects to {end}, which isn't a known page",
+                        fatal=False,
+                    )
+                )
+        return {url: end for url, end in final.items() if end is not None}
+
+
+def normalize(url: str) -> str:
+    """``about/faq``, ``/about/faq/index.html`` → ``/about/faq/``"""
+    if re.match(r"^[a-z][a-z0-9+.-]*://", url):
+        return url
+    url = "/" + url.strip().lstrip("/")
+    if url.endswith("/index.html"):
+        url = url[: -len("index.html")]
+    if not url.endswith("/") and "." not in url.rsplit("/", 1)[-1]:
+        url += "/"
+    return url
+
+
+def default_url(kind: str, path: Path) -> str | None:
+    slug = DATE_PREFIX.sub("", path.stem)
+    if kind in DIRECTORY_PERMALINKS:
+        pattern = DIRECTORY_PERMALINKS[kind]
+        return pattern.format(slug=slug) if pattern else None
+    folder = PurePosixPath(path.relative_to(validation.SRC_PATH).parent.as_posix())
+    if slug == "index":
+        return normalize(str(folder))
+    return normalize(str(folder / slug))
+
+
+def page_url(kind: str, path: Path, metadata: dict) -> str | None:
+    """The URL 11ty builds ``path`` at, if it builds exactly one we can know"""
+    if metadata.get("draft") or "pagination" in metadata:
+        return None
+    permalink = metadata.get("permalink")
+    if permalink is False or permalink == "false":
+        return None
+    if permalink is None:
+        return default_url(kind, path)
+    if not isinstance(permalink, str) or "{{" in permalink or "{%" in permalink:
+        return None
+    return normalize(permalink)
+
+
+def redirect_sources(metadata: dict) -> list[str]:
+    sources = metadata.get("redirect_from") or []
+    if isinstance(sources, str):
+        sources = [sources]
+    return [normalize(source) for source in sources if isinstance(source, str)]
+
+
+def build_index(
+    files: Iterable[tuple[str, Path, dict]],
+) -> PermalinkIndex:
+    """Index (content type, path, frontmatter) triples in one pass"""
+    index = PermalinkIndex()
+    for kind, path, metadata in files:
+        url = page_url(kind, path, metadata)
+        if url is None:
+            continue
+        if target := metadata.get("redirect_to"):
+            # the page itself becomes a redirect
+            index.add(Route(url, path, "redirect_to", normalize(target)))
+        else:
+            index.add(Route(url, path))
+        for source in redirect_sources(metadata):
+            index.add(Route(source, path, "redirect_from", url))
+    return index
+
+
+def content_index() -> PermalinkIndex:
+    """The index of every presenter, organizer, post, page and schedule file"""
+    kinds = validation.content_types()
+    entries = content.load_entries(path for kind in kinds for path in kind.paths)
+    return build_index(
+        (kind.name, path, entries[path].metadata)
+        for kind in kinds
+        for path in kind.paths
+    )
+
+
+def output_permalink(url: str) -> str:
+    """The file 11ty writes a redirect page for ``url`` to, as a permalink"""
+    return url + "index.html" if url.endswith("/") else url
+
+
+def redirect_pages(index: PermalinkIndex, final: dict[str, str]) -> list[dict]:
+    """One entry per ``redirect_from``, for ``src/redirect-from.html``"""
+    return [
+        {"from": url, "to": final[url], "permalink": output_permalink(url)}
+        for url, route in sorted(index.redirects.items())
+        # pages with redirect_to are rendered by 11ty as they are
+        if route.origin == "redirect_from" and url in final
+    ]
+
+
+def write_redirects(
+    index: PermalinkIndex, final: dict[str, str], writer: Writer
+) -> int:
+    """Write ``REDIRECTS_FILE``; returns how many redirect pages it lists"""
+    pages = redirect_pages(index, final)
+    writer.write_text(REDIRECTS_FILE, json.dumps(pages, indent=1) + "\n")
+    return len(pages)
@@ -1,38 +1,269 @@
+from collections import Counter
 import datetime
+import importlib
+import json
+import os
 from pathlib import Path
+import sys
+import time
 
-import frontmatter
-from slugify import slugify
 import typer
-import yaml
 
+import bundle
+import conflicts
 import constants
+import content
+import ics
+import images
+import links
 import models
+import normalize
+import permalinks
+import related
+import schedule_grid
+import search_index
+import timings
+import validation
+from repository import (
+    MANUAL_SCHEDULE_FILE,
+    SCHEDULE_PATH,
+    TALK_PATH,
+    TUTORIAL_PATH,
+    ContentRepository,
+)
+from writer import Writer
 
 
 app = typer.Typer()
 REPO_ROOT = Path(__file__).parent.parent
 PRESENTER_PATH = REPO_ROOT / "src" / "_content" / "presenters"
 ORGANIZER_PATH = REPO_ROOT / "src" / "_content" / "organizers"
+POST_PATH = REPO_ROOT / "src" / "_content" / "posts"
+repository = ContentRepository()
+writer = Writer()
+DRY_RUN_OPTION = typer.Option(
+    False, "--dry-run", help="Print a diff of what would change instead of writing it"
+)
+
+
+@app.callback()
+def main(
+    ctx: typer.Context,
+    jobs: int = typer.Option(
+        0, "--jobs", "-j", help="Processes used to parse content (0: one per CPU)"
+    ),
+    print_timings: bool = timings.TIMINGS_OPTION,
+    timings_file: Path | None = timings.TIMINGS_FILE_OPTION,
+    profile: bool = timings.PROFILE_OPTION,
+    profile_top: int = timings.PROFILE_TOP_OPTION,
+):
+    """Generate and check the conference content in src/_content"""
+    content.set_jobs(jobs)
+    repository.jobs = jobs
+    timings.start(ctx, print_timings, timings_file, profile, profile_top)
 
 
 @app.command()
 def generate_manual_schedule_data(
     output_path: str = "src/_content/schedule/manual.yaml",
+    dry_run: bool = DRY_RUN_OPTION,
 ):
     """Take the manual schedule entries and write them to YAML"""
+    import yaml
+
+    writer.dry_run = dry_run
     output_file = constants.REPO_ROOT / output_path
     items = [
         schedule_item.model_dump(exclude_unset=True)
-        for schedule_item in models.MANUAL_SCHEDULE_ENTRIES
+        for schedule_item in models.manual_schedule_entries()
     ]
     data = yaml.dump(items)
-    output_file.write_text(data)
+    writer.write_text(output_file, data)
+    print(writer.summary())
+
+
+@app.command()
+def validate_schedule():
+    """Check talks, tutorials and manual entries for room, track and presenter overlaps"""
+    found = conflicts.find_conflicts(repository.sessions)
+    for conflict in found:
+        print(f"❌ {conflict}")
+    if found:
+        print(f"{len(found)} schedule conflict(s) found")
+        raise typer.Exit(code=1)
+    print(f"✅ {len(repository.sessions)} sessions, no conflicts")
+
+
+@app.command()
+def validate_content():
+    """Validate every presenter, organizer, post, page and schedule file"""
+    checked, errors = validation.validate_content(jobs=repository.jobs or None)
+    for error in errors:
+        print(f"❌ {error}")
+    if errors:
+        print(f"{len(errors)} content error(s) found")
+        raise typer.Exit(code=1)
+    print(f"✅ {checked} files valid")
+
+
+@app.command(name="normalize")
+def normalize_content(
+    dry_run: bool = DRY_RUN_OPTION,
+):
+    """Canonicalize frontmatter: social handles, datetimes and key order"""
+    writer.dry_run = dry_run
+    files = [
+        (kind.name, path) for kind in validation.content_types() for path in kind.paths
+    ]
+    results = normalize.normalize_files(files, workers=content.default_jobs)
+    errors = [result for result in results if result.error]
+    counts = Counter(name for result in results for name in result.rules)
+    for result in results:
+        if result.text is not None:
+            writer.write_text(result.path, result.text)
+        elif result.error is None:
+            writer.skip(result.path)
+    for name in normalize.rule_names():
+        print(f"{name}: {counts[name]} file(s)")
+    for result in errors:
+        print(f"❌ {result.path.relative_to(REPO_ROOT)}: {result.error}")
+    summary = writer.summary() + (f", {len(errors)} failed" if errors else "")
+    print(f"{len(files)} files: {summary}")
+    if errors:
+        raise typer.Exit(code=1)
+
+
+@app.command()
+def check_links(
+    max_age: float = typer.Option(
+        links.OK_MAX_AGE_DAYS, help="Days before a working link is checked again"
+    ),
+    refresh: bool = typer.Option(False, help="Check every link, ignoring the cache"),
+    concurrency: int = typer.Option(16, help="Requests in flight at once"),
+):
+    """Check the external links in presenters, organizers, posts, pages and sessions"""
+    paths = [path for kind in validation.content_types() for path in kind.paths]
+    found = links.collect_links(paths)
+    results, checked = links.check_links(
+        found, links.LinkCache(), max_age, refresh=refresh, jobs=concurrency
+    )
+    broken = [result for result in results.values() if not result.ok]
+    for result in broken:
+        sources = ", ".join(
+            str(path.relative_to(REPO_ROOT)) for path in sorted(found[result.url])
+        )
+        print(f"❌ {result.url} ({result.describe()}): {sources}")
+    if broken:
+        print(f"{len(broken)} of {len(results)} link(s) broken ({checked} checked)")
+        raise typer.Exit(code=1)
+    print(f"✅ {len(results)} links work ({checked} checked)")
+
+
+@app.command()
+def compile_schedule(
+    output_path: str = "src/_data/scheduleGrid.json",
+    dry_run: bool = DRY_RUN_OPTION,
+):
+    """Precompute the schedule page's day/time slot grid for lib/sessions.js"""
+    writer.dry_run = dry_run
+    output_file = constants.REPO_ROOT / output_path
+    grid = schedule_grid.compile_grid(repository)
+    writer.write_text(output_file, schedule_grid.render_grid(grid))
+    print(writer.summary())
+
+
+@app.command(name="bundle")
+def build_bundle(
+    msgpack: bool = typer.Option(
+        False, "--msgpack", help="Also write contentBundle.msgpack (needs msgpack)"
+    ),
+    dry_run: bool = DRY_RUN_OPTION,
+):
+    """Write every visible presenter, organizer, post and session to src/_data/contentBundle.json"""
+    from importlib.util import find_spec
+
+    if msgpack and find_spec("msgpack") is None:
+        print("❌ msgpack isn't installed: pip install msgpack")
+        raise typer.Exit(code=1)
+    writer.dry_run = dry_run
+    with timings.span("bundle"):
+        compiled = bundle.build(repository, writer=writer, msgpack=msgpack)
+    print(
+        f"{len(compiled['presenters'])} presenters, {len(compiled['sessions'])} sessions: "
+        f"{writer.summary()}"
+    )
+
+
+@app.command()
+def build_related_sessions(
+    top: int = typer.Option(related.TOP_K, help="Related sessions per session"),
+    dry_run: bool = DRY_RUN_OPTION,
+):
+    """Find each talk and tutorial's most similar sessions for the session layout"""
+    writer.dry_run = dry_run
+    with timings.span("related"):
+        found = related.build(repository, writer=writer, k=top)
+    print(f"{found} sessions with related sessions: {writer.summary()}")
+
+
+@app.command()
+def build_redirects(
+    dry_run: bool = DRY_RUN_OPTION,
+):
+    """Check permalinks for clashes and redirect loops, and list redirects for 11ty"""
+    writer.dry_run = dry_run
+    index = permalinks.content_index()
+    final = index.resolve()
+    for problem in index.problems:
+        print(f"{'❌' if problem.fatal else '⚠️ '} {problem}")
+    if any(problem.fatal for problem in index.problems):
+        print(f"{len(index.problems)} permalink problem(s) found")
+        raise typer.Exit(code=1)
+    listed = permalinks.write_redirects(index, final, writer)
+    print(f"{len(index.routes)} URLs, {listed} redirects: {writer.summary()}")
+
+
+@app.command()
+def export_ics(
+    dry_run: bool = DRY_RUN_OPTION,
+):
+    """Write iCalendar feeds for the whole schedule and each day, room, track and presenter"""
+    writer.dry_run = dry_run
+    feeds = ics.export(repository, writer=writer)
+    print(f"{len(feeds)} calendar feeds: {writer.summary()}")
+
+
+@app.command()
+def build_search_index(
+    dry_run: bool = DRY_RUN_OPTION,
+):
+    """Write the sharded talk and presenter search index used by assets/js/search.js"""
+    writer.dry_run = dry_run
+    documents, size = search_index.build(repository, writer=writer)
+    print(f"{documents} documents, {size / 1024:.0f} KB: {writer.summary()}")
 
 
 @app.command()
-def generate_placeholders():
+def build_images(
+    dry_run: bool = DRY_RUN_OPTION,
+):
+    """Encode presenter/organizer photo variants into dist/ ahead of the 11ty build"""
+    writer.dry_run = dry_run
+    manifest = images.build(repository, writer=writer, jobs=repository.jobs)
+    writer.write_text(
+        images.MANIFEST_FILE, json.dumps(manifest, indent=1, sort_keys=True) + "\n"
+    )
+    print(f"{len(manifest['images'])} photos: {writer.summary()}")
+
+
+@app.command()
+def generate_placeholders(
+    dry_run: bool = DRY_RUN_OPTION,
+):
     """Generate placeholders for keynotes and lightning talks"""
+    import frontmatter
+
+    writer.dry_run = dry_run
     for schedule_item in [
         # opening remarks
         create_opening_remarks(
@@ -106,8 +337,9 @@ def generate_placeholders():
         )
         post = frontmatter.loads("")
         post.metadata.update(schedule_item.model_dump(exclude_unset=True))
-        filename.write_text(frontmatter.dumps(post, indent=4) + "\n")
-        print(f"Created {filename}")
+        if writer.write_text(filename, frontmatter.dumps(post, indent=4) + "\n"):
+            print(f"Wrote {filename}")
+    print(writer.summary())
 
 
 def create_opening_remarks(
@@ -205,6 +437,8 @@ def copy_organizer_and_create_schedule(
     organizer_slug: str,
     title: str,
 ) -> models.Schedule:
+    from slugify import slugify
+
     if organizer_slug:
         copy_organizer_to_presenter(organizer_slug)
     return models.Schedule(
@@ -225,16 +459,122 @@ def copy_organizer_to_presenter(slug: str) -> None:
 
     This is a placeholder in case they want to edit the presenter bio separately.
     """
+    organizer = repository.organizers[slug]
     organizer_file = ORGANIZER_PATH / f"{slug}.md"
     presenter_file = PRESENTER_PATH / f"{slug}.md"
-    organizer_text = organizer_file.read_text()
-    presenter_file.write_text(organizer_text)
-    organizer_data = frontmatter.loads(organizer_text)
-    if filename := organizer_data.metadata.get("photo"):
+    writer.write_text(presenter_file, organizer_file.read_text())
+    if filename := organizer.photo:
         organizer_photo: Path = ORGANIZER_PATH / filename
         organizer_bytes = organizer_photo.read_bytes()
         output_file: Path = PRESENTER_PATH / filename
-        output_file.write_bytes(organizer_bytes)
+        writer.write_bytes(output_file, organizer_bytes)
+
+
+CONFIG_FILES = {
+    constants.SITE_JSON_FILE.resolve(),
+    (REPO_ROOT / "tools" / "constants.py").resolve(),
+}
+MODELS_FILE = (REPO_ROOT / "tools" / "models.py").resolve()
+SESSION_PATHS = {TALK_PATH, TUTORIAL_PATH, SCHEDULE_PATH / "sprints"}
+
+
+def placeholder_organizer_files() -> set[str]:
+    """Names of the organizer files generate-placeholders copies to presenters"""
+    names = set()
+    for name, slug in vars(constants).items():
+        if not name.endswith("_ORGANIZER_SLUG") or not slug:
+            continue
+        names.add(f"{slug}.md")
+        # the raw frontmatter is enough, and works even if another organizer is broken
+        organizer_file = ORGANIZER_PATH / f"{slug}.md"
+        if organizer_file.exists():
+            if photo := content.load_file(organizer_file).metadata.get("photo"):
+                names.add(photo)
+    return names
+
+
+def derived_outputs(changed: set[Path]) -> list[str]:
+    """The generators affected by a set of changed files, in the order to run them"""
+    outputs = set()
+    for path in changed:
+        if path in CONFIG_FILES:
+            outputs |= {"manual", "placeholders", "grid", "related", "bundle"}
+        elif path.parent in (PRESENTER_PATH, POST_PATH):
+            if path.suffix == ".md":
+                outputs.add("bundle")
+        elif path.parent == ORGANIZER_PATH:
+            if path.suffix == ".md":
+                outputs.add("bundle")
+            if path.name in placeholder_organizer_files():
+                outputs.add("placeholders")
+        elif path == MANUAL_SCHEDULE_FILE or (
+            path.parent in SESSION_PATHS and path.suffix == ".md"
+        ):
+            outputs.add("grid")
+            outputs.add("bundle")
+            if path != MANUAL_SCHEDULE_FILE:
+                outputs.add("related")
+    return [output for output in GENERATORS if output in outputs]
+
+
+GENERATORS = {
+    "manual": lambda: generate_manual_schedule_data(
+        output_path="src/_content/schedule/manual.yaml", dry_run=False
+    ),
+    "placeholders": lambda: generate_placeholders(dry_run=False),
+    "grid": lambda: compile_schedule(
+        output_path="src/_data/scheduleGrid.json", dry_run=False
+    ),
+    "related": lambda: build_related_sessions(top=related.TOP_K, dry_run=False),
+    "bundle": lambda: build_bundle(msgpack=False, dry_run=False),
+}
+
+
+def regenerate(changed: set[Path]) -> None:
+    global repository, writer
+    changed = {path.resolve() for path in changed}
+    if MODELS_FILE in changed:
+        print("🔄 models.py changed, restarting")
+        os.execv(sys.executable, [sys.executable, *sys.argv])
+    started = time.perf_counter()
+    try:
+        if changed & CONFIG_FILES:
+            importlib.reload(constants)
+            models.manual_schedule_entries.cache_clear()
+        outputs = derived_outputs(changed)
+        for output in outputs:
+            # start from the files as they are now
+            repository = ContentRepository(jobs=repository.jobs)
+            writer = Writer()
+            GENERATORS[output]()
+    except Exception as error:
+        print(f"❌ {type(error).__name__}: {error}")
+        return
+    if outputs:
+        elapsed = (time.perf_counter() - started) * 1000
+        print(f"🔁 {', '.join(outputs)} regenerated in {elapsed:.0f}ms")
+
+
+@app.command()
+def watch(
+    polling: bool = typer.Option(False, help="Poll for changes instead of using inotify"),
+):
+    """Regenerate manual.yaml, placeholders, the schedule grid and bundle as their inputs change"""
+    from watch import watch as watch_files
+
+    watch_files(
+        [
+            constants.SITE_JSON_FILE.parent,
+            MODELS_FILE.parent,
+            ORGANIZER_PATH,
+            PRESENTER_PATH,
+            POST_PATH,
+            SCHEDULE_PATH,
+            *SESSION_PATHS,
+        ],
+        regenerate,
+        polling=polling,
+    )
 
 
 if __name__ == "__main__":
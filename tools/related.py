@@ -0,0 +1,225 @@
+"""Find each session's most similar sessions, for "you might also like" links
+
+Talk and tutorial titles, abstracts and tags are turned into TF-IDF vectors
+(sublinear term counts, smoothed IDF, unit length), so the cosine similarity
+of two sessions is the dot product of their rows. Words found in a single
+session still count towards its vector's length but get no column, since
+they can't make two sessions similar. The matrix is stored sparse, as CSR
+rows, so it takes memory for the words each session has rather than for
+every word in the archive. The similarities are worked out one block of
+``BLOCK_ROWS`` sessions at a time, column by column against the same matrix
+in column order, and ``argpartition`` picks the top k of each row without
+sorting it, so they never take more than one block × all sessions of memory.
+
+The result is a small JSON file keyed by permalink that the session layout
+reads; nothing is computed at 11ty build time.
+"""
+
+from collections import Counter
+import dataclasses
+import json
+import math
+from typing import TYPE_CHECKING
+
+import constants
+import content
+import matching
+from repository import ContentRepository, Session
+from writer import Writer
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+RELATED_FILE = constants.REPO_ROOT / "src" / "_data" / "relatedSessions.json"
+TOP_K = 3
+# a tag is worth this many occurrences of a word in the abstract
+TAG_WEIGHT = 3
+TITLE_WEIGHT = 2
+# below this cosine similarity, sessions have nothing much in common
+MIN_SIMILARITY = 0.05
+# words in more than this share of sessions say nothing about any of them
+MAX_DOCUMENT_FREQUENCY = 0.5
+BLOCK_ROWS = 1024
+
+
+def terms(session: Session, body: str) -> Counter:
+    schedule = session.schedule
+    counts = Counter(word for word in matching.words(body) if len(word) > 1)
+    for word in matching.words(schedule.title or ""):
+        counts[word] += TITLE_WEIGHT
+    for tag in schedule.tags or []:
+        # tags are matched whole, so "Web Dev" doesn't just mean "web"
+        counts[f"tag:{matching.normalize(tag)}"] += TAG_WEIGHT
+    return counts
+
+
+def collect_sessions(repository: ContentRepository) -> list[tuple[Session, Counter]]:
+    sessions = [
+        session
+        for session in repository.talks + repository.tutorials
+        if not session.schedule.hidden and session.schedule.permalink
+    ]
+    bodies = {
+        loaded.path: loaded.content
+        for loaded in content.load_many(session.path for session in sessions)
+    }
+    # placeholders (remarks, keynotes to be announced...) have no abstract yet
+    return [
+        (session, terms(session, bodies[session.path]))
+        for session in sessions
+        if bodies[session.path]
+    ]
+
+
+@dataclasses.dataclass
+class SparseMatrix:
+    """Rows in CSR form: row i's values are ``data[indptr[i]:indptr[i + 1]]``,
+    in the columns at the same place in ``indices``"""
+
+    indptr: "np.ndarray"
+    indices: "np.ndarray"
+    data: "np.ndarray"
+    columns: int
+
+    @property
+    def rows(self) -> int:
+        return len(self.indptr) - 1
+
+    def transposed(self) -> "SparseMatrix":
+        """The same values in CSC form: ``transposed()``'s rows are our columns"""
+        import numpy as np
+
+        rows = np.repeat(np.arange(self.rows), np.diff(self.indptr))
+        order = np.argsort(self.indices, kind="stable")
+        counts = np.bincount(self.indices, minlength=self.columns)
+        return SparseMatrix(
+            indptr=np.concatenate(([0], np.cumsum(counts))),
+            indices=rows[order],
+            data=self.data[order],
+            columns=self.rows,
+        )
+
+
+def tfidf_matrix(documents: list[Counter]) -> SparseMatrix:
+    """Unit-length TF-IDF rows (float32), one per document"""
+    import numpy as np
+
+    document_frequency = Counter(term for counts in documents for term in counts)
+    limit = max(2, MAX_DOCUMENT_FREQUENCY * len(documents))
+    idf = {
+        term: 1 + math.log((1 + len(documents)) / (1 + found))
+        for term, found in document_frequency.items()
+        if found <= limit
+    }
+    vocabulary = {
+        term: column
+        for column, term in enumerate(
+            term for term in idf if document_frequency[term] > 1
+        )
+    }
+    indptr, columns, values = [0], [], []
+    for counts in documents:
+        squares = 0.0
+        row = []
+        for term, count in counts.items():
+            if term not in idf:
+                continue
+            weight = (1 + math.log(count)) * idf[term]
+            squares += weight * weight
+            if (column := vocabulary.get(term)) is not None:
+                row.append((column, weight))
+        # sessions with no words at all have no entries and match nothing
+        norm = math.sqrt(squares) or 1.0
+        for column, weight in sorted(row):
+            columns.append(column)
+            values.append(weight / norm)
+        indptr.append(len(columns))
+    return SparseMatrix(
+        indptr=np.array(indptr, dtype=np.int64),
+        indices=np.array(columns, dtype=np.int64),
+        data=np.array(values, dtype=np.float32),
+        columns=len(vocabulary),
+    )
+
+
+def similarities(
+    matrix: SparseMatrix, by_column: SparseMatrix, start: int, stop: int
+) -> "np.ndarray":
+    """Cosine similarities of rows ``start:stop`` with every row, as a dense block
+
+    ``by_column`` is ``matrix.transposed()``. Each column the block's rows use
+    adds the outer product of their values and every row's value there.
+    """
+    import numpy as np
+
+    block = np.zeros((stop - start, matrix.rows), dtype=np.float32)
+    first, last = matrix.indptr[start], matrix.indptr[stop]
+    rows = np.repeat(np.arange(stop - start), np.diff(matrix.indptr[start : stop + 1]))
+    columns = matrix.indices[first:last]
+    values = matrix.data[first:last]
+    order = np.argsort(columns, kind="stable")
+    columns, rows, values = columns[order], rows[order], values[order]
+    bounds = np.flatnonzero(np.diff(columns)) + 1
+    for group in np.split(np.arange(len(columns)), bounds):
+        if not len(group):
+            continue
+        column = columns[group[0]]
+        others = slice(by_column.indptr[column], by_column.indptr[column + 1])
+        # a row has each column once, so these cells don't repeat
+        block[np.ix_(rows[group], by_column.indices[others])] += np.outer(
+            values[group], by_column.data[others]
+        )
+    return block
+
+
+def nearest(matrix: SparseMatrix, k: int) -> list[list[tuple[int, float]]]:
+    """Each row's ``k`` most similar other rows, best first, as (row, cosine)"""
+    import numpy as np
+
+    count = matrix.rows
+    k = min(k, count - 1)
+    if k <= 0:
+        return [[] for _ in range(count)]
+    by_column = matrix.transposed()
+    neighbours = []
+    for start in range(0, count, BLOCK_ROWS):
+        block = similarities(matrix, by_column, start, min(start + BLOCK_ROWS, count))
+        # a session isn't related to itself
+        rows = np.arange(block.shape[0])
+        block[rows, rows + start] = -1
+        top = np.argpartition(block, -k, axis=1)[:, -k:]
+        scores = np.take_along_axis(block, top, axis=1)
+        order = np.argsort(-scores, axis=1, kind="stable")
+        top = np.take_along_axis(top, order, axis=1)
+        scores = np.take_along_axis(scores, order, axis=1)
+        for row_top, row_scores in zip(top.tolist(), scores.tolist()):
+            neighbours.append(
+                [
+                    (other, score)
+                    for other, score in zip(row_top, row_scores)
+                    if score >= MIN_SIMILARITY
+                ]
+            )
+    return neighbours
+
+
+def build(repository: ContentRepository, writer: Writer, k: int = TOP_K) -> int:
+    """Write the related sessions file; returns how many sessions have some"""
+    collected = collect_sessions(repository)
+    related = {}
+    if collected:
+        matrix = tfidf_matrix([counts for _, counts in collected])
+        for (session, _), found in zip(collected, nearest(matrix, k)):
+            if found:
+                related[session.schedule.permalink] = [
+                    {
+                        "title": collected[other][0].schedule.title,
+                        "url": collected[other][0].schedule.permalink,
+                    }
+                    for other, _ in found
+                ]
+    writer.write_text(
+        RELATED_FILE, json.dumps(related, indent=1, sort_keys=True) + "\n"
+    )
+    return len(related)
@@ -0,0 +1,232 @@
+"""One place to load the conference content and look things up in it
+
+Each collection is loaded the first time it's used and kept for the life of the
+repository object, and the lookups the tools need (slug, permalink, presenter,
+day and room) are dict-backed indexes instead of scans over every file.
+"""
+
+from collections import defaultdict
+import dataclasses
+import datetime
+from functools import cached_property
+from pathlib import Path
+
+import constants
+import content
+import models
+import timings
+
+
+CONTENT_PATH = constants.REPO_ROOT / "src" / "_content"
+PRESENTER_PATH = CONTENT_PATH / "presenters"
+ORGANIZER_PATH = CONTENT_PATH / "organizers"
+SCHEDULE_PATH = CONTENT_PATH / "schedule"
+TALK_PATH = SCHEDULE_PATH / "talks"
+TUTORIAL_PATH = SCHEDULE_PATH / "tutorials"
+MANUAL_SCHEDULE_FILE = SCHEDULE_PATH / "manual.yaml"
+
+
+@dataclasses.dataclass
+class Session:
+    """A schedule entry and the file it was loaded from
+
+    Manual entries (breaks, lunches...) all come from ``manual.yaml``.
+    """
+
+    path: Path
+    schedule: models.Schedule | models.ManualScheduleEntry
+
+    @property
+    def is_manual(self) -> bool:
+        return isinstance(self.schedule, models.ManualScheduleEntry)
+
+    @property
+    def category(self) -> str | None:
+        return getattr(self.schedule, "category", None)
+
+    @property
+    def presenter_slugs(self) -> list[str]:
+        return getattr(self.schedule, "presenter_slugs", None) or []
+
+    @property
+    def is_scheduled(self) -> bool:
+        return (
+            self.schedule.start_datetime is not None
+            and self.schedule.end_datetime is not None
+        )
+
+    @property
+    def day(self) -> datetime.date | None:
+        """The conference day it starts on, None if it has no time yet"""
+        start = self.schedule.start_datetime
+        return start.astimezone(constants.CONFERENCE_TZ).date() if start else None
+
+
+def time_order(session: Session) -> tuple:
+    """Sort key: by start, end and track, with sessions lacking times last"""
+    schedule = session.schedule
+    # the flags go first, so a missing time is never compared with a datetime
+    return (
+        schedule.start_datetime is None,
+        schedule.start_datetime or 0,
+        schedule.end_datetime is None,
+        schedule.end_datetime or 0,
+        schedule.track or "",
+    )
+
+
+class ContentRepository:
+    def __init__(self, content_path: Path = CONTENT_PATH, jobs: int | None = None):
+        self.content_path = content_path
+        self.jobs = jobs
+
+    # collections
+
+    @cached_property
+    def presenters(self) -> dict[str, models.Presenter]:
+        """slug → Presenter"""
+        loaded = content.load_models(
+            self.content_path / "presenters", models.Presenter, jobs=self.jobs
+        )
+        return {path.stem: presenter for path, presenter in loaded.items()}
+
+    @cached_property
+    def organizers(self) -> dict[str, models.Organizer]:
+        """slug → Organizer"""
+        loaded = content.load_models(
+            self.content_path / "organizers", models.Organizer, jobs=self.jobs
+        )
+        return {path.stem: organizer for path, organizer in loaded.items()}
+
+    @cached_property
+    def talks(self) -> list[Session]:
+        return self._load_sessions(self.content_path / "schedule" / "talks")
+
+    @cached_property
+    def tutorials(self) -> list[Session]:
+        return self._load_sessions(self.content_path / "schedule" / "tutorials")
+
+    @cached_property
+    def sprints(self) -> list[Session]:
+        return self._load_sessions(self.content_path / "schedule" / "sprints")
+
+    @cached_property
+    def manual(self) -> list[Session]:
+        import yaml
+
+        manual_file = self.content_path / "schedule" / "manual.yaml"
+        if not manual_file.exists():
+            return []
+        with timings.span("parse"):
+            items = yaml.safe_load(manual_file.read_text()) or []
+        with timings.span("validate.ManualScheduleEntry"):
+            return [
+                Session(path=manual_file, schedule=models.ManualScheduleEntry(**item))
+                for item in items
+            ]
+
+    @cached_property
+    def sessions(self) -> list[Session]:
+        """Every talk, tutorial, sprint and manual entry, in start time order
+
+        Sessions without a start (or end) time come last.
+        """
+        return sorted(
+            self.talks + self.tutorials + self.sprints + self.manual, key=time_order
+        )
+
+    def _load_sessions(self, path: Path) -> list[Session]:
+        if not path.is_dir():
+            return []
+        loaded = content.load_models(path, models.Schedule, jobs=self.jobs)
+        return [
+            Session(path=path, schedule=schedule) for path, schedule in loaded.items()
+        ]
+
+    # indexes
+
+    @cached_property
+    def sessions_by_path(self) -> dict[Path, Session]:
+        return {
+            session.path.resolve(): session
+            for session in self.sessions
+            if not session.is_manual
+        }
+
+    @cached_property
+    def sessions_by_presenter(self) -> dict[str, list[Session]]:
+        """presenter slug → the sessions they present, in start time order"""
+        index = defaultdict(list)
+        for session in self.sessions:
+            for slug in session.presenter_slugs:
+                index[slug].append(session)
+        return dict(index)
+
+    @cached_property
+    def sessions_by_day(self) -> dict[datetime.date, list[Session]]:
+        """day → sessions, in start time order (sessions without one are left out)"""
+        index = defaultdict(list)
+        for session in self.sessions:
+            if session.day is not None:
+                index[session.day].append(session)
+        return dict(index)
+
+    @cached_property
+    def sessions_by_day_room(
+        self,
+    ) -> dict[tuple[datetime.date, str | None], list[Session]]:
+        """(day, room) → sessions, in start time order"""
+        index = defaultdict(list)
+        for session in self.sessions:
+            if session.day is not None:
+                index[(session.day, session.schedule.room)].append(session)
+        return dict(index)
+
+    @cached_property
+    def by_permalink(
+        self,
+    ) -> dict[str, Session | models.Presenter | models.Organizer]:
+        """permalink → the session, presenter or organizer it belongs to
+
+        If two items share a permalink the first one loaded wins.
+        """
+        index = {}
+        for session in self.sessions:
+            if session.schedule.permalink:
+                index.setdefault(session.schedule.permalink, session)
+        for collection in (self.presenters, self.organizers):
+            for item in collection.values():
+                if item.permalink:
+                    index.setdefault(item.permalink, item)
+        return index
+
+    # queries
+
+    def presenters_for(self, session: Session) -> list[models.Presenter]:
+        """The session's presenters, in the order they're listed in the session"""
+        return [
+            self.presenters[slug]
+            for slug in session.presenter_slugs
+            if slug in self.presenters
+        ]
+
+    def sessions_for(self, presenter_slug: str) -> list[Session]:
+        return self.sessions_by_presenter.get(presenter_slug, [])
+
+    def sessions_on(
+        self, day: datetime.date, room: str | None = None
+    ) -> list[Session]:
+        if room is not None:
+            return self.sessions_by_day_room.get((day, room), [])
+        return self.sessions_by_day.get(day, [])
+
+    def find_session(self, reference: str | Path) -> Session:
+        """Look a talk or tutorial up by file path or permalink"""
+        path = Path(reference)
+        if path.exists() and (session := self.sessions_by_path.get(path.resolve())):
+            return session
+        reference = str(reference)
+        for permalink in (reference, f"/{reference.strip('/')}/"):
+            if isinstance(found := self.by_permalink.get(permalink), Session):
+                return found
+        raise KeyError(f"No session found for {reference!r}")
@@ -0,0 +1,91 @@
+"""Precompute the day → time slot → sessions grid used by the schedule page
+
+``lib/sessions.js`` reads the compiled file instead of grouping and sorting
+every session on each 11ty build. Sessions that come from markdown files are
+referenced by path (11ty still provides their data), while manual entries are
+written out in full.
+"""
+
+import datetime
+import hashlib
+import json
+from pathlib import Path
+
+import constants
+from repository import MANUAL_SCHEDULE_FILE, ContentRepository, Session, time_order
+
+
+GRID_FILE = constants.REPO_ROOT / "src" / "_data" / "scheduleGrid.json"
+# bump this (and GRID_VERSION in lib/sessions.js) when the layout changes
+GRID_VERSION = 1
+
+
+def epoch_ms(value: datetime.datetime) -> int:
+    return round(value.timestamp() * 1000)
+
+
+def local_isoformat(value: datetime.datetime) -> str:
+    return value.astimezone(constants.CONFERENCE_TZ).isoformat()
+
+
+def session_entry(session: Session) -> dict:
+    schedule = session.schedule
+    entry = {
+        "start": epoch_ms(schedule.start_datetime),
+        "end": epoch_ms(schedule.end_datetime),
+    }
+    if session.is_manual:
+        entry["data"] = schedule.model_dump(mode="json") | {
+            "start_datetime": local_isoformat(schedule.start_datetime),
+            "end_datetime": local_isoformat(schedule.end_datetime),
+        }
+    else:
+        entry["path"] = session.path.relative_to(constants.REPO_ROOT).as_posix()
+    return entry
+
+
+def compile_grid(
+    repository: ContentRepository, manual_file: Path = MANUAL_SCHEDULE_FILE
+) -> dict:
+    sessions = sorted(
+        (
+            session
+            for session in repository.sessions
+            if session.is_manual or not session.schedule.hidden
+        ),
+        key=time_order,
+    )
+    days: dict[str, list[dict]] = {}
+    slots: dict[tuple, dict] = {}
+    for session in sessions:
+        if not session.is_scheduled:
+            # no slot to put it in; it still counts towards file_session_count
+            continue
+        start = session.schedule.start_datetime
+        end = session.schedule.end_datetime
+        slot_key = (start, end)
+        if (slot := slots.get(slot_key)) is None:
+            slot = slots[slot_key] = {
+                "start": local_isoformat(start),
+                "end": local_isoformat(end),
+                "start_epoch": epoch_ms(start),
+                "end_epoch": epoch_ms(end),
+                "sessions": [],
+            }
+            days.setdefault(session.day.isoformat(), []).append(slot)
+        slot["sessions"].append(session_entry(session))
+    return {
+        "version": GRID_VERSION,
+        "timezone": str(constants.CONFERENCE_TZ),
+        "manual_digest": (
+            hashlib.sha256(manual_file.read_bytes()).hexdigest()
+            if manual_file.exists()
+            else None
+        ),
+        "file_session_count": sum(1 for session in sessions if not session.is_manual),
+        "days": days,
+    }
+
+
+def render_grid(grid: dict) -> str:
+    return json.dumps(grid, indent=1, ensure_ascii=False) + "\n"
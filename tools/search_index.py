@@ -0,0 +1,153 @@
+"""Build the client-side search index for talks and presenters
+
+Titles, tags, abstracts, presenter names, companies and bios are broken into
+words (``matching.words``) and put into an inverted index of numeric doc ids.
+The index is split into one shard per first character of a term, so a search
+only downloads the shards for the letters its words start with, and each
+shard keeps its terms sorted so src/assets/js/search.js can find every term
+with a given prefix with a binary search.
+
+Everything is plain JSON with small integers (doc ids are delta-encoded),
+which gzips well::
+
+    docs.json   {"version": 1, "docs": [[kind, title, url, subtitle], ...]}
+    d.json      {"terms": ["django", "djangocon"], "postings": [[doc, weight, doc, weight], ...]}
+"""
+
+from collections import Counter, defaultdict
+import json
+
+import constants
+import content
+import matching
+from repository import ContentRepository
+from writer import Writer
+
+
+OUTPUT_PATH = constants.REPO_ROOT / "dist" / "search"
+INDEX_VERSION = 1
+# how much a word counts for, by where it was found
+FIELD_WEIGHTS = {
+    "title": 8,
+    "name": 8,
+    "tags": 4,
+    "company": 2,
+    "body": 1,
+}
+# a word repeated all over an abstract shouldn't drown out the title
+MAX_WEIGHT = 255
+# single letters only bloat the index; prefix search still finds longer words
+MIN_WORD_LENGTH = 2
+
+
+def weigh(fields: dict[str, str]) -> Counter:
+    weights: Counter = Counter()
+    for field, text in fields.items():
+        for word in matching.words(text or ""):
+            if len(word) < MIN_WORD_LENGTH:
+                continue
+            weights[word] += FIELD_WEIGHTS[field]
+    return Counter({word: min(weight, MAX_WEIGHT) for word, weight in weights.items()})
+
+
+def collect_documents(
+    repository: ContentRepository,
+) -> list[tuple[list[str], Counter]]:
+    """``([kind, title, url, subtitle], word weights)`` for every searchable page"""
+    documents = []
+    sessions = [
+        session
+        for session in repository.talks + repository.tutorials + repository.sprints
+        if not session.schedule.hidden and session.schedule.permalink
+    ]
+    bodies = {
+        loaded.path: loaded.content
+        for loaded in content.load_many(session.path for session in sessions)
+    }
+    for session in sessions:
+        schedule = session.schedule
+        presenters = repository.presenters_for(session)
+        names = ", ".join(presenter.name for presenter in presenters)
+        documents.append(
+            (
+                [session.category or "talks", schedule.title, schedule.permalink, names],
+                weigh(
+                    {
+                        "title": schedule.title,
+                        "tags": " ".join(schedule.tags or []),
+                        "name": names,
+                        "company": " ".join(
+                            presenter.company or "" for presenter in presenters
+                        ),
+                        "body": bodies[session.path],
+                    }
+                ),
+            )
+        )
+
+    bios = {
+        loaded.path.stem: loaded.content
+        for loaded in content.load_directory(repository.content_path / "presenters")
+    }
+    for slug, presenter in repository.presenters.items():
+        if presenter.hidden or not presenter.permalink:
+            continue
+        documents.append(
+            (
+                ["presenters", presenter.name, presenter.permalink, presenter.company or ""],
+                weigh(
+                    {
+                        "name": presenter.name,
+                        "company": presenter.company,
+                        "body": bios.get(slug, ""),
+                    }
+                ),
+            )
+        )
+    return documents
+
+
+def build_shards(documents: list[tuple[list[str], Counter]]) -> dict[str, dict]:
+    """Shard key (first character) → sorted terms and delta-encoded postings"""
+    postings: dict[str, list[tuple[int, int]]] = defaultdict(list)
+    for doc_id, (_, weights) in enumerate(documents):
+        for word, weight in weights.items():
+            postings[word].append((doc_id, weight))
+
+    shards: dict[str, dict] = {}
+    for term in sorted(postings):
+        shard = shards.setdefault(term[0], {"terms": [], "postings": []})
+        encoded = []
+        previous = 0
+        for doc_id, weight in postings[term]:
+            encoded += [doc_id - previous, weight]
+            previous = doc_id
+        shard["terms"].append(term)
+        shard["postings"].append(encoded)
+    return shards
+
+
+def dumps(data: dict) -> str:
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False) + "\n"
+
+
+def build(repository: ContentRepository, writer: Writer) -> tuple[int, int]:
+    """Write the docs list and every shard; returns (documents, bytes written)"""
+    documents = collect_documents(repository)
+    shards = build_shards(documents)
+    files = {
+        "docs": dumps({"version": INDEX_VERSION, "docs": [doc for doc, _ in documents]})
+    }
+    files.update((key, dumps(shard)) for key, shard in shards.items())
+
+    if not writer.dry_run:
+        OUTPUT_PATH.mkdir(parents=True, exist_ok=True)
+    for name, text in sorted(files.items()):
+        writer.write_text(OUTPUT_PATH / f"{name}.json", text)
+    if OUTPUT_PATH.exists():
+        for stale in OUTPUT_PATH.glob("*.json"):
+            if stale.stem not in files:
+                print(f"🗑️ {stale.name} is no longer part of the index")
+                if not writer.dry_run:
+                    stale.unlink()
+    return len(documents), sum(len(text.encode("utf-8")) for text in files.values())
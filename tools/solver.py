@@ -0,0 +1,438 @@
+"""Assign talks to schedule slots with local search
+
+The talks keep their lengths and are shuffled between the slots the movable
+talks are in now (or the ``slots`` listed in the constraints file) to
+minimize, in order of weight:
+
+- presenters booked twice at once, or while they're unavailable
+- shared tags between talks that run in parallel, so people interested in a
+  topic don't have to choose
+- talks outside their preferred room
+- talks moved at all, so an already good schedule stays as it is
+
+Placeholders at the times set in constants.py (keynotes, opening remarks,
+lightning talks...) and hidden talks stay where they are, and no slot may
+overlap a fixed session or manual schedule entry in the same room.
+
+The constraints file is YAML, and every part of it is optional::
+
+    unavailable:
+      jane-doe:
+        - 2025-09-10  # the whole day
+        - start: 2025-09-08 13:00:00-05:00
+          end: 2025-09-08 15:00:00-05:00
+    rooms:
+      /talks/a-popular-talk/: Room A
+    fixed:
+      - /talks/a-talk-that-stays-put/
+    slots:
+      - start: 2025-09-08 10:50:00-05:00
+        end: 2025-09-08 11:35:00-05:00
+        room: Room A
+        track: t0
+
+Each step of the search moves one talk to another slot of the same length,
+swapping it with the talk already there. Only the slots running in parallel
+with the two slots involved are looked at to price a step, so a step costs
+the same however big the conference is, and simulated annealing decides
+which steps to take.
+"""
+
+from collections import defaultdict
+import dataclasses
+import datetime
+import math
+import itertools
+from pathlib import Path
+import random
+
+import conflicts
+import constants
+import models
+from moves import Move, PlanError, Slot, localize
+from repository import ContentRepository, Session
+
+
+PRESENTER_CONFLICT_COST = 1000
+TAG_OVERLAP_COST = 10
+ROOM_PREFERENCE_COST = 5
+MOVE_COST = 1
+# annealing temperatures, in cost units
+START_TEMPERATURE = 2.0 * TAG_OVERLAP_COST
+END_TEMPERATURE = 0.05
+# steps per movable talk when --iterations isn't given
+STEPS_PER_TALK = 100
+MIN_STEPS = 20_000
+ZEROS = itertools.repeat(0)
+
+Window = tuple[datetime.datetime, datetime.datetime]
+
+
+@dataclasses.dataclass
+class Constraints:
+    unavailable: dict[str, list[Window]] = dataclasses.field(default_factory=dict)
+    rooms: dict[Path, str] = dataclasses.field(default_factory=dict)
+    fixed: set[Path] = dataclasses.field(default_factory=set)
+    slots: list[Slot] | None = None
+
+
+@dataclasses.dataclass
+class Problem:
+    talks: list[Session]
+    slots: list[Slot]
+    # slot index each talk is in now (-1 if its slot isn't one of ``slots``)
+    current: list[int]
+    # slots each talk fits, i.e. of the same length
+    allowed: list[list[int]]
+    # slots that overlap each slot in time
+    parallel: list[list[int]]
+    presenters: list[frozenset[str]]
+    tags: list[frozenset[str]]
+    rooms: list[str | None]
+    busy: dict[str, list[Window]]
+    # what running two talks at once costs, for the pairs where it's not 0
+    pairs: list[dict[int, int]]
+
+
+def overlaps(first: Window, second: Window) -> bool:
+    return first[0] < second[1] and second[0] < first[1]
+
+
+def window(slot: Slot) -> Window:
+    return (slot.start_datetime, slot.end_datetime)
+
+
+def load_constraints(
+    constraints_file: Path | None, repository: ContentRepository
+) -> Constraints:
+    import yaml
+
+    data = yaml.safe_load(constraints_file.read_text()) if constraints_file else None
+    data = data or {}
+    errors = []
+
+    def find(reference: str) -> Session | None:
+        try:
+            return repository.find_session(reference)
+        except KeyError as error:
+            errors.append(str(error.args[0]))
+            return None
+
+    constraints = Constraints()
+    for slug, entries in (data.get("unavailable") or {}).items():
+        if slug not in repository.presenters:
+            errors.append(f"No presenter found for {slug!r}")
+        for entry in entries or []:
+            if isinstance(entry, datetime.date) and not isinstance(
+                entry, datetime.datetime
+            ):
+                start = datetime.datetime.combine(
+                    entry, datetime.time(), tzinfo=constants.CONFERENCE_TZ
+                )
+                end = start + datetime.timedelta(days=1)
+            else:
+                start, end = localize(entry["start"]), localize(entry["end"])
+            constraints.unavailable.setdefault(slug, []).append((start, end))
+    for reference, room in (data.get("rooms") or {}).items():
+        if session := find(reference):
+            constraints.rooms[session.path] = room
+    for reference in data.get("fixed") or []:
+        if session := find(reference):
+            constraints.fixed.add(session.path)
+    if (slots := data.get("slots")) is not None:
+        constraints.slots = [
+            Slot(
+                start_datetime=localize(slot["start"]),
+                end_datetime=localize(slot["end"]),
+                room=slot.get("room"),
+                track=slot.get("track"),
+            )
+            for slot in slots
+        ]
+    if errors:
+        raise PlanError(errors)
+    return constraints
+
+
+def placeholder_windows() -> set[Window]:
+    """Times set aside in constants.py for keynotes, remarks, lightning talks..."""
+    windows = set()
+    for name in dir(constants):
+        if name.endswith("_START") and name.removesuffix("_START") + "_END" in dir(
+            constants
+        ):
+            start = getattr(constants, name)
+            end = getattr(constants, name.removesuffix("_START") + "_END")
+            if isinstance(start, datetime.datetime):
+                windows.add((start, end))
+    for name in dir(constants):
+        if name.startswith("TALK_DAY_"):
+            day = getattr(constants, name)
+            windows.add(
+                tuple(
+                    datetime.datetime.combine(day, time, tzinfo=constants.CONFERENCE_TZ)
+                    for time in (
+                        constants.LIGHTNING_TALK_START_TIME,
+                        constants.LIGHTNING_TALK_END_TIME,
+                    )
+                )
+            )
+    return windows
+
+
+def build_problem(repository: ContentRepository, constraints: Constraints) -> Problem:
+    placeholders = placeholder_windows()
+    talks, fixed = [], []
+    for session in repository.talks:
+        schedule = session.schedule
+        if (
+            schedule.hidden
+            or session.path in constraints.fixed
+            or (schedule.start_datetime, schedule.end_datetime) in placeholders
+        ):
+            fixed.append(session)
+        else:
+            talks.append(session)
+
+    # everything that stays put blocks its room and its presenters' time
+    blocked: dict[str, list[Window]] = defaultdict(list)
+    busy: dict[str, list[Window]] = defaultdict(list)
+    for slug, windows in constraints.unavailable.items():
+        busy[slug] += windows
+    stationary = fixed + repository.tutorials + repository.sprints
+    for session in stationary:
+        session_window = (session.schedule.start_datetime, session.schedule.end_datetime)
+        for room in conflicts.room_keys(session):
+            blocked[room].append(session_window)
+        for slug in session.presenter_slugs:
+            busy[slug].append(session_window)
+    for entry in models.manual_schedule_entries():
+        if entry.room not in conflicts.SHARED_ROOMS:
+            blocked[entry.room].append((entry.start_datetime, entry.end_datetime))
+
+    candidates = constraints.slots
+    if candidates is None:
+        candidates = [Slot.of(session) for session in talks]
+    slots = [
+        slot
+        for slot in dict.fromkeys(candidates)
+        if not any(overlaps(window(slot), other) for other in blocked[slot.room or ""])
+    ]
+    slots.sort(key=lambda slot: (slot.start_datetime, slot.track or "", slot.room or ""))
+
+    index = {slot: number for number, slot in enumerate(slots)}
+    by_duration: dict[datetime.timedelta, list[int]] = defaultdict(list)
+    for number, slot in enumerate(slots):
+        by_duration[slot.duration].append(number)
+    errors = []
+    needed: dict[datetime.timedelta, int] = defaultdict(int)
+    for session in talks:
+        needed[Slot.of(session).duration] += 1
+    for duration, count in needed.items():
+        if count > len(by_duration[duration]):
+            errors.append(
+                f"{count} talks are {duration} long but there are only "
+                f"{len(by_duration[duration])} free slots that long"
+            )
+    if errors:
+        raise PlanError(errors)
+
+    # time-sorted sweep: each slot against the ones that start before it ends
+    parallel: list[list[int]] = [[] for _ in slots]
+    for number, slot in enumerate(slots):
+        for other in range(number + 1, len(slots)):
+            if slots[other].start_datetime >= slot.end_datetime:
+                break
+            if overlaps(window(slot), window(slots[other])):
+                parallel[number].append(other)
+                parallel[other].append(number)
+
+    current = []
+    taken = set()
+    for session in talks:
+        number = index.get(Slot.of(session), -1)
+        # two talks in one slot already: only the first keeps it
+        current.append(number if number not in taken else -1)
+        taken.add(number)
+
+    presenters = [frozenset(session.presenter_slugs) for session in talks]
+    tags = [frozenset(session.schedule.tags or []) for session in talks]
+    return Problem(
+        talks=talks,
+        slots=slots,
+        current=current,
+        allowed=[by_duration[Slot.of(session).duration] for session in talks],
+        parallel=parallel,
+        presenters=presenters,
+        tags=tags,
+        rooms=[constraints.rooms.get(session.path) for session in talks],
+        busy=dict(busy),
+        pairs=pair_costs(presenters, tags),
+    )
+
+
+def pair_costs(
+    presenters: list[frozenset[str]], tags: list[frozenset[str]]
+) -> list[dict[int, int]]:
+    """Talk → the talks sharing a presenter or tag with it, and what that costs"""
+    pairs: list[dict[int, int]] = [defaultdict(int) for _ in presenters]
+    for features, cost in (
+        (presenters, PRESENTER_CONFLICT_COST),
+        (tags, TAG_OVERLAP_COST),
+    ):
+        talks_with: dict[str, list[int]] = defaultdict(list)
+        for talk, found in enumerate(features):
+            for feature in found:
+                talks_with[feature].append(talk)
+        for sharing in talks_with.values():
+            for talk in sharing:
+                for other in sharing:
+                    if other != talk:
+                        pairs[talk][other] += cost
+    return [dict(costs) for costs in pairs]
+
+
+class Search:
+    """An assignment of talks to slots and its cost, updated one step at a time"""
+
+    def __init__(self, problem: Problem):
+        self.problem = problem
+        self.windows = [window(slot) for slot in problem.slots]
+        self.busy = [
+            [busy for slug in presenters for busy in problem.busy.get(slug, ())]
+            for presenters in problem.presenters
+        ]
+        self.assignment = list(problem.current)
+        self.occupant = [-1] * len(problem.slots)
+        for talk, slot in enumerate(self.assignment):
+            if slot >= 0:
+                self.occupant[slot] = talk
+        # talks whose slot wasn't in the list take any free slot of their length
+        for talk, slot in enumerate(self.assignment):
+            if slot < 0:
+                slot = next(
+                    slot for slot in problem.allowed[talk] if self.occupant[slot] < 0
+                )
+                self.assignment[talk] = slot
+                self.occupant[slot] = talk
+        self.cost = sum(
+            self.place_cost(talk, slot) for talk, slot in enumerate(self.assignment)
+        )
+        self.cost += sum(
+            self.pair_cost(talk, other)
+            for talk, slot in enumerate(self.assignment)
+            for parallel in problem.parallel[slot]
+            if (other := self.occupant[parallel]) > talk
+        )
+
+    def place_cost(self, talk: int, slot: int) -> int:
+        """What putting ``talk`` in ``slot`` costs on its own"""
+        problem = self.problem
+        cost = MOVE_COST if slot != problem.current[talk] else 0
+        if problem.rooms[talk] and problem.rooms[talk] != problem.slots[slot].room:
+            cost += ROOM_PREFERENCE_COST
+        for busy in self.busy[talk]:
+            if overlaps(self.windows[slot], busy):
+                cost += PRESENTER_CONFLICT_COST
+        return cost
+
+    def pair_cost(self, talk: int, other: int) -> int:
+        """What running ``talk`` and ``other`` at the same time costs"""
+        return self.problem.pairs[talk].get(other, 0)
+
+    def parallel_cost(self, talk: int, slot: int) -> int:
+        """What running ``talk`` alongside whatever is parallel to ``slot`` costs"""
+        pairs = self.problem.pairs[talk]
+        if not pairs:
+            return 0
+        # the hot loop: lookups in C rather than a Python for loop
+        others = map(self.occupant.__getitem__, self.problem.parallel[slot])
+        return sum(map(pairs.get, others, ZEROS))
+
+    def delta(self, talk: int, target: int) -> int:
+        """Cost change of moving ``talk`` to ``target``, swapping out its occupant"""
+        source = self.assignment[talk]
+        other = self.occupant[target]
+        change = (
+            self.place_cost(talk, target)
+            - self.place_cost(talk, source)
+            + self.parallel_cost(talk, target)
+            - self.parallel_cost(talk, source)
+        )
+        if other >= 0:
+            change += (
+                self.place_cost(other, source)
+                - self.place_cost(other, target)
+                + self.parallel_cost(other, source)
+                - self.parallel_cost(other, target)
+            )
+            if overlaps(self.windows[source], self.windows[target]):
+                # the two run side by side before and after; the sums above
+                # counted that as going away twice
+                change += 2 * self.pair_cost(talk, other)
+        return change
+
+    def apply(self, talk: int, target: int, change: int) -> None:
+        source = self.assignment[talk]
+        other = self.occupant[target]
+        self.assignment[talk] = target
+        self.occupant[target] = talk
+        self.occupant[source] = other
+        if other >= 0:
+            self.assignment[other] = source
+        self.cost += change
+
+
+def solve(problem: Problem, iterations: int = 0, seed: int = 0) -> tuple[list[int], int]:
+    """Anneal from the current schedule; returns the best assignment and its cost"""
+    search = Search(problem)
+    best, best_cost = list(search.assignment), search.cost
+    if not problem.talks:
+        return best, best_cost
+    rng = random.Random(seed)
+    iterations = iterations or max(MIN_STEPS, STEPS_PER_TALK * len(problem.talks))
+    cooling = (END_TEMPERATURE / START_TEMPERATURE) ** (1 / iterations)
+    temperature = START_TEMPERATURE
+    for _ in range(iterations):
+        temperature *= cooling
+        talk = rng.randrange(len(problem.talks))
+        target = rng.choice(problem.allowed[talk])
+        if target == search.assignment[talk]:
+            continue
+        change = search.delta(talk, target)
+        if change <= 0 or rng.random() < math.exp(-change / temperature):
+            search.apply(talk, target, change)
+            if search.cost < best_cost:
+                best, best_cost = list(search.assignment), search.cost
+    return best, best_cost
+
+
+def score(problem: Problem, assignment: list[int]) -> dict[str, int]:
+    """How many of each thing the solver minimizes ``assignment`` has"""
+    occupant = {slot: talk for talk, slot in enumerate(assignment)}
+    found = {"presenter conflicts": 0, "shared tags": 0, "room misses": 0, "moved": 0}
+    for talk, slot in enumerate(assignment):
+        slot_window = window(problem.slots[slot])
+        found["presenter conflicts"] += sum(
+            overlaps(slot_window, busy)
+            for slug in problem.presenters[talk]
+            for busy in problem.busy.get(slug, ())
+        )
+        if problem.rooms[talk] and problem.rooms[talk] != problem.slots[slot].room:
+            found["room misses"] += 1
+        found["moved"] += slot != problem.current[talk]
+        for parallel in problem.parallel[slot]:
+            if (other := occupant.get(parallel, -1)) > talk:
+                found["presenter conflicts"] += len(
+                    problem.presenters[talk] & problem.presenters[other]
+                )
+                found["shared tags"] += len(problem.tags[talk] & problem.tags[other])
+    return found
+
+
+def to_moves(problem: Problem, assignment: list[int]) -> list[Move]:
+    return [
+        Move(session=session, slot=problem.slots[slot])
+        for session, slot in zip(problem.talks, assignment)
+        if problem.slots[slot] != Slot.of(session)
+    ]
@@ -1,69 +1,120 @@
-"""Swap two talks in the schedule"""
+"""Swap two talks in the schedule, or apply a whole plan of moves at once"""
 
-import datetime
 from pathlib import Path
 
-import frontmatter
-from slugify import slugify
 import typer
-import yaml
 
-import constants
-import models
+import moves
+import solver
+import timings
+from repository import ContentRepository
+from writer import Writer, display_path
 
 
 app = typer.Typer()
 REPO_ROOT = Path(__file__).parent.parent
+DRY_RUN_OPTION = typer.Option(
+    False, "--dry-run", help="Print a diff of what would change instead of writing it"
+)
+
+
+@app.callback()
+def main(
+    ctx: typer.Context,
+    print_timings: bool = timings.TIMINGS_OPTION,
+    timings_file: Path | None = timings.TIMINGS_FILE_OPTION,
+    profile: bool = timings.PROFILE_OPTION,
+    profile_top: int = timings.PROFILE_TOP_OPTION,
+):
+    """Move talks around the schedule"""
+    timings.start(ctx, print_timings, timings_file, profile, profile_top)
 
 
 @app.command()
 def swap(
     talk1: str,
     talk2: str,
+    dry_run: bool = DRY_RUN_OPTION,
 ):
-    """Switch two talks in the program"""
-    talk_1_text = Path(talk1).read_text()
-    talk_2_text = Path(talk2).read_text()
-    output_folder = Path(talk1).parent
-    talk_1_data = frontmatter.loads(talk_1_text)
-    talk_2_data = frontmatter.loads(talk_2_text)
-    talk_1_schedule = models.Schedule(**talk_1_data.metadata)
-    talk_2_schedule = models.Schedule(**talk_2_data.metadata)
-    t1_room = talk_1_schedule.room
-    t1_start = talk_1_schedule.start_datetime
-    t1_end = talk_1_schedule.end_datetime
-    t1_track = talk_1_schedule.track
-    t1_duration = t1_end - t1_start
-    t2_duration = talk_2_schedule.end_datetime - talk_2_schedule.start_datetime
-    assert t2_duration == t1_duration, "Talks are not the same length!"
-    talk_1_schedule.room = talk_2_schedule.room
-    talk_1_schedule.start_datetime = talk_2_schedule.start_datetime
-    talk_1_schedule.end_datetime = talk_2_schedule.end_datetime
-    talk_1_schedule.track = talk_2_schedule.track
-    talk_2_schedule.start_datetime = t1_start
-    talk_2_schedule.end_datetime = t1_end
-    talk_2_schedule.room = t1_room
-    talk_2_schedule.track = t1_track
-    Path(talk1).unlink()
-    Path(talk2).unlink()
-    output_path: Path = (
-            output_folder
-            # TODO please make this less ugly
-            / f"{talk_1_schedule.start_datetime.year}-{talk_1_schedule.start_datetime.month:0>2}"
-            f"-{talk_1_schedule.start_datetime.day:0>2}-{talk_1_schedule.start_datetime.hour:0>2}"
-            f"-{talk_1_schedule.start_datetime.minute:0>2}-{talk_1_schedule.track}-{slugify(talk_1_schedule.title)}.md"
-        )
-    talk_1_data.metadata.update(talk_1_schedule.model_dump(exclude_unset=True))
-    output_path.write_text(frontmatter.dumps(talk_1_data))
-    output_path: Path = (
-            output_folder
-            # TODO please make this less ugly
-            / f"{talk_2_schedule.start_datetime.year}-{talk_2_schedule.start_datetime.month:0>2}"
-            f"-{talk_2_schedule.start_datetime.day:0>2}-{talk_2_schedule.start_datetime.hour:0>2}"
-            f"-{talk_2_schedule.start_datetime.minute:0>2}-{talk_2_schedule.track}-{slugify(talk_2_schedule.title)}.md"
+    """Switch two talks in the program
+
+    Talks can be given as file paths or permalinks.
+    """
+    apply_plan({"swaps": [[talk1, talk2]]}, dry_run=dry_run)
+
+
+@app.command()
+def batch(
+    plan_file: Path,
+    dry_run: bool = DRY_RUN_OPTION,
+):
+    """Apply a YAML plan of moves, swaps and rotations in one pass
+
+    See tools/moves.py for the plan format.
+    """
+    apply_plan(moves.load_plan(plan_file), dry_run=dry_run)
+
+
+@app.command()
+def solve(
+    constraints_file: Path | None = typer.Argument(None),
+    iterations: int = typer.Option(
+        0, help="Search steps (0: scaled to the number of talks)"
+    ),
+    seed: int = typer.Option(0, help="Random seed, for a different schedule"),
+    dry_run: bool = DRY_RUN_OPTION,
+):
+    """Reassign talks to slots, minimizing presenter conflicts and parallel topics
+
+    See tools/solver.py for what's optimized and the constraints file format.
+    """
+    repository = ContentRepository()
+    try:
+        problem = solver.build_problem(
+            repository, solver.load_constraints(constraints_file, repository)
         )
-    talk_2_data.metadata.update(talk_2_schedule.model_dump(exclude_unset=True))
-    output_path.write_text(frontmatter.dumps(talk_2_data))
+    except moves.PlanError as error:
+        exit_with_errors(error)
+    before = solver.score(problem, solver.Search(problem).assignment)
+    with timings.span("solve"):
+        assignment, _ = solver.solve(problem, iterations=iterations, seed=seed)
+    after = solver.score(problem, assignment)
+    print(f"{len(problem.talks)} talks, {len(problem.slots)} slots")
+    for name in before:
+        print(f"  {name}: {before[name]} → {after[name]}")
+    write_moves(solver.to_moves(problem, assignment), repository, dry_run=dry_run)
+
+
+def exit_with_errors(error: moves.PlanError) -> None:
+    for message in error.args[0]:
+        print(f"❌ {message}")
+    raise typer.Exit(code=1)
+
+
+def apply_plan(plan: dict, dry_run: bool = False) -> None:
+    repository = ContentRepository()
+    try:
+        planned = moves.build_moves(plan, repository)
+    except moves.PlanError as error:
+        exit_with_errors(error)
+    write_moves(planned, repository, dry_run=dry_run)
+
+
+def write_moves(
+    planned: list[moves.Move], repository: ContentRepository, dry_run: bool = False
+) -> None:
+    if found := moves.check_conflicts(planned, repository):
+        for conflict in found:
+            print(f"❌ {conflict}")
+        print(f"{len(found)} schedule conflict(s) found, nothing was changed")
+        raise typer.Exit(code=1)
+
+    writer = Writer(dry_run=dry_run)
+    for old_path, new_path in moves.apply_moves(planned, writer).items():
+        if old_path != new_path:
+            print(f"{display_path(old_path)} → {display_path(new_path)}")
+    print(writer.summary())
+
 
 if __name__ == "__main__":
     app()
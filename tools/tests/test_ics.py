@@ -0,0 +1,52 @@
+"""UIDs in the calendar feeds"""
+
+import re
+
+import yaml
+
+import ics
+from repository import ContentRepository
+
+
+LUNCH_LINK = "https://example.com/menu/#monday-lunch"
+
+
+def uids(feed: str) -> list[str]:
+    return re.findall(r"^UID:(.*)\r$", feed, re.MULTILINE)
+
+
+def test_manual_entries_sharing_a_link_get_their_own_uids(tmp_path):
+    schedule = tmp_path / "schedule"
+    schedule.mkdir()
+    (schedule / "manual.yaml").write_text(
+        yaml.safe_dump(
+            [
+                {
+                    "start_datetime": f"2025-09-08 {start}:00-05:00",
+                    "end_datetime": f"2025-09-08 {end}:00-05:00",
+                    "permalink": LUNCH_LINK,
+                    "room": "Hall",
+                    "title": title,
+                    "track": "t0",
+                }
+                for start, end, title in (
+                    ("11:30", "12:30", "Early Lunch"),
+                    ("12:30", "13:30", "Lunch"),
+                )
+            ]
+        )
+    )
+    repository = ContentRepository(tmp_path)
+    name, events = ics.collect_feeds(repository)["all"]
+    found = uids("".join(ics.render_calendar(name, events)))
+    assert len(found) == 2
+    assert len(set(found)) == 2
+    assert all(uid.startswith("manual-") for uid in found)
+    assert not any("#" in uid or "https" in uid for uid in found)
+
+
+def test_schedule_feed_has_no_duplicate_uids():
+    name, events = ics.collect_feeds(ContentRepository())["all"]
+    found = uids("".join(ics.render_calendar(name, events)))
+    assert found
+    assert len(found) == len(set(found))
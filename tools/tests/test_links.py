@@ -0,0 +1,123 @@
+"""check_links against a local stand-in HTTP server"""
+
+import http.server
+import socket
+import threading
+
+import pytest
+
+import links
+
+
+class StandIn(http.server.BaseHTTPRequestHandler):
+    """/ok, /missing, /no-head (405 to HEAD) and /busy (429 the first time)"""
+
+    hits: dict[str, int] = {}
+
+    def log_message(self, *args) -> None:
+        pass
+
+    def respond(self, body: bool) -> None:
+        self.hits[self.path] = self.hits.get(self.path, 0) + 1
+        headers = {}
+        if self.path == "/missing":
+            status = 404
+        elif self.path == "/no-head" and self.command == "HEAD":
+            status = 405
+        elif self.path == "/busy" and self.hits[self.path] == 1:
+            status = 429
+            headers["Retry-After"] = "1"
+        else:
+            status = 200
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        if body:
+            self.wfile.write(b"ok")
+
+    def do_HEAD(self) -> None:
+        self.respond(body=False)
+
+    def do_GET(self) -> None:
+        self.respond(body=True)
+
+
+@pytest.fixture
+def server():
+    StandIn.hits = {}
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), StandIn)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(autouse=True)
+def no_pacing(monkeypatch):
+    monkeypatch.setattr(links, "HOST_INTERVAL_SECONDS", 0)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return links.LinkCache(tmp_path / "links.json")
+
+
+def closed_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def check(server: str, paths: list[str], cache: links.LinkCache):
+    results, checked = links.check_links([server + path for path in paths], cache)
+    return {url.removeprefix(server): result for url, result in results.items()}, checked
+
+
+def test_working_link(server, cache):
+    results, checked = check(server, ["/ok"], cache)
+    assert results["/ok"].ok
+    assert results["/ok"].status == 200
+    assert checked == 1
+
+
+def test_broken_link(server, cache):
+    results, _ = check(server, ["/missing"], cache)
+    assert not results["/missing"].ok
+    assert results["/missing"].describe() == "404"
+
+
+def test_head_refused_falls_back_to_get(server, cache):
+    results, _ = check(server, ["/no-head"], cache)
+    assert results["/no-head"].status == 200
+    assert StandIn.hits["/no-head"] == 2
+
+
+def test_too_many_requests_retried_after_retry_after(server, cache):
+    results, _ = check(server, ["/busy"], cache)
+    assert results["/busy"].status == 200
+    assert StandIn.hits["/busy"] == 2
+
+
+def test_refused_connection(cache):
+    url = f"http://127.0.0.1:{closed_port()}/"
+    results, _ = links.check_links([url], cache)
+    assert not results[url].ok
+    assert results[url].status is None
+    assert results[url].error == "ConnectionError"
+
+
+def test_rerun_is_served_from_the_cache(server, cache):
+    paths = ["/ok", "/missing", "/no-head"]
+    first, checked = check(server, paths, cache)
+    assert checked == len(paths)
+    hits = dict(StandIn.hits)
+
+    rerun, checked = check(server, paths, links.LinkCache(cache.cache_file))
+    assert checked == 0
+    assert StandIn.hits == hits
+    assert {path: result.status for path, result in rerun.items()} == {
+        path: result.status for path, result in first.items()
+    }
@@ -0,0 +1,66 @@
+"""apply_moves on throwaway schedule files"""
+
+import models
+import moves
+from repository import Session
+from writer import Writer
+
+
+def talk(folder, start: str, track: str, title: str) -> Session:
+    schedule = models.Schedule(
+        category="talks",
+        start_datetime=f"2025-09-08 {start}:00-05:00",
+        end_datetime=f"2025-09-08 {start[:2]}:45:00-05:00",
+        track=track,
+        title=title,
+    )
+    path = folder / schedule.filename
+    path.write_text(
+        "---\n"
+        "category: talks\n"
+        f"end_datetime: {schedule.end_datetime.isoformat(' ')}\n"
+        f"start_datetime: {schedule.start_datetime.isoformat(' ')}\n"
+        f"title: {title}\n"
+        f"track: {track}\n"
+        "---\n"
+        f"About {title}.\n"
+    )
+    return Session(path=path, schedule=schedule)
+
+
+def test_swap_renames_without_adding_null_keys(tmp_path):
+    first = talk(tmp_path, "09:00", "t0", "First")
+    second = talk(tmp_path, "10:00", "t1", "Second")
+    renamed = moves.apply_moves(
+        [
+            moves.Move(first, moves.Slot.of(second)),
+            moves.Move(second, moves.Slot.of(first)),
+        ],
+        Writer(),
+    )
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "2025-09-08-09-00-t0-second.md",
+        "2025-09-08-10-00-t1-first.md",
+    ]
+    moved = renamed[first.path].read_text()
+    assert "start_datetime: 2025-09-08 10:00:00-05:00" in moved
+    assert "track: t1" in moved
+    assert "About First." in moved
+    # neither file had a room, and the slots don't have one either
+    assert "room" not in moved
+    assert "room" not in renamed[second.path].read_text()
+
+
+def test_dry_run_leaves_the_files_alone(tmp_path):
+    first = talk(tmp_path, "09:00", "t0", "First")
+    before = first.path.read_text()
+    slot = moves.Slot.of(first)
+    later = moves.Slot(
+        slot.start_datetime.replace(hour=11),
+        slot.end_datetime.replace(hour=11),
+        room=None,
+        track="t0",
+    )
+    moves.apply_moves([moves.Move(first, later)], Writer(dry_run=True))
+    assert list(tmp_path.iterdir()) == [first.path]
+    assert first.path.read_text() == before
@@ -0,0 +1,121 @@
+"""patch_text and sort_keys on small frontmatter snippets"""
+
+import pytest
+
+import patching
+
+
+def frontmatter(*lines: str) -> str:
+    return "\n".join(["---", *lines, "---", "", "The body."]) + "\n"
+
+
+def test_unchanged_value_leaves_the_text_alone():
+    text = frontmatter("title: 'Hello'  # a comment", "track: t0")
+    assert patching.patch_text(text, {"title": "Hello"}) is text
+
+
+def test_missing_key_goes_in_sorted_position():
+    text = frontmatter("room: A", "# when it starts", "start: 9", "title: Hi")
+    assert patching.patch_text(text, {"speaker": "ada"}) == frontmatter(
+        "room: A", "speaker: ada", "# when it starts", "start: 9", "title: Hi"
+    )
+
+
+def test_missing_key_goes_at_the_end_of_unsorted_keys():
+    text = frontmatter("title: Hi", "room: A")
+    assert patching.patch_text(text, {"video_url": "https://youtu.be/x"}) == (
+        frontmatter("title: Hi", "room: A", "video_url: https://youtu.be/x")
+    )
+
+
+def test_no_frontmatter_gets_some():
+    assert patching.patch_text("The body.\n", {"title": "Hi"}) == (
+        "---\ntitle: Hi\n---\nThe body.\n"
+    )
+
+
+def test_nested_social_block_keeps_its_indent_and_neighbours():
+    text = frontmatter(
+        "name: Ada",
+        "social:",
+        "    github: ada",
+        "    twitter: ada",
+        "",
+        "title: Countess",
+    )
+    patched = patching.patch_text(
+        text, {"social": {"github": "ada", "mastodon": "https://hachyderm.io/@ada"}}
+    )
+    assert patched == frontmatter(
+        "name: Ada",
+        "social:",
+        "    github: ada",
+        "    mastodon: https://hachyderm.io/@ada",
+        "",
+        "title: Countess",
+    )
+
+
+def test_multi_line_values_are_kept_when_other_keys_change():
+    text = frontmatter(
+        "abstract: |",
+        "  First line.",
+        "",
+        "  Second paragraph: with a colon.",
+        "tags:",
+        "- orm",
+        "- async",
+        "title: \"Quoted: title\"",
+    )
+    patched = patching.patch_text(text, {"title": "New: title"})
+    assert patched == text.replace("title: \"Quoted: title\"", "title: 'New: title'")
+
+
+def test_multi_line_value_is_replaced_whole():
+    text = frontmatter("abstract: >", "  Folded", "  text.", "tags:", "- orm", "title: Hi")
+    patched = patching.patch_text(text, {"abstract": "One line.", "tags": ["htmx"]})
+    assert patched == frontmatter("abstract: One line.", "tags:", "- htmx", "title: Hi")
+
+
+def test_inline_comment_survives_a_new_value():
+    text = frontmatter("room: A  # the big one", "title: Hi")
+    assert patching.patch_text(text, {"room": "B"}) == frontmatter(
+        "room: B  # the big one", "title: Hi"
+    )
+
+
+def test_crlf_line_endings_are_kept():
+    text = frontmatter("room: A", "title: Hi").replace("\n", "\r\n")
+    assert patching.patch_text(text, {"room": "B"}) == text.replace("room: A", "room: B")
+
+
+def test_delete_removes_the_whole_block():
+    text = frontmatter("github: ada", "name: Ada", "social:", "  twitter: ada", "title: Hi")
+    patched = patching.patch_text(
+        text, {"github": patching.DELETE, "social": patching.DELETE}
+    )
+    assert patched == frontmatter("name: Ada", "title: Hi")
+
+
+def test_delete_of_a_missing_key_changes_nothing():
+    text = frontmatter("title: Hi")
+    assert patching.patch_text(text, {"video_url": patching.DELETE}) is text
+
+
+def test_key_split_across_a_flow_mapping_fails_the_round_trip():
+    text = frontmatter("social: {github: ada,", "twitter: ada}", "title: Hi")
+    with pytest.raises(patching.PatchError, match="twitter"):
+        patching.patch_text(text, {"social": {"github": "grace"}})
+
+
+def test_broken_alias_fails_the_round_trip():
+    text = frontmatter("room: &main A", "overflow: *main")
+    with pytest.raises(patching.PatchError, match="doesn't parse"):
+        patching.patch_text(text, {"room": "B"})
+
+
+def test_sort_keys_moves_comments_with_their_keys():
+    text = frontmatter("title: Hi", "# the main room", "room: A", "")
+    assert patching.sort_keys(text) == frontmatter(
+        "# the main room", "room: A", "title: Hi", ""
+    )
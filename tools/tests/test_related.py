@@ -0,0 +1,52 @@
+"""The sparse TF-IDF matrix against a dense recomputation"""
+
+from collections import Counter
+import random
+
+import numpy as np
+
+import related
+
+
+def dense(matrix: related.SparseMatrix) -> np.ndarray:
+    rows = np.zeros((matrix.rows, matrix.columns), dtype=np.float32)
+    for row in range(matrix.rows):
+        entries = slice(matrix.indptr[row], matrix.indptr[row + 1])
+        rows[row, matrix.indices[entries]] = matrix.data[entries]
+    return rows
+
+
+def documents(count: int, seed: int = 7) -> list[Counter]:
+    generator = random.Random(seed)
+    words = [f"word{number}" for number in range(40)]
+    return [
+        Counter(generator.choices(words, k=generator.randint(0, 12)))
+        for _ in range(count)
+    ]
+
+
+def test_rows_are_unit_length_or_empty():
+    lengths = np.linalg.norm(dense(related.tfidf_matrix(documents(30))), axis=1)
+    # words in a single document count towards the length but have no column
+    assert np.all(lengths <= 1 + 1e-6)
+
+
+def test_similarities_match_a_dense_product(monkeypatch):
+    monkeypatch.setattr(related, "BLOCK_ROWS", 7)
+    matrix = related.tfidf_matrix(documents(30))
+    full = dense(matrix) @ dense(matrix).T
+    by_column = matrix.transposed()
+    for start in range(0, matrix.rows, related.BLOCK_ROWS):
+        stop = min(start + related.BLOCK_ROWS, matrix.rows)
+        block = related.similarities(matrix, by_column, start, stop)
+        np.testing.assert_allclose(block, full[start:stop], atol=1e-6)
+
+    for row, found in enumerate(related.nearest(matrix, 3)):
+        scores = full[row].copy()
+        scores[row] = -1
+        best = sorted(scores[scores >= related.MIN_SIMILARITY], reverse=True)[:3]
+        np.testing.assert_allclose([score for _, score in found], best, atol=1e-6)
+
+
+def test_no_documents_no_neighbours():
+    assert related.nearest(related.tfidf_matrix([Counter(), Counter()]), 3) == [[], []]
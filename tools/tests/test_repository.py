@@ -0,0 +1,40 @@
+"""ContentRepository on a throwaway content folder"""
+
+import datetime
+
+import conflicts
+from repository import ContentRepository
+
+
+def write_talk(folder, name: str, start: str | None) -> None:
+    times = (
+        f"start_datetime: 2025-09-08 {start}:00-05:00\n"
+        f"end_datetime: 2025-09-08 {start[:2]}:45:00-05:00\n"
+        if start
+        else "start_datetime: null\n"
+    )
+    (folder / f"{name}.md").write_text(
+        f"---\ncategory: talks\n{times}room: Room A\ntitle: {name}\ntrack: t0\n---\n"
+    )
+
+
+def test_sessions_without_a_time_sort_last(tmp_path):
+    talks = tmp_path / "schedule" / "talks"
+    talks.mkdir(parents=True)
+    write_talk(talks, "unscheduled", None)
+    write_talk(talks, "later", "11:00")
+    write_talk(talks, "earlier", "09:00")
+    repository = ContentRepository(tmp_path, jobs=1)
+
+    assert [session.path.stem for session in repository.sessions] == [
+        "earlier",
+        "later",
+        "unscheduled",
+    ]
+    unscheduled = repository.sessions[-1]
+    assert unscheduled.day is None
+    assert not unscheduled.is_scheduled
+    day = datetime.date(2025, 9, 8)
+    assert list(repository.sessions_by_day) == [day]
+    assert len(repository.sessions_on(day, "Room A")) == 2
+    assert conflicts.find_conflicts(repository.sessions) == []
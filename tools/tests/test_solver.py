@@ -0,0 +1,105 @@
+"""The annealer's incremental cost against a full recount"""
+
+import datetime
+import random
+
+import pytest
+
+import constants
+import solver
+from moves import Slot
+
+
+ROOMS = ["Room A", "Room B", "Room C"]
+SHORT = datetime.timedelta(minutes=30)
+LONG = datetime.timedelta(minutes=45)
+
+
+def synthetic_problem(seed: int) -> solver.Problem:
+    """Talks of two lengths in staggered slots, so slots partly overlap"""
+    rng = random.Random(seed)
+    morning = datetime.datetime(2025, 9, 8, 9, tzinfo=constants.CONFERENCE_TZ)
+    slots = []
+    for row in range(4):
+        for column, room in enumerate(ROOMS):
+            length = LONG if (row + column) % 2 else SHORT
+            start = morning + row * LONG + column * datetime.timedelta(minutes=10)
+            slots.append(Slot(start, start + length, room, f"t{column}"))
+    by_duration: dict[datetime.timedelta, list[int]] = {SHORT: [], LONG: []}
+    for number, slot in enumerate(slots):
+        by_duration[slot.duration].append(number)
+
+    # fewer talks than slots, so some steps move into an empty slot
+    free = {duration: list(numbers) for duration, numbers in by_duration.items()}
+    current, allowed = [], []
+    for _ in range(9):
+        duration = rng.choice([SHORT, LONG])
+        allowed.append(by_duration[duration])
+        current.append(free[duration].pop(rng.randrange(len(free[duration]))))
+    # a talk whose slot isn't one of the slots
+    current[-1] = -1
+
+    names = ["ada", "grace", "alan", "barbara", "edsger"]
+    presenters = [frozenset(rng.sample(names, rng.randint(1, 2))) for _ in current]
+    tags = [
+        frozenset(rng.sample(["orm", "async", "testing", "htmx"], rng.randint(0, 2)))
+        for _ in current
+    ]
+    busy_start = morning + LONG
+    return solver.Problem(
+        talks=[None] * len(current),
+        slots=slots,
+        current=current,
+        allowed=allowed,
+        parallel=[
+            [
+                other
+                for other, candidate in enumerate(slots)
+                if other != number
+                and solver.overlaps(solver.window(slot), solver.window(candidate))
+            ]
+            for number, slot in enumerate(slots)
+        ],
+        presenters=presenters,
+        tags=tags,
+        rooms=[rng.choice(ROOMS + [None]) for _ in current],
+        busy={"ada": [(busy_start, busy_start + LONG)]},
+        pairs=solver.pair_costs(presenters, tags),
+    )
+
+
+def full_cost(problem: solver.Problem, assignment: list[int]) -> int:
+    found = solver.score(problem, assignment)
+    return (
+        found["presenter conflicts"] * solver.PRESENTER_CONFLICT_COST
+        + found["shared tags"] * solver.TAG_OVERLAP_COST
+        + found["room misses"] * solver.ROOM_PREFERENCE_COST
+        + found["moved"] * solver.MOVE_COST
+    )
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_delta_matches_a_full_recount(seed):
+    problem = synthetic_problem(seed)
+    search = solver.Search(problem)
+    assert search.cost == full_cost(problem, search.assignment)
+
+    rng = random.Random(seed)
+    for _ in range(500):
+        talk = rng.randrange(len(problem.talks))
+        target = rng.choice(problem.allowed[talk])
+        if target == search.assignment[talk]:
+            continue
+        before = full_cost(problem, search.assignment)
+        change = search.delta(talk, target)
+        search.apply(talk, target, change)
+        assert change == full_cost(problem, search.assignment) - before
+        assert search.cost == full_cost(problem, search.assignment)
+
+
+def test_solve_never_does_worse_than_the_start():
+    problem = synthetic_problem(0)
+    start = solver.Search(problem).cost
+    assignment, cost = solver.solve(problem, iterations=2_000)
+    assert cost <= start
+    assert cost == full_cost(problem, assignment)
@@ -0,0 +1,36 @@
+"""Writer's dry-run diffs"""
+
+from writer import Writer
+
+
+def test_dry_run_diff_marks_a_missing_final_newline(tmp_path, capsys):
+    path = tmp_path / "swap.md"
+    path.write_text("title: Old")
+    writer = Writer(dry_run=True)
+    assert writer.write_text(path, "title: New\n")
+    print("next line")
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[-4:] == [
+        "-title: Old",
+        "\\ No newline at end of file",
+        "+title: New",
+        "next line",
+    ]
+    assert path.read_text() == "title: Old"
+    assert writer.summary() == "0 would be created, 1 would be updated, 0 unchanged"
+
+
+def test_dry_run_diff_of_a_new_file_without_a_final_newline(tmp_path, capsys):
+    Writer(dry_run=True).write_text(tmp_path / "new.md", "one\ntwo")
+    print("next line")
+    out = capsys.readouterr().out
+    assert out.endswith("+one\n+two\n\\ No newline at end of file\nnext line\n")
+    assert not (tmp_path / "new.md").exists()
+
+
+def test_skipped_files_count_as_unchanged_once(tmp_path):
+    writer = Writer()
+    writer.write_text(tmp_path / "a.md", "a\n")
+    writer.skip(tmp_path / "b.md")
+    writer.skip(tmp_path / "b.md")
+    assert writer.summary() == "1 created, 0 updated, 1 unchanged"
@@ -0,0 +1,73 @@
+"""fetch_videos with stand-in fetchers instead of YouTube"""
+
+import json
+
+import pytest
+import typer
+
+import yt_playlist
+
+
+PLAYLIST = "https://www.youtube.com/playlist?list=test"
+VIDEOS = {
+    "https://www.youtube.com/watch?v=one": "Django Things with Ada Lovelace",
+    "https://www.youtube.com/watch?v=two": "More Things with Grace Hopper and Alan Turing",
+}
+
+
+class CountingFetcher:
+    def __init__(self):
+        self.calls: list[str] = []
+
+    def playlist_urls(self, playlist_url: str) -> list[str]:
+        self.calls.append(playlist_url)
+        return list(VIDEOS)
+
+    def video_title(self, url: str) -> str:
+        self.calls.append(url)
+        return VIDEOS[url]
+
+
+def test_rerun_is_served_from_the_cache(tmp_path):
+    cache_file = tmp_path / "youtube.json"
+    fetcher = CountingFetcher()
+    first = yt_playlist.fetch_videos(
+        PLAYLIST, fetcher, yt_playlist.VideoCache(cache_file)
+    )
+    assert first == list(VIDEOS.items())
+    assert len(fetcher.calls) == 3
+
+    fetcher.calls.clear()
+    again = yt_playlist.fetch_videos(
+        PLAYLIST, fetcher, yt_playlist.VideoCache(cache_file), offline=True
+    )
+    assert again == first
+    assert fetcher.calls == []
+
+
+def test_offline_without_a_cache_fails():
+    with pytest.raises(typer.BadParameter):
+        yt_playlist.fetch_videos(
+            PLAYLIST, CountingFetcher(), yt_playlist.VideoCache(None), offline=True
+        )
+
+
+def test_fixture_with_an_in_memory_cache(tmp_path):
+    fixture = tmp_path / "fixture.json"
+    fixture.write_text(
+        json.dumps({"playlists": {PLAYLIST: list(VIDEOS)}, "titles": VIDEOS})
+    )
+    cache = yt_playlist.VideoCache(None)
+    videos = yt_playlist.fetch_videos(
+        PLAYLIST, yt_playlist.FixtureFetcher(fixture), cache
+    )
+    assert videos == list(VIDEOS.items())
+    assert cache.data["titles"] == VIDEOS
+    assert list(tmp_path.iterdir()) == [fixture]
+
+
+def test_parse_video_title():
+    parsed = yt_playlist.parse_video_title(*list(VIDEOS.items())[1])
+    assert parsed.title == "More Things"
+    assert (parsed.presenter1, parsed.presenter2) == ("Grace Hopper", "Alan Turing")
+    assert parsed.short_url == "https://youtu.be/two"
@@ -0,0 +1,157 @@
+"""Per-stage timings and profiling for the tools CLIs
+
+Loading, parsing, validation and writing are wrapped in ``span("stage")``.
+Spans cost next to nothing until ``--timings`` turns recording on, and then
+every command ends with a table of wall and CPU time per stage::
+
+    python tools/process.py --timings validate-schedule
+    python tools/process.py --timings-file timings.jsonl compile-schedule
+    python tools/swap_talks.py --profile batch plan.yaml
+
+``--profile`` runs the command under cProfile, prints the slowest functions
+and saves the full stats for ``python -m pstats``.
+"""
+
+from collections import defaultdict
+import dataclasses
+import json
+import os
+from pathlib import Path
+import sys
+import time
+
+import typer
+
+import constants
+
+
+PROFILE_FILE = constants.REPO_ROOT / ".cache" / "tools" / "profile.pstats"
+
+TIMINGS_OPTION = typer.Option(False, "--timings", help="Print wall/CPU time per stage")
+TIMINGS_FILE_OPTION = typer.Option(
+    None, "--timings-file", help="Also append every span to this file as JSON lines"
+)
+PROFILE_OPTION = typer.Option(False, "--profile", help="Run under cProfile")
+PROFILE_TOP_OPTION = typer.Option(
+    25, "--profile-top", help="How many functions --profile prints"
+)
+
+
+@dataclasses.dataclass
+class Span:
+    stage: str
+    start: float
+    wall: float
+    cpu: float
+
+
+_enabled = False
+_origin = time.perf_counter()
+spans: list[Span] = []
+
+
+class span:
+    """Record the wall and CPU time of a ``with`` block as ``stage``"""
+
+    __slots__ = ("stage", "wall", "cpu")
+
+    def __init__(self, stage: str):
+        self.stage = stage
+
+    def __enter__(self) -> "span":
+        if _enabled:
+            self.wall = time.perf_counter()
+            self.cpu = time.process_time()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        if _enabled:
+            spans.append(
+                Span(
+                    stage=self.stage,
+                    start=self.wall - _origin,
+                    wall=time.perf_counter() - self.wall,
+                    cpu=time.process_time() - self.cpu,
+                )
+            )
+
+
+def startup_span() -> Span:
+    """Time from interpreter start to now: mostly imports"""
+    cpu = time.process_time()
+    wall = cpu
+    try:
+        # field 22 of /proc/self/stat is the start time in clock ticks since boot
+        ticks = int(Path("/proc/self/stat").read_text().rsplit(")", 1)[1].split()[19])
+        uptime = float(Path("/proc/uptime").read_text().split()[0])
+        wall = uptime - ticks / os.sysconf("SC_CLK_TCK")
+    except (OSError, ValueError, IndexError):
+        pass  # not Linux: CPU time is the next best thing
+    return Span(stage="startup", start=0.0, wall=wall, cpu=cpu)
+
+
+def report(recorded: list[Span]) -> str:
+    totals: dict[str, list[float]] = defaultdict(lambda: [0, 0.0, 0.0])
+    for recorded_span in recorded:
+        total = totals[recorded_span.stage]
+        total[0] += 1
+        total[1] += recorded_span.wall
+        total[2] += recorded_span.cpu
+    width = max(len(stage) for stage in totals)
+    lines = [f"{'stage':<{width}}  {'count':>6}  {'wall ms':>9}  {'cpu ms':>9}"]
+    for stage, (count, wall, cpu) in totals.items():
+        lines.append(
+            f"{stage:<{width}}  {count:>6}  {wall * 1000:>9.1f}  {cpu * 1000:>9.1f}"
+        )
+    return "\n".join(lines)
+
+
+def start(
+    ctx: typer.Context,
+    timings: bool = False,
+    timings_file: Path | None = None,
+    profile: bool = False,
+    profile_top: int = 25,
+) -> None:
+    """Turn on the requested instrumentation until the command finishes"""
+    global _enabled
+    if timings or timings_file:
+        _enabled = True
+        spans.clear()
+        spans.append(startup_span())
+        command = span("command")
+        command.__enter__()
+
+        def finish_timings() -> None:
+            command.__exit__(None, None, None)
+            print(report(spans), file=sys.stderr)
+            if timings_file:
+                with timings_file.open("a") as timings_file_obj:
+                    for recorded_span in spans:
+                        record = {
+                            "command": " ".join(sys.argv[1:]),
+                            "stage": recorded_span.stage,
+                            "start_ms": round(recorded_span.start * 1000, 3),
+                            "wall_ms": round(recorded_span.wall * 1000, 3),
+                            "cpu_ms": round(recorded_span.cpu * 1000, 3),
+                        }
+                        timings_file_obj.write(json.dumps(record) + "\n")
+
+        ctx.call_on_close(finish_timings)
+
+    if profile:
+        import cProfile
+        import pstats
+
+        profiler = cProfile.Profile()
+        profiler.enable()
+
+        def finish_profile() -> None:
+            profiler.disable()
+            PROFILE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            profiler.dump_stats(PROFILE_FILE)
+            stats = pstats.Stats(profiler, stream=sys.stderr)
+            stats.sort_stats("cumulative").print_stats(profile_top)
+            print(f"Full profile: python -m pstats {PROFILE_FILE}", file=sys.stderr)
+
+        ctx.call_on_close(finish_profile)
@@ -0,0 +1,194 @@
+"""Validate every content file against its pydantic model in one pass
+
+Each content type is validated as a single list with a ``TypeAdapter``, so
+pydantic-core does the whole batch in one call, and the content types run side
+by side on a thread pool. Files whose model is already in the content cache
+were valid last time and haven't changed since, so they are skipped.
+"""
+
+import dataclasses
+import functools
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from pydantic import BaseModel, ValidationError
+
+import constants
+import content
+import models
+from repository import CONTENT_PATH, ORGANIZER_PATH, PRESENTER_PATH, SCHEDULE_PATH
+import timings
+
+if TYPE_CHECKING:
+    from pydantic import TypeAdapter
+
+
+SRC_PATH = constants.REPO_ROOT / "src"
+# folders under src/ that hold templates and assets rather than pages
+NON_PAGE_FOLDERS = {"_content", "_data", "_includes", "_layouts", "assets"}
+
+
+@dataclasses.dataclass(frozen=True)
+class ContentType:
+    name: str
+    model: type[BaseModel]
+    paths: tuple[Path, ...]
+
+
+@dataclasses.dataclass
+class ContentError:
+    path: Path
+    line: int
+    model: str
+    field: str
+    message: str
+
+    def __str__(self) -> str:
+        location = self.path.relative_to(constants.REPO_ROOT)
+        subject = ".".join(part for part in (self.model, self.field) if part)
+        if subject:
+            return f"{location}:{self.line}: {subject}: {self.message}"
+        return f"{location}:{self.line}: {self.message}"
+
+
+def page_paths() -> list[Path]:
+    return [
+        path
+        for pattern in ("*.md", "*.html")
+        for path in SRC_PATH.rglob(pattern)
+        if path.relative_to(SRC_PATH).parts[0] not in NON_PAGE_FOLDERS
+    ]
+
+
+def content_types() -> list[ContentType]:
+    def glob(path: Path) -> tuple[Path, ...]:
+        return tuple(path.glob("*.md")) if path.is_dir() else ()
+
+    return [
+        ContentType("presenters", models.Presenter, glob(PRESENTER_PATH)),
+        ContentType("organizers", models.Organizer, glob(ORGANIZER_PATH)),
+        ContentType("posts", models.Post, glob(CONTENT_PATH / "posts")),
+        ContentType("pages", models.Page, tuple(page_paths())),
+        ContentType(
+            "schedule",
+            models.Schedule,
+            tuple(
+                path
+                for folder in ("talks", "tutorials", "sprints")
+                for path in glob(SCHEDULE_PATH / folder)
+            ),
+        ),
+    ]
+
+
+@functools.cache
+def list_adapter(model: type[BaseModel]) -> "TypeAdapter":
+    from pydantic import TypeAdapter
+
+    return TypeAdapter(list[model])
+
+
+def field_line(path: Path, loc: tuple) -> int:
+    """The line of the (possibly nested) frontmatter key at ``loc``, or 1"""
+    lines = path.read_text(encoding="utf-8").splitlines()
+    line = 0
+    for key in (part for part in loc if isinstance(part, str)):
+        for number in range(line, len(lines)):
+            if lines[number].strip().startswith(f"{key}:"):
+                line = number
+                break
+        else:
+            break
+    return line + 1
+
+
+def load_entries(
+    paths: list[Path], errors: list[ContentError]
+) -> dict[Path, content.CacheEntry]:
+    """Cache entries for ``paths``, recording files whose frontmatter won't parse"""
+    try:
+        return content.load_entries(paths)
+    except Exception:
+        pass
+    # one of them is broken: go file by file to find out which
+    cache = content.get_cache()
+    entries = {}
+    for path in sorted(paths):
+        try:
+            entries[path] = cache.entry(path)
+        except Exception as error:
+            mark = getattr(error, "problem_mark", None)
+            errors.append(
+                ContentError(
+                    path=path,
+                    line=mark.line + 2 if mark else 1,  # + the opening ---
+                    model="",
+                    field="",
+                    message=getattr(error, "problem", None)
+                    or str(error).splitlines()[0],
+                )
+            )
+    cache.save()
+    return entries
+
+
+def validate_batch(
+    model: type[BaseModel], entries: dict[Path, content.CacheEntry]
+) -> list[ContentError]:
+    """Validate ``entries`` as one list, caching the models of a clean batch"""
+    pending = {
+        path: entry
+        for path, entry in entries.items()
+        if model.__name__ not in entry.models
+    }
+    if not pending:
+        return []
+    paths = list(pending)
+    try:
+        with timings.span(f"validate.{model.__name__}"):
+            instances = list_adapter(model).validate_python(
+                [dict(entry.metadata) for entry in pending.values()]
+            )
+    except ValidationError as error:
+        errors = []
+        for detail in error.errors():
+            index, *loc = detail["loc"]
+            errors.append(
+                ContentError(
+                    path=paths[index],
+                    line=field_line(paths[index], tuple(loc)),
+                    model=model.__name__,
+                    field=".".join(str(part) for part in loc),
+                    message=detail["msg"],
+                )
+            )
+        return errors
+    for entry, instance in zip(pending.values(), instances):
+        entry.models[model.__name__] = instance
+    content.get_cache().dirty = True
+    return []
+
+
+def validate_content(jobs: int | None = None) -> tuple[int, list[ContentError]]:
+    """Validate every content type; returns (files checked, errors by path/line)"""
+    from concurrent.futures import ThreadPoolExecutor
+
+    types = content_types()
+    errors: list[ContentError] = []
+    # parse (or fetch from the cache) everything at once, then validate per type
+    entries = load_entries(
+        [path for content_type in types for path in content_type.paths], errors
+    )
+    batches = [
+        (
+            content_type.model,
+            {path: entries[path] for path in content_type.paths if path in entries},
+        )
+        for content_type in types
+    ]
+    with ThreadPoolExecutor(max_workers=jobs or len(types)) as pool:
+        for found in pool.map(lambda batch: validate_batch(*batch), batches):
+            errors.extend(found)
+    content.get_cache().save()
+    errors.sort(key=lambda error: (error.path, error.line))
+    return len(entries), errors
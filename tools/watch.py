@@ -0,0 +1,135 @@
+"""Wait for files to change, with inotify on Linux and polling everywhere else
+
+inotify is called through ctypes so there's nothing extra to install. Whole
+directories are watched rather than single files, because most editors save
+by writing a new file and renaming it over the old one.
+"""
+
+import ctypes
+import ctypes.util
+import os
+from pathlib import Path
+import select
+import struct
+import sys
+import time
+from typing import Callable, Iterable
+
+
+IN_CLOSE_WRITE = 0x008
+IN_MOVED_FROM = 0x040
+IN_MOVED_TO = 0x080
+IN_CREATE = 0x100
+IN_DELETE = 0x200
+IN_CLOEXEC = 0o2000000
+IN_NONBLOCK = 0o4000
+EVENT_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+# struct inotify_event: int wd; uint32_t mask, cookie, len; char name[len]
+EVENT_HEADER = struct.Struct("iIII")
+# a save is often several events (write, rename...); wait this long for the rest
+DEBOUNCE_SECONDS = 0.02
+POLL_SECONDS = 0.5
+
+
+class InotifyWatcher:
+    def __init__(self, directories: Iterable[Path]):
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self.fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.directories: dict[int, Path] = {}
+        for directory in directories:
+            wd = libc.inotify_add_watch(self.fd, os.fsencode(directory), EVENT_MASK)
+            if wd < 0:
+                errno = ctypes.get_errno()
+                self.close()
+                raise OSError(errno, f"can't watch {directory}")
+            self.directories[wd] = directory
+
+    def _read(self) -> set[Path]:
+        changed = set()
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return changed
+        offset = 0
+        while offset < len(data):
+            wd, _, _, length = EVENT_HEADER.unpack_from(data, offset)
+            offset += EVENT_HEADER.size
+            name = data[offset : offset + length].rstrip(b"\0")
+            offset += length
+            if name and wd in self.directories:
+                changed.add(self.directories[wd] / os.fsdecode(name))
+        return changed
+
+    def changes(self, timeout: float) -> set[Path]:
+        """Paths changed within ``timeout`` seconds (empty if nothing did)"""
+        changed: set[Path] = set()
+        wait = timeout
+        while select.select([self.fd], [], [], wait)[0]:
+            changed |= self._read()
+            wait = DEBOUNCE_SECONDS
+        return changed
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+class PollingWatcher:
+    def __init__(self, directories: Iterable[Path]):
+        self.directories = list(directories)
+        self.snapshot = self._scan()
+
+    def _scan(self) -> dict[Path, tuple[int, int]]:
+        snapshot = {}
+        for directory in self.directories:
+            for entry in os.scandir(directory):
+                if entry.is_file():
+                    stat = entry.stat()
+                    snapshot[Path(entry.path)] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def changes(self, timeout: float) -> set[Path]:
+        time.sleep(min(timeout, POLL_SECONDS))
+        current = self._scan()
+        changed = {
+            path
+            for path in current.keys() | self.snapshot.keys()
+            if current.get(path) != self.snapshot.get(path)
+        }
+        self.snapshot = current
+        return changed
+
+    def close(self) -> None:
+        pass
+
+
+def create_watcher(
+    directories: Iterable[Path], polling: bool = False
+) -> InotifyWatcher | PollingWatcher:
+    directories = [directory for directory in directories if directory.is_dir()]
+    if not polling and sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(directories)
+        except (OSError, AttributeError):
+            # no libc inotify, or out of watches: fall back to polling
+            pass
+    return PollingWatcher(directories)
+
+
+def watch(
+    directories: Iterable[Path],
+    callback: Callable[[set[Path]], None],
+    polling: bool = False,
+) -> None:
+    """Call ``callback`` with every batch of changed files, until interrupted"""
+    watcher = create_watcher(directories, polling=polling)
+    print(f"👀 Watching with {type(watcher).__name__} (Ctrl+C to stop)")
+    try:
+        while True:
+            if changed := watcher.changes(timeout=1.0):
+                callback(changed)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.close()
@@ -0,0 +1,93 @@
+"""Write generated files only when their contents actually change
+
+Rewriting identical files bumps their mtimes, which makes
+``eleventy --watch --incremental`` rebuild pages for nothing.
+"""
+
+import difflib
+from pathlib import Path
+
+import constants
+import timings
+
+
+# what diff and git print after a last line that has no newline
+NO_NEWLINE = "\n\\ No newline at end of file\n"
+
+
+def display_path(path: Path) -> str:
+    path = Path(path)
+    if path.is_absolute() and path.is_relative_to(constants.REPO_ROOT):
+        return path.relative_to(constants.REPO_ROOT).as_posix()
+    return str(path)
+
+
+class Writer:
+    def __init__(self, dry_run: bool = False):
+        self.dry_run = dry_run
+        self.created: list[Path] = []
+        self.updated: list[Path] = []
+        self.unchanged: list[Path] = []
+        self._seen: set[Path] = set()
+
+    def write_text(self, path: Path, text: str) -> bool:
+        """Write ``text`` to ``path`` unless it's already there; True if it changed"""
+        with timings.span("write"):
+            return self._write_text(path, text)
+
+    def _write_text(self, path: Path, text: str) -> bool:
+        current = path.read_text() if path.exists() else None
+        if current == text:
+            self._record(path, self.unchanged)
+            return False
+        if self.dry_run:
+            diff = difflib.unified_diff(
+                (current or "").splitlines(keepends=True),
+                text.splitlines(keepends=True),
+                fromfile=f"a/{display_path(path)}" if current is not None else "/dev/null",
+                tofile=f"b/{display_path(path)}",
+            )
+            for line in diff:
+                print(line, end="" if line.endswith("\n") else NO_NEWLINE)
+        else:
+            path.write_text(text)
+        self._record(path, self.updated if current is not None else self.created)
+        return True
+
+    def write_bytes(self, path: Path, data: bytes) -> bool:
+        """Binary version of ``write_text``; dry runs just name the file"""
+        with timings.span("write"):
+            return self._write_bytes(path, data)
+
+    def _write_bytes(self, path: Path, data: bytes) -> bool:
+        exists = path.exists()
+        if exists and path.stat().st_size == len(data) and path.read_bytes() == data:
+            self._record(path, self.unchanged)
+            return False
+        if self.dry_run:
+            print(f"Binary file {display_path(path)} {'differs' if exists else 'is new'}")
+        else:
+            path.write_bytes(data)
+        self._record(path, self.updated if exists else self.created)
+        return True
+
+    def skip(self, path: Path) -> None:
+        """Count ``path`` as unchanged when the caller already knows it is"""
+        self._record(path, self.unchanged)
+
+    def _record(self, path: Path, outcome: list[Path]) -> None:
+        # generators may write the same file more than once; count it once
+        if path not in self._seen:
+            self._seen.add(path)
+            outcome.append(path)
+
+    @property
+    def changed(self) -> list[Path]:
+        return self.created + self.updated
+
+    def summary(self) -> str:
+        verb = "would be " if self.dry_run else ""
+        return (
+            f"{len(self.created)} {verb}created, {len(self.updated)} {verb}updated, "
+            f"{len(self.unchanged)} unchanged"
+        )
@@ -1,31 +1,144 @@
 # /// script
 # requires-python = ">=3.12"
 # dependencies = [
+#     "pydantic",
+#     "python-frontmatter",
+#     "python-slugify",
 #     "pytube",
+#     "typer",
 # ]
 # ///
 
 # To run: uv run tools/yt_playlist.py
 #
-# 1. Swap PLAYLIST_ID with the playlist ID of the playlist you want to parse.
+# 1. Swap PLAYLIST_ID with the playlist ID of the playlist you want to parse
+#    (or pass --playlist-id).
 # 2. Make sure you're using git so reverting edited talk files is easy.
-# 3. Run the script.
-# 4. Go through the missing-talks.csv file and manually add the
+# 3. Run the script. Video titles are fetched a few at a time (--jobs) and
+#    cached in .cache/tools/youtube.json, so reruns only fetch new videos.
+#    --offline uses the cache only, --refresh ignores it, and --fixture reads
+#    the playlist from a JSON file instead of YouTube (and leaves the cache
+#    alone).
+# 4. Videos are matched to talks by title and presenter names. Confident
+#    matches get their video_url added automatically; the rest, and any
+#    second video matching a talk patched earlier in the run, are written
+#    to missing-talks.csv with the best-ranked talk files as suggestions.
+# 5. Go through the missing-talks.csv file and manually add the
 #    youtube_url to the markdown files.InnerTube.__init__(client='WEB')
 #    then disable the oauth usage.
 
 # At one point things didn't work and I had to modify
 # the pytube/innertube.py::
 
+from concurrent.futures import ThreadPoolExecutor
 import csv
 from dataclasses import dataclass
+import json
 from pathlib import Path
-from pytube import Playlist, YouTube
+from typing import Protocol
+
+import typer
+
+import matching
+import patching
+from repository import ContentRepository
+import timings
+from writer import Writer
 
 PLAYLIST_ID = "PL2NFhrDSOxgWqE_5w5CX2iUR7-P1D0ny7"
-# Replace with your playlist URL
-playlist_url = f"https://www.youtube.com/playlist?list={PLAYLIST_ID}"
-talks_directory = Path("src/_content/schedule/talks")
+PLAYLIST_URL_TEMPLATE = "https://www.youtube.com/playlist?list={playlist_id}"
+CACHE_FILE = Path(__file__).parent.parent / ".cache" / "tools" / "youtube.json"
+
+
+class VideoFetcher(Protocol):
+    """Where playlist and video metadata comes from"""
+
+    def playlist_urls(self, playlist_url: str) -> list[str]: ...
+
+    def video_title(self, url: str) -> str: ...
+
+
+class PytubeFetcher:
+    def playlist_urls(self, playlist_url: str) -> list[str]:
+        from pytube import Playlist
+
+        return list(Playlist(playlist_url).video_urls)
+
+    def video_title(self, url: str) -> str:
+        from pytube import YouTube
+
+        return YouTube(url, use_oauth=True, allow_oauth_cache=True).title
+
+
+class FixtureFetcher:
+    """Serve a playlist from a JSON file instead of YouTube
+
+    The file looks like ``{"playlists": {url: [video urls]}, "titles": {url: title}}``.
+    """
+
+    def __init__(self, fixture_file: Path):
+        self.data = json.loads(fixture_file.read_text())
+
+    def playlist_urls(self, playlist_url: str) -> list[str]:
+        return self.data["playlists"][playlist_url]
+
+    def video_title(self, url: str) -> str:
+        return self.data["titles"][url]
+
+
+class VideoCache:
+    """Playlist contents and video titles from earlier runs, stored as JSON
+
+    Without a ``cache_file`` it starts empty and lives only in memory.
+    """
+
+    def __init__(self, cache_file: Path | None = CACHE_FILE):
+        self.cache_file = cache_file
+        self.data = {"playlists": {}, "titles": {}}
+        if cache_file is not None and cache_file.exists():
+            self.data.update(json.loads(cache_file.read_text()))
+
+    def save(self) -> None:
+        if self.cache_file is None:
+            return
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        self.cache_file.write_text(json.dumps(self.data, indent=2, sort_keys=True))
+
+
+def fetch_videos(
+    playlist_url: str,
+    fetcher: VideoFetcher,
+    cache: VideoCache,
+    jobs: int = 8,
+    offline: bool = False,
+    refresh: bool = False,
+) -> list[tuple[str, str]]:
+    """Return (url, title) for every video in the playlist, in playlist order
+
+    Anything in the cache is used as-is unless ``refresh`` is set; the rest is
+    fetched ``jobs`` videos at a time. ``offline`` never touches the fetcher.
+    """
+    playlists = cache.data["playlists"]
+    titles = cache.data["titles"]
+    if refresh and not offline:
+        playlists.pop(playlist_url, None)
+    if playlist_url not in playlists:
+        if offline:
+            raise typer.BadParameter(f"{playlist_url} isn't cached yet")
+        playlists[playlist_url] = fetcher.playlist_urls(playlist_url)
+    urls = playlists[playlist_url]
+
+    missing = [url for url in urls if refresh or url not in titles]
+    if missing and offline:
+        raise typer.BadParameter(f"{len(missing)} video titles aren't cached yet")
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+            for url, title in zip(missing, pool.map(fetcher.video_title, missing)):
+                titles[url] = title
+    finally:
+        # keep whatever was fetched, even if one of the videos failed
+        cache.save()
+    return [(url, titles[url]) for url in urls]
 
 
 @dataclass
@@ -33,67 +146,112 @@ class ParsedVideo:
     title: str
     presenter1: str
     presenter2: str
-    talk_prefix: str
     url: str
 
+    @property
+    def short_url(self) -> str:
+        return self.url.replace("https://www.youtube.com/watch?v=", "https://youtu.be/")
+
     @property
     def markdown_data(self):
-        shortened_url = self.url.replace("https://www.youtube.com/watch?v=", "https://youtu.be/")
-        return f"video_url: {shortened_url!r}"
+        return f"video_url: {self.short_url!r}"
 
 
 def parse_video_title(url: str, yt_title: str) -> ParsedVideo:
-    title, presenters = yt_title.rsplit(' with ', 1)
+    if " with " in yt_title:
+        title, presenters = yt_title.rsplit(' with ', 1)
+    else:
+        title, presenters = yt_title, ""
     if " and " in presenters:
         presenter1, presenter2 = presenters.rsplit(" and ", 1)
     else:
         presenter1 = presenters
         presenter2 = ""
-    talk_prefix = "-".join(title.lower().split(" ")[:2])
     return ParsedVideo(
         title=title,
         presenter1=presenter1,
         presenter2=presenter2,
-        talk_prefix=talk_prefix,
         url=url,
     )
 
 
-def main() -> None:
-    # Initialize the playlist
-    playlist = Playlist(playlist_url)
+def build_index(repository: ContentRepository) -> matching.TalkIndex:
+    """Index every talk and tutorial by title and presenter names"""
+    return matching.TalkIndex(
+        (
+            session.path,
+            session.schedule.title,
+            [presenter.name for presenter in repository.presenters_for(session)],
+        )
+        for session in repository.talks + repository.tutorials
+    )
+
+
+def main(
+    ctx: typer.Context,
+    playlist_id: str = PLAYLIST_ID,
+    jobs: int = typer.Option(8, "--jobs", "-j", help="Videos fetched at once"),
+    offline: bool = typer.Option(False, help="Only use cached video titles"),
+    refresh: bool = typer.Option(False, help="Ignore cached video titles"),
+    fixture: Path | None = typer.Option(None, help="Read videos from a JSON file"),
+    print_timings: bool = timings.TIMINGS_OPTION,
+    timings_file: Path | None = timings.TIMINGS_FILE_OPTION,
+    profile: bool = timings.PROFILE_OPTION,
+    profile_top: int = timings.PROFILE_TOP_OPTION,
+) -> None:
+    timings.start(ctx, print_timings, timings_file, profile, profile_top)
+    if fixture:
+        # fixture videos mustn't mix with (or end up in) the real cache
+        fetcher, cache = FixtureFetcher(fixture), VideoCache(None)
+    else:
+        fetcher, cache = PytubeFetcher(), VideoCache()
+    with timings.span("fetch"):
+        videos = fetch_videos(
+            PLAYLIST_URL_TEMPLATE.format(playlist_id=playlist_id),
+            fetcher=fetcher,
+            cache=cache,
+            jobs=jobs,
+            offline=offline,
+            refresh=refresh,
+        )
+    repository = ContentRepository()
+    writer = Writer()
+    index = build_index(repository)
+    # the repository was loaded before any patching: talk file → video patched in
+    patched: dict[Path, ParsedVideo] = {}
     with open("missing-talks.csv", "w") as f:
         missing_talks = csv.writer(f)
-        missing_talks.writerow(["title", "presenter1", "presenter2", "url"])
-        for url in playlist.video_urls:
-            video = YouTube(url, use_oauth=True, allow_oauth_cache=True)
-            parsed = parse_video_title(url, video.title)
-            matching_files = [
-                f for f in talks_directory.iterdir()
-                if f.is_file() and f.name.startswith(parsed.talk_prefix)
-            ]
-            if matching_files:
-                # If we have a matching file,
-                # add the video_url to the markdown data
-                with open(matching_files[0], "r") as markdown_file:
-                    lines = markdown_file.readlines()
-                # Find the second occurrence of '---' and insert the video_url
-                for i, line in enumerate(lines):
-                    if i == 0:
-                        continue
-                    if line.strip() == "---":
-                        lines.insert(i - 1, parsed.markdown_data+"\n")
-                        break
-                with open(matching_files[0], "w") as markdown_file:
-                    markdown_file.writelines(lines)
-            else:
-                missing_talks.writerow([
-                    parsed.title,
-                    parsed.presenter1,
-                    parsed.presenter2,
-                    parsed.markdown_data
-                ])
+        missing_talks.writerow(["title", "presenter1", "presenter2", "url", "suggestions"])
+        for url, title in videos:
+            parsed = parse_video_title(url, title)
+            matches = index.search(parsed.title, [parsed.presenter1, parsed.presenter2])
+            match = matching.confident(matches)
+            if match and (earlier := patched.get(match.key)):
+                # two videos for one talk: keep the first, leave this one to a human
+                print(
+                    f"⚠️ {parsed.title!r} also matches {match.key.name}, "
+                    f"which already got {earlier.short_url}"
+                )
+            elif match:
+                session = repository.sessions_by_path[match.key.resolve()]
+                if session.schedule.video_url:
+                    print(f"⏭️ {match.key.name} already has a video_url")
+                    continue
+                print(f"✅ {parsed.title!r} → {match.key.name} ({match.score:.2f})")
+                patching.patch_file(match.key, {"video_url": parsed.short_url}, writer)
+                patched[match.key] = parsed
+                continue
+            missing_talks.writerow([
+                parsed.title,
+                parsed.presenter1,
+                parsed.presenter2,
+                parsed.markdown_data,
+                "; ".join(
+                    f"{suggestion.key.name} ({suggestion.score:.2f})"
+                    for suggestion in matches[:3]
+                ),
+            ])
 
 
 if __name__ == "__main__":
-    main()
+    typer.run(main)